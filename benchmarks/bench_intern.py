@@ -0,0 +1,55 @@
+"""Compare grammar size and build time with and without interning.
+
+The grammar is generated the way large grammars tend to be: many rules,
+each built afresh from the same handful of pieces. Run from the repository
+root::
+
+    python -m benchmarks.bench_intern --rules 2000
+"""
+
+import argparse
+import time
+
+from persimmon.standard import StandardParserFactory
+
+
+def build_grammar(factory, rules):
+    """Build a choice between rules that each read a keyword, an equals
+    sign and a value, with the pieces rebuilt for every rule.
+    """
+    alternatives = []
+    for index in range(rules):
+        ws = factory.make_trivia_parser(' \t')
+        keyword = factory.make_literal_parser('key{}'.format(index % 50))
+        equals = factory.make_elem_parser('=').lexeme(ws)
+        value = (
+            factory.make_integer_parser()
+            | factory.make_one_of_parser('abcdef').one_or_more
+        ).labeled('value')
+        alternatives.append(keyword.lexeme(ws) & equals & value.lexeme(ws))
+    return factory.make_choice_parser(alternatives)
+
+
+def measure(intern, rules):
+    """Return the node count and build time of one generated grammar."""
+    factory = StandardParserFactory(intern=intern)
+    start = time.perf_counter()
+    grammar = build_grammar(factory, rules)
+    elapsed = time.perf_counter() - start
+    return sum(1 for _ in grammar.walk()), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rules', type=int, default=2000)
+    args = parser.parse_args()
+
+    for name, intern in [('plain', False), ('interned', True)]:
+        nodes, elapsed = measure(intern, args.rules)
+        print('{:>9}: {:>8} nodes {:>8.1f} ms to build'.format(
+            name, nodes, elapsed * 1000
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark persimmon.json against the standard library json module.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_json --sizes 1K 1M 100M
+"""
+
+import argparse
+import json
+import random
+import time
+
+from persimmon import json as persimmon_json
+
+
+_UNITS = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+
+
+def parse_size(text):
+    """Convert a size such as 1K or 100M into a number of bytes.
+
+    >>> parse_size('1K')
+    1024
+    >>> parse_size('512')
+    512
+    """
+    unit = _UNITS.get(text[-1].upper())
+    if unit is None:
+        return int(text)
+    return int(text[:-1]) * unit
+
+
+def make_record(rng, index):
+    """Create a record resembling a typical API response item."""
+    return {
+        'id': index,
+        'guid': '{:032x}'.format(rng.getrandbits(128)),
+        'active': rng.random() < 0.5,
+        'balance': round(rng.uniform(-1e4, 1e4), 2),
+        'score': rng.random() * 10 ** rng.randint(-5, 5),
+        'name': rng.choice(['Ada', 'Grace', 'Zoë', 'Jürgen', '李雷']),
+        'about': 'Line one\nline "two"\ttabbed \\ slashed',
+        'tags': [rng.choice('abcdefgh') * rng.randint(1, 8)
+                 for _ in range(rng.randint(0, 6))],
+        'address': {
+            'street': '{} Main St'.format(rng.randint(1, 9999)),
+            'zip': '{:05d}'.format(rng.randint(0, 99999)),
+            'geo': [rng.uniform(-90, 90), rng.uniform(-180, 180)],
+        },
+        'manager': None,
+    }
+
+
+def make_payload(size, seed=0):
+    """Create a JSON array of records that is at least size bytes long."""
+    rng = random.Random(seed)
+    records = []
+    length = 2
+    while length < size:
+        text = json.dumps(make_record(rng, len(records)), indent=1)
+        records.append(text)
+        length += len(text) + 2
+    return '[\n' + ',\n'.join(records) + '\n]'
+
+
+def best_time(func, data, repeat):
+    """Return the fastest of several timed runs of func(data)."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['1K', '64K', '1M'])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print('{:>8} {:>12} {:>12} {:>8}'.format(
+        'size', 'json MB/s', 'persimmon', 'ratio'
+    ))
+    for size_text in args.sizes:
+        payload = make_payload(parse_size(size_text))
+        assert persimmon_json.loads(payload) == json.loads(payload)
+        megabytes = len(payload) / _UNITS['M']
+        repeat = max(1, args.repeat if megabytes < 10 else 1)
+        stdlib = best_time(json.loads, payload, repeat)
+        ours = best_time(persimmon_json.loads, payload, repeat)
+        print('{:>8} {:>12.1f} {:>12.1f} {:>7.1f}x'.format(
+            size_text, megabytes / stdlib, megabytes / ours, ours / stdlib
+        ))
+
+
+if __name__ == '__main__':
+    main()
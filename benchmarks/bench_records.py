@@ -0,0 +1,74 @@
+"""Benchmark a choice-heavy grammar over many short records.
+
+Every record ends in a choice between several alternatives, so most
+alternatives probe the next element and fail, and the final record probes
+the end of input. Run from the repository root::
+
+    python -m benchmarks.bench_records --records 100000
+"""
+
+import argparse
+import random
+import time
+
+from persimmon import eof, integer, none_of, string
+
+
+key = none_of('=;\n').one_or_more.map(''.join)
+value = (
+    integer
+    | string('true').always(True)
+    | string('false').always(False)
+    | string('null').always(None)
+    | none_of(';\n').zero_or_more.map(''.join)
+)
+record = (key & string('=').noisy & value & string(';').noisy).map(
+    lambda k, v: (k, v)
+)
+line = record.zero_or_more.map(dict) & string('\n').noisy
+document = line.zero_or_more & eof
+
+
+def make_records(count, seed=0):
+    """Create count lines of short key=value records."""
+    rng = random.Random(seed)
+    values = ['1', '-20', 'true', 'false', 'null', 'text', '']
+    lines = []
+    for index in range(count):
+        fields = rng.randint(1, 4)
+        lines.append(''.join(
+            'k{}={};'.format(field, rng.choice(values))
+            for field in range(fields)
+        ))
+    return '\n'.join(lines) + '\n'
+
+
+def time_parse(source_factory, repeat):
+    """Return the fastest of several timed parses of a fresh source."""
+    best = None
+    for _ in range(repeat):
+        source = source_factory()
+        start = time.perf_counter()
+        document.parse(source)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    data = make_records(args.records)
+    for name, factory in [('static', lambda: data),
+                          ('stream', lambda: iter(data))]:
+        elapsed = time_parse(factory, args.repeat)
+        print('{:>8}: {:>10.0f} records/s {:>10.0f} chars/s'.format(
+            name, args.records / elapsed, len(data) / elapsed
+        ))
+
+
+if __name__ == '__main__':
+    main()
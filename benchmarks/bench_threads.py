@@ -0,0 +1,58 @@
+"""Measure how parse throughput scales with threads sharing one grammar.
+
+Every benchmark grammar parses the same batch of inputs with
+parse_concurrent on 1, 2, 4, ... threads, and the speedup over one thread is
+reported. Parsing is pure Python, so threads only run in parallel on a
+free-threaded CPython build (3.13t or later); with the GIL the speedup stays
+near 1. Run from the repository root::
+
+    python -m benchmarks.bench_threads --threads 8 --inputs 64 --size 100K
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from benchmarks.bench_json import parse_size
+from benchmarks.grammars import GRAMMARS
+
+
+def throughput(parser, inputs, threads):
+    """Return the characters parsed per second on a number of threads."""
+    start = time.perf_counter()
+    parser.parse_concurrent(inputs, threads=threads)
+    elapsed = time.perf_counter() - start
+    return sum(len(data) for data in inputs) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=os.cpu_count())
+    parser.add_argument('--inputs', type=int, default=32)
+    parser.add_argument('--size', type=parse_size, default=parse_size('20K'))
+    args = parser.parse_args()
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('GIL {}, {} CPUs'.format('enabled' if gil else 'disabled',
+                                   os.cpu_count()))
+    counts = [1]
+    while counts[-1] * 2 <= args.threads:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != args.threads:
+        counts.append(args.threads)
+
+    for grammar in GRAMMARS:
+        inputs = [grammar.generate(args.size, seed)
+                  for seed in range(args.inputs)]
+        base = None
+        for threads in counts:
+            rate = throughput(grammar.parser, inputs, threads)
+            base = base or rate
+            print('{:>10} {:>3} threads: {:>12,.0f} chars/s {:>5.2f}x'.format(
+                grammar.name, threads, rate, rate / base
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""Representative grammars for the benchmark suite, each with a generator of
+input of roughly a given size.
+"""
+
+import collections
+import operator
+import random
+import string as string_module
+
+from persimmon import (
+    delayed, eof, integer, none_of, one_of, string, trivia
+)
+from persimmon import json as persimmon_json
+
+from benchmarks.bench_json import make_payload
+
+
+Grammar = collections.namedtuple('Grammar', ['name', 'parser', 'generate'])
+Grammar.__doc__ = """A benchmark grammar and a function from a size in
+characters and a seed to input for it.
+"""
+
+
+def _fill(size, seed, make_line):
+    """Join lines from make_line(rng) until they reach size characters."""
+    rng = random.Random(seed)
+    lines = []
+    length = 0
+    while length < size:
+        line = make_line(rng)
+        lines.append(line)
+        length += len(line)
+    return ''.join(lines)
+
+
+# The CSV grammar from the README.
+_comma = string(',')
+_cell = none_of(',\n').zero_or_more.map(''.join)
+_row = _cell.zero_or_more_sep_by(_comma)
+csv = (_row & string('\n').noisy).zero_or_more & eof
+
+
+def make_csv(size, seed=0):
+    """Create CSV rows of short cells, some of them empty.
+
+    >>> csv.parse(make_csv(20))[0]
+    ['cq8GFz', '8EwL', 'Gis', 'Wg']
+    """
+    alphabet = string_module.ascii_letters + ' ' + string_module.digits
+
+    def make_line(rng):
+        cells = [
+            ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+            for _ in range(rng.randint(1, 6))
+        ]
+        return ','.join(cells) + '\n'
+    return _fill(size, seed, make_line)
+
+
+# Arithmetic over integers with the usual precedence, one expression a line.
+_OPERATORS = {
+    '+': operator.add, '-': operator.sub,
+    '*': operator.mul, '/': operator.floordiv,
+}
+_ws = trivia(' \t')
+
+
+def _apply(first, rest):
+    value = first
+    for op, operand in rest:
+        value = _OPERATORS[op](value, operand)
+    return value
+
+
+def _binary(operand, operators):
+    op = one_of(operators).lexeme(_ws)
+    pair = (op & operand).map(lambda o, v: (o, v))
+    return (operand & pair.zero_or_more).map(_apply)
+
+
+_expression = delayed(lambda self: _binary(_binary(
+    integer.lexeme(_ws) | (
+        string('(').lexeme(_ws).noisy & self & string(')').lexeme(_ws).noisy
+    ),
+    '*/'
+), '+-'))
+arithmetic = (_ws & _expression & string('\n').noisy).zero_or_more & eof
+
+
+def make_arithmetic(size, seed=0):
+    """Create lines of nested arithmetic expressions.
+
+    >>> arithmetic.parse(make_arithmetic(10))[0]
+    -150294
+    """
+    def make_expression(rng, depth):
+        if depth == 0 or rng.random() < 0.3:
+            return str(rng.randint(1, 99))
+        terms = [make_expression(rng, depth - 1)
+                 for _ in range(rng.randint(2, 4))]
+        text = terms[0]
+        for term in terms[1:]:
+            text += ' {} {}'.format(rng.choice('+-*'), term)
+        return '(' + text + ')' if rng.random() < 0.5 else text
+
+    return _fill(size, seed, lambda rng: make_expression(rng, 3) + '\n')
+
+
+json = persimmon_json.document
+
+
+def make_json(size, seed=0):
+    """Create a JSON array of records resembling API responses."""
+    return make_payload(size, seed)
+
+
+# A keyword-heavy configuration language: statements end in semicolons and
+# sections nest in braces.
+_cws = trivia(' \t\n', line_comment='#')
+_name = none_of(' \t\n;{}=#"').one_or_more.map(''.join).lexeme(_cws)
+_quoted = (
+    string('"').noisy & none_of('"\n').zero_or_more.map(''.join) &
+    string('"').noisy
+).lexeme(_cws)
+
+
+def _keyword(word):
+    return string(word).lexeme(_cws).noisy
+
+
+_semi = string(';').lexeme(_cws).noisy
+_statement = delayed(lambda self: (
+    (_keyword('set') & _name & string('=').lexeme(_cws).noisy &
+     (integer.lexeme(_cws) | _quoted | _name) & _semi)
+    .map(lambda k, v: ('set', k, v))
+    | (_keyword('include') & _quoted & _semi).map(lambda f: ('include', f))
+    | (_keyword('enable') & _name & _semi).map(lambda f: ('enable', f))
+    | (_keyword('disable') & _name & _semi).map(lambda f: ('disable', f))
+    | (_keyword('timeout') & integer.lexeme(_cws) & _semi)
+    .map(lambda t: ('timeout', t))
+    | (_keyword('section') & _name & string('{').lexeme(_cws).noisy &
+       self.zero_or_more & string('}').lexeme(_cws).noisy)
+    .map(lambda n, body: ('section', n, body))
+))
+config = _cws & _statement.zero_or_more & eof
+
+
+def make_config(size, seed=0):
+    """Create configuration statements, some of them in sections.
+
+    >>> config.parse(make_config(10))
+    [('disable', 'opt776')]
+    """
+    def make_statement(rng, depth):
+        kind = rng.randrange(6 if depth < 2 else 5)
+        name = 'opt{}'.format(rng.randint(0, 999))
+        if kind == 0:
+            return 'set {} = {};\n'.format(name, rng.choice(
+                [str(rng.randint(0, 10 ** 6)), '"some text"', 'word']
+            ))
+        if kind == 1:
+            return 'include "conf.d/{}.conf";\n'.format(name)
+        if kind == 2:
+            return 'enable {}; # on\n'.format(name)
+        if kind == 3:
+            return 'disable {};\n'.format(name)
+        if kind == 4:
+            return 'timeout {};\n'.format(rng.randint(1, 3600))
+        body = ''.join(make_statement(rng, depth + 1)
+                       for _ in range(rng.randint(0, 4)))
+        return 'section {} {{\n{}}}\n'.format(name, body)
+
+    return _fill(size, seed, lambda rng: make_statement(rng, 0))
+
+
+# Lines of integers and key:value pairs, where telling the two apart takes
+# backtracking. Every line and every pair holds a rewind point, so this
+# exercises the stream iterator's buffer trimming.
+_pair = (integer & string(':').noisy & integer).map(lambda k, v: (k, v))
+_entry = _pair.attempt | integer
+_entries = _entry.zero_or_more_sep_by(string(','))
+pairs = (_entries & string('\n').noisy).attempt.zero_or_more & eof
+
+
+def make_pairs(size, seed=0):
+    """Create lines mixing integers and key:value pairs.
+
+    >>> pairs.parse(make_pairs(10))
+    [[41, 414, 991, 597, (516, 142), 143, (633, 818)]]
+    """
+    def make_line(rng):
+        entries = [
+            rng.choice(['{}:{}', '{}']).format(rng.randint(0, 999),
+                                               rng.randint(0, 999))
+            for _ in range(rng.randint(1, 8))
+        ]
+        return ','.join(entries) + '\n'
+    return _fill(size, seed, make_line)
+
+
+GRAMMARS = [
+    Grammar('csv', csv, make_csv),
+    Grammar('arithmetic', arithmetic, make_arithmetic),
+    Grammar('json', json, make_json),
+    Grammar('config', config, make_config),
+    Grammar('pairs', pairs, make_pairs),
+]
@@ -0,0 +1,131 @@
+"""Run every benchmark grammar over static and streamed input of several
+sizes, and check that parse time grows linearly with input size.
+
+Each run reports characters parsed per second, peak memory traced during
+the parse, and memory blocks still allocated per character once it's done
+(the result plus anything leaked; CPython keeps no running count of all
+allocations). Run from the repository root::
+
+    python -m benchmarks.suite --sizes 1K 1M 100M
+
+The process exits with status 1 if any grammar scales worse than linearly.
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from benchmarks.bench_json import parse_size
+from benchmarks.grammars import GRAMMARS
+
+
+MODES = {
+    'static': lambda data: data,
+    'stream': iter,
+}
+
+
+def time_parse(parser, data, mode, repeat=1):
+    """Return the fastest of several timed parses of data in a mode."""
+    best = None
+    for _ in range(repeat):
+        source = MODES[mode](data)
+        start = time.perf_counter()
+        parser.parse(source)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def measure_memory(parser, data, mode):
+    """Return the peak traced memory in bytes during a parse of data, and
+    the number of memory blocks left allocated by it.
+    """
+    source = MODES[mode](data)
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        value = parser.parse(source)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    gc.collect()
+    retained = sys.getallocatedblocks() - blocks
+    del value
+    return peak, retained
+
+
+def check_scaling(parser, generate, mode, small, large, tolerance=3.0,
+                  repeat=3):
+    """Check that parsing large input takes no more than tolerance times as
+    long per character as parsing small input.
+
+    :return: a (passed, ratio) pair, where ratio is the time per character
+        for large input over that for small input, and passed is whether
+        ratio is within tolerance
+    """
+    small_data = generate(small)
+    large_data = generate(large)
+    small_rate = time_parse(parser, small_data, mode, repeat) / len(small_data)
+    large_rate = time_parse(parser, large_data, mode, repeat) / len(large_data)
+    ratio = large_rate / small_rate
+    return ratio <= tolerance, ratio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['1K', '1M'])
+    parser.add_argument('--grammars', nargs='+',
+                        default=[g.name for g in GRAMMARS])
+    parser.add_argument('--modes', nargs='+', default=list(MODES))
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--memory', action='store_true',
+                        help='also trace memory, which slows parsing down')
+    parser.add_argument('--tolerance', type=float, default=3.0)
+    args = parser.parse_args()
+
+    sizes = sorted(parse_size(size) for size in args.sizes)
+    grammars = [g for g in GRAMMARS if g.name in args.grammars]
+    failed = False
+    print('{:>10} {:>6} {:>10} {:>12} {:>10} {:>12}'.format(
+        'grammar', 'mode', 'size', 'chars/s', 'peak KB', 'blocks/char'
+    ))
+    for grammar in grammars:
+        inputs = {size: grammar.generate(size) for size in sizes}
+        for mode in args.modes:
+            rates = []
+            for size in sizes:
+                data = inputs[size]
+                elapsed = time_parse(grammar.parser, data, mode, args.repeat)
+                rates.append(elapsed / len(data))
+                peak = blocks = ''
+                if args.memory:
+                    peak_bytes, retained = measure_memory(
+                        grammar.parser, data, mode
+                    )
+                    peak = '{:.0f}'.format(peak_bytes / 1024)
+                    blocks = '{:.2f}'.format(retained / len(data))
+                print('{:>10} {:>6} {:>10} {:>12.0f} {:>10} {:>12}'.format(
+                    grammar.name, mode, len(data), len(data) / elapsed,
+                    peak, blocks
+                ))
+            # Small inputs are dominated by fixed costs, so only compare
+            # sizes past the first.
+            if len(rates) > 2:
+                ratio = rates[-1] / rates[1]
+            elif len(rates) == 2:
+                ratio = rates[-1] / rates[0]
+            else:
+                continue
+            if ratio > args.tolerance:
+                failed = True
+                print('{:>10} {:>6} scales badly: {:.1f}x slower per char '
+                      'at the largest size'.format(grammar.name, mode, ratio))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
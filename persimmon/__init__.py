@@ -8,10 +8,17 @@ any_elem = _factory.make_any_elem_parser()
 elem = _factory.make_elem_parser
 one_of = _factory.make_one_of_parser
 none_of = _factory.make_none_of_parser
+kind = _factory.make_kind_parser
 digit = _factory.make_digit_parser()
+integer = _factory.make_integer_parser()
+decimal = _factory.make_decimal_parser()
+float_literal = _factory.make_float_literal_parser()
+hex_integer = _factory.make_hex_integer_parser()
 choice = _factory.make_choice_parser
 chain = _factory.make_chain_parser
 sequence = _factory.make_sequence_parser
 string = _factory.make_string_parser
 eof = _factory.make_eof_parser()
+cut = _factory.make_cut_parser()
 delayed = _factory.make_delayed_parser
+trivia = _factory.make_trivia_parser
@@ -0,0 +1,171 @@
+import collections
+
+from persimmon.parser import Parser
+from persimmon.primitive import LiteralParser
+from persimmon.single import (
+    AttemptParser, LabeledParser, LexemeParser, MapParser, NoisyParser
+)
+
+
+Issue = collections.namedtuple('Issue', ['kind', 'parser', 'message'])
+Issue.__doc__ = """A problem found in a grammar.
+
+The kind is one of 'infinite loop', 'shadowed alternative' or
+'backtracking', and the parser is the node the problem was found at.
+"""
+
+# Wrappers that don't change what their child consumes or when it commits.
+_TRANSPARENT = (MapParser, LabeledParser, NoisyParser, LexemeParser)
+
+
+def _unwrap(parser):
+    while isinstance(parser, _TRANSPARENT):
+        parser = parser.children[0]
+    return parser
+
+
+def _describe(elements):
+    names = []
+    for element in elements:
+        if isinstance(element, Parser):
+            names.append(', '.join(map(str, element.expected)) or
+                         type(element).__name__)
+        else:
+            names.append(repr(element))
+    return ', '.join(sorted(names))
+
+
+class Analysis:
+    """Nullability and FIRST sets for every parser in a grammar, and the
+    issues they point to.
+
+    A parser is nullable if it can succeed without consuming input. Its FIRST
+    set holds the elements it can start by consuming. Elements that can't be
+    known, such as those accepted by an arbitrary predicate, are named by the
+    nearest label above them, or stand for the parser that reads them if
+    there is none.
+    """
+
+    def __init__(self, parser):
+        """Analyze a grammar.
+
+        :param parser: the grammar's top-level parser
+        """
+        self.parsers = list(parser.walk())
+        self._nullable = {}
+        self._first = {}
+        changed = True
+        while changed:
+            changed = False
+            for node in self.parsers:
+                nullable = node.nullable(self)
+                first = frozenset(node.first(self))
+                if (nullable != self.is_nullable(node) or
+                        first != self.first(node)):
+                    self._nullable[node] = nullable
+                    self._first[node] = first
+                    changed = True
+        self.issues = [
+            issue for node in self.parsers for issue in node.check(self)
+        ]
+
+    def is_nullable(self, parser):
+        """Whether a parser can succeed without consuming input.
+
+        :param parser: a parser in the grammar
+        :return: whether the parser is nullable
+        """
+        return self._nullable.get(parser, False)
+
+    def first(self, parser):
+        """The elements a parser can start by consuming.
+
+        :param parser: a parser in the grammar
+        :return: the FIRST set
+        """
+        return self._first.get(parser, frozenset())
+
+    def first_of_chain(self, parsers):
+        """The elements a sequence of parsers can start by consuming.
+
+        :param parsers: the parsers, in the order they're run
+        :return: the FIRST set
+        """
+        first = set()
+        for parser in parsers:
+            first |= self.first(parser)
+            if not self.is_nullable(parser):
+                break
+        return first
+
+    @staticmethod
+    def issue(kind, parser, message):
+        """Create an issue.
+
+        :param kind: the kind of issue
+        :param parser: the parser the issue was found at
+        :param message: a description of the issue
+        :return: the Issue
+        """
+        return Issue(kind, parser, message)
+
+    def check_alternatives(self, choice, alternatives):
+        """Find alternatives of a choice that can never be reached, or that
+        are only reached after backtracking.
+
+        :param choice: the choice parser
+        :param alternatives: its alternatives, in order
+        :return: the issues found
+        """
+        issues = []
+        for later_index, later in enumerate(alternatives):
+            earlier_alternatives = alternatives[:later_index]
+            for earlier_index, earlier in enumerate(earlier_alternatives):
+                issue = self._compare(earlier, later)
+                if issue is not None:
+                    kind, reason = issue
+                    issues.append(self.issue(kind, choice, (
+                        'alternative {} {}alternative {}'
+                    ).format(later_index + 1, reason, earlier_index + 1)))
+                    break
+        return issues
+
+    def _compare(self, earlier, later):
+        inner = _unwrap(earlier)
+        if inner is _unwrap(later):
+            return 'shadowed alternative', 'is the same parser as '
+        if isinstance(inner, LiteralParser):
+            literal = inner.literal
+            other = _unwrap(later)
+            if (isinstance(other, LiteralParser) and len(literal) > 0 and
+                    other.literal[:len(literal)] == literal):
+                return 'shadowed alternative', 'starts with all of '
+            # Literals fail without consuming, so sharing a first element
+            # with one is harmless.
+            return None
+        shared = self.first(earlier) & self.first(later)
+        if not shared:
+            return None
+        names = _describe(shared)
+        if isinstance(inner, AttemptParser):
+            return 'backtracking', (
+                'starting with {} re-reads what fails in '.format(names)
+            )
+        return 'shadowed alternative', (
+            'starting with {} is never tried, as input starting that way '
+            'is consumed by '.format(names)
+        )
+
+
+def analyze(parser):
+    """Analyze a grammar for loops that never end, alternatives that can never
+    be reached and alternatives that cause heavy backtracking.
+
+    :param parser: the grammar's top-level parser
+    :return: an Analysis, whose issues list what was found
+
+    >>> from persimmon import success
+    >>> [issue.kind for issue in analyze(success(1).zero_or_more).issues]
+    ['infinite loop']
+    """
+    return Analysis(parser)
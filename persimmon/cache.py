@@ -0,0 +1,173 @@
+import collections
+import collections.abc
+import copy
+import sys
+import threading
+import types
+
+from persimmon import result, utils
+
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo',
+    ['hits', 'misses', 'entries', 'bytes']
+)
+CacheInfo.__doc__ = """Statistics about a parse cache."""
+
+_RESULT_MODES = ('copy', 'freeze', 'shared')
+
+
+def freeze(value):
+    """Make an immutable version of a parse result.
+
+    Lists become tuples, sets become frozensets and dicts become read-only
+    mappings, all the way down.
+
+    :param value: the value to freeze
+    :return: the frozen value
+
+    >>> freeze([1, {'a': [2]}])
+    (1, mappingproxy({'a': (2,)}))
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    if isinstance(value, dict):
+        return types.MappingProxyType(
+            {k: freeze(v) for k, v in value.items()}
+        )
+    return value
+
+
+class ParseCache:
+    """A least-recently-used cache of parse results, for services that parse
+    the same small inputs over and over.
+
+    Results are keyed by the parser and the input itself, so only hashable
+    sequences (and byte arrays, which are keyed by their contents) are
+    cached; anything else, such as iterators, is parsed every time. Failed
+    parses are cached too, and raise a fresh ParseError on every hit.
+
+    A cache can be shared between threads and between parsers.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=None, results='copy'):
+        """Create a new parse cache.
+
+        :param max_entries: the most results to keep
+        :param max_bytes: the most memory to spend on inputs and results, as
+            measured by sys.getsizeof, or None for no limit
+        :param results: how results are protected from callers; 'copy' hands
+            out a deep copy on every hit, 'freeze' hands out a frozen result
+            (see freeze), and 'shared' hands out the cached value itself
+        """
+        if results not in _RESULT_MODES:
+            raise ValueError('results must be one of {}'.format(
+                ', '.join(_RESULT_MODES)
+            ))
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._results = results
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def parse(self, parser, data, max_steps=None, deadline=None,
+              max_lookback=None):
+        """Parse data, reusing the result of an earlier parse of equal data
+        by the same parser if there is one.
+
+        :param parser: the parser to parse with
+        :param data: the data to parse
+        :param max_steps: the backtracking budget for a parse on a miss
+        :param deadline: the deadline for a parse on a miss
+        :param max_lookback: the lookback limit for a parse of streamed data
+        :return: the parsed value
+        """
+        key = self._key(parser, data)
+        if key is None:
+            return parser.parse(data, max_steps=max_steps, deadline=deadline,
+                                max_lookback=max_lookback)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if entry is not None:
+            return self._output(entry)
+
+        try:
+            value = parser.parse(data, max_steps=max_steps,
+                                 deadline=deadline)
+        except result.ParseError as error:
+            self._store(key, data, (True, str(error)))
+            raise
+        if self._results == 'copy':
+            self._store(key, data, (False, copy.deepcopy(value)))
+            return value
+        if self._results == 'freeze':
+            value = freeze(value)
+        self._store(key, data, (False, value))
+        return value
+
+    def cache_info(self):
+        """Report how well the cache is doing.
+
+        :return: a CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, len(self._entries),
+                             self._bytes)
+
+    def clear(self):
+        """Drop every cached result and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    @staticmethod
+    def _key(parser, data):
+        if isinstance(data, (bytearray, memoryview)):
+            data = bytes(data)
+        elif not isinstance(data, collections.abc.Sequence):
+            # Iterators hash by identity and can only be read once.
+            return None
+        # Equal inputs whose elements differ in type, such as (1,) and
+        # (True,), can parse differently.
+        key = utils.value_key(data)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return parser, key
+
+    def _output(self, entry):
+        failed, value, _ = entry
+        if failed:
+            raise result.ParseError(value)
+        if self._results == 'copy':
+            return copy.deepcopy(value)
+        return value
+
+    def _store(self, key, data, outcome):
+        size = sys.getsizeof(data) + sys.getsizeof(outcome[1])
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = outcome + (size,)
+            self._bytes += size
+            while (len(self._entries) > self._max_entries or
+                   self._max_bytes is not None and
+                   self._bytes > self._max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[2]
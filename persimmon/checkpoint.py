@@ -0,0 +1,101 @@
+"""Resumable parsing of inputs made of a run of top-level items, such as
+append-only logs.
+
+parse_items yields every item with a checkpoint taken just after it. Passing
+a checkpoint back in carries on from where it was taken, whether more data
+has been appended since or the process has restarted in between. Seekable
+file objects are moved straight to the checkpoint, so only data from there
+on is read again.
+"""
+
+import collections
+
+from persimmon.source import FileSource
+from persimmon.utils import END
+
+
+_CHUNK_SIZE = 1 << 16
+
+Checkpoint = collections.namedtuple(
+    'Checkpoint',
+    ['offset', 'position', 'items', 'resume']
+)
+Checkpoint.__doc__ = """A point between two items that parsing can resume
+from.
+
+The offset is the number of elements before the point and the position is
+where the point is in the data. Items counts the items parsed before it. For
+file objects, resume is the (seek cookie, elements to skip) pair that moves a
+file back to the point, and None for other sources. Checkpoints can be
+pickled.
+"""
+
+
+def _open(parser, source, checkpoint):
+    """Create an iterator over a source positioned at a checkpoint, and the
+    FileSource it reads from if the source is a file object.
+    """
+    if hasattr(source, 'read'):
+        chunks = FileSource(source, chunk_size=_CHUNK_SIZE, closefd=False)
+        chunks.track_offsets(checkpoint.offset, checkpoint.resume)
+        iterator = parser.make_rewind_iterator(chunks, checkpoint.position)
+        return iterator, chunks, checkpoint.offset
+    if hasattr(source, '__getitem__'):
+        iterator = parser.make_rewind_iterator(source, checkpoint.position)
+        iterator.index = checkpoint.offset
+        return iterator, None, 0
+    # Other iterables are taken to continue from the checkpoint themselves.
+    iterator = parser.make_rewind_iterator(source, checkpoint.position)
+    return iterator, None, checkpoint.offset
+
+
+def parse_items(parser, source, checkpoint=None, position=None):
+    """Parse a source as a run of items, yielding each item along with a
+    checkpoint just after it.
+
+    Parsing stops quietly at the end of the data, even in the middle of an
+    item, since an unfinished item may be completed by data appended later;
+    resuming from the last checkpoint parses it again. Input that can never
+    be an item raises a ParseError.
+
+    :param parser: the parser for a single item
+    :param source: a sequence, a file object that supports tell and seek, or
+        an iterable that continues from the checkpoint
+    :param checkpoint: the checkpoint to resume from, or None to start at the
+        beginning
+    :param position: the position of the beginning of the data, when not
+        resuming
+    :return: an iterator of (value, checkpoint) pairs
+
+    >>> from persimmon import integer, string
+    >>> line = integer & string('\\n').noisy
+    >>> [value for value, _ in parse_items(line, '1\\n2\\n3')]
+    [1, 2]
+    >>> _, checkpoint = list(parse_items(line, '1\\n2\\n3'))[-1]
+    >>> grown = '1\\n2\\n34\\n'
+    >>> [value for value, _ in parse_items(line, grown, checkpoint)]
+    [34]
+    """
+    if checkpoint is None:
+        checkpoint = Checkpoint(0, position, 0, None)
+    iterator, chunks, base = _open(parser, source, checkpoint)
+    items = checkpoint.items
+    while iterator.peek() is not END:
+        iterator.clear_failures()
+        res = parser.do_parse(iterator)
+        if not res.is_success:
+            if iterator.failure_unexpected is END:
+                return
+            raise iterator.parse_error()
+        if not res.consumed:
+            raise ValueError('Item parser succeeded without reading input')
+        items += 1
+        offset = base + iterator.offset
+        checkpoint = Checkpoint(
+            offset,
+            iterator.position,
+            items,
+            chunks.resume_at(offset) if chunks is not None else None
+        )
+        values = res.values
+        yield values[0] if len(values) == 1 else values, checkpoint
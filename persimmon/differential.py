@@ -0,0 +1,299 @@
+"""Differential testing of parsing engines.
+
+Random grammars are built from the factory primitives and combinators, run
+over random inputs by several engines, and every engine's outcome is
+compared with the first engine's. The outcome of a parse is its values and
+how far it read, or the position of the farthest failure and the set of
+things expected there.
+
+Run from the repository root::
+
+    python -m persimmon.differential --seeds 1000
+    python -m persimmon.differential --seeds 1000 --stress
+
+The stress mode compares static against streamed input over longer data.
+The process exits with status 1 if any engine disagrees.
+"""
+
+import argparse
+import collections
+import random
+import sys
+
+from persimmon.analysis import analyze
+from persimmon.standard import StandardParserFactory
+from persimmon.utils import StaticRewindIterator, StreamRewindIterator
+
+
+ALPHABET = 'ab01 '
+
+Engine = collections.namedtuple(
+    'Engine',
+    ['name', 'make_factory', 'make_iterator', 'run']
+)
+Engine.__doc__ = """A way of running a parser.
+
+make_factory creates the factory the grammar is built with, make_iterator
+turns the factory and the data into a rewind iterator, and run parses from
+the iterator, returning whether the parse succeeded and its values (None if
+the engine doesn't produce values).
+"""
+
+Difference = collections.namedtuple(
+    'Difference',
+    ['seed', 'data', 'engine', 'expected', 'actual']
+)
+Difference.__doc__ = """An input where an engine disagreed with the first
+engine, and the two outcomes.
+"""
+
+
+def _parse(parser, iterator):
+    res = parser.do_parse(iterator)
+    return res.is_success, res.values if res.is_success else None
+
+
+def _match(parser, iterator):
+    matched, _ = parser.do_match(iterator)
+    return matched, None
+
+
+def _default_iterator(factory, data):
+    return factory.make_rewind_iterator(data)
+
+
+ENGINES = [
+    Engine('parse', StandardParserFactory, _default_iterator, _parse),
+    Engine('match', StandardParserFactory, _default_iterator, _match),
+    Engine('static', StandardParserFactory,
+           lambda _, data: StaticRewindIterator(data), _parse),
+    Engine('stream', StandardParserFactory,
+           lambda _, data: StreamRewindIterator(iter(data)), _parse),
+    Engine('interned', lambda: StandardParserFactory(intern=True),
+           _default_iterator, _parse),
+]
+
+STRESS_ENGINES = [
+    engine for engine in ENGINES if engine.name in ('static', 'stream')
+]
+
+
+# Grammars call these by reference so that interning factories can share
+# the nodes that use them.
+def _tag(*values):
+    return ('tag',) + values
+
+
+def _even(*values):
+    return len(repr(values)) % 2 == 0
+
+
+def _count(accum, *values):
+    return accum + 1
+
+
+def _primitive(rng, factory):
+    kind = rng.randrange(8)
+    if kind == 0:
+        return factory.make_elem_parser(rng.choice(ALPHABET))
+    if kind == 1:
+        return factory.make_one_of_parser(''.join(rng.sample(ALPHABET, 2)))
+    if kind == 2:
+        return factory.make_none_of_parser(rng.choice(ALPHABET))
+    if kind == 3:
+        literal = ''.join(rng.choice(ALPHABET)
+                          for _ in range(rng.randint(1, 3)))
+        return factory.make_string_parser(literal)
+    if kind == 4:
+        return factory.make_success_parser(rng.randrange(3))
+    if kind == 5:
+        return factory.make_eof_parser()
+    if kind == 6:
+        return factory.make_any_elem_parser()
+    return factory.make_digit_parser()
+
+
+def _grammar(rng, factory, depth):
+    if depth == 0 or rng.random() < 0.25:
+        return _primitive(rng, factory)
+
+    def child():
+        return _grammar(rng, factory, depth - 1)
+
+    kind = rng.randrange(16)
+    if kind == 0:
+        return factory.make_choice_parser(
+            [child() for _ in range(rng.randint(2, 3))]
+        )
+    if kind == 1:
+        return factory.make_chain_parser(
+            [child() for _ in range(rng.randint(2, 3))]
+        )
+    if kind == 2:
+        return factory.make_attempt_parser(child())
+    if kind == 3:
+        return factory.make_map_parser(child(), _tag)
+    if kind == 4:
+        return factory.make_filter_parser(child(), _even)
+    if kind == 5:
+        min_results = rng.randint(0, 2)
+        max_results = rng.choice([None, min_results + rng.randint(0, 2)])
+        return factory.make_repeat_parser(child(), min_results, max_results)
+    if kind == 6:
+        return factory.make_sep_by_parser(child(), child(), rng.randint(0, 1),
+                                          rng.random() < 0.5)
+    if kind == 7:
+        return factory.make_end_by_parser(child(), child(), rng.randint(0, 1))
+    if kind == 8:
+        return factory.make_delimited_parser(child(), child(), child(),
+                                             child(), rng.random() < 0.5)
+    if kind == 9:
+        sep = child() if rng.random() < 0.5 else None
+        return factory.make_fold_parser(child(), 0, _count, sep)
+    if kind == 10:
+        return factory.make_labeled_parser(
+            child(),
+            'label{}'.format(rng.randrange(3))
+        )
+    if kind == 11:
+        return factory.make_noisy_parser(child(), rng.random() < 0.5)
+    if kind == 12:
+        return factory.make_default_parser(child(), None)
+    if kind == 13:
+        return factory.make_lexeme_parser(
+            child(),
+            factory.make_trivia_parser(' ')
+        )
+    if kind == 14:
+        return factory.make_commit_parser(child())
+    # Recursion guarded by consuming an element first.
+    prefix = factory.make_elem_parser(rng.choice(ALPHABET))
+    base = child()
+    return factory.make_delayed_parser(
+        lambda self: factory.make_choice_parser([
+            factory.make_chain_parser([prefix, self]),
+            base
+        ])
+    )
+
+
+def random_grammar(seed, factory, depth=4):
+    """Build a random grammar, or None if the grammar could loop forever.
+
+    The same seed builds the same grammar from any factory.
+
+    :param seed: the random seed
+    :param factory: the factory to build the grammar with
+    :param depth: the deepest nesting of combinators
+    :return: the grammar
+    """
+    grammar = _grammar(random.Random(seed), factory, depth)
+    if any(i.kind == 'infinite loop' for i in analyze(grammar).issues):
+        return None
+    return grammar
+
+
+def random_inputs(seed, count, max_length):
+    """Build random inputs over ALPHABET.
+
+    :param seed: the random seed
+    :param count: the number of inputs
+    :param max_length: the longest input
+    :return: the inputs
+    """
+    rng = random.Random(seed)
+    return [
+        ''.join(rng.choice(ALPHABET)
+                for _ in range(rng.randint(0, max_length)))
+        for _ in range(count)
+    ]
+
+
+def outcome(engine, factory, parser, data):
+    """Run a parser built by a factory over data with an engine.
+
+    :return: ('success', values, elements read) or ('failure', failure
+        position, expected set), or ('raised', exception) if it raised
+    """
+    iterator = engine.make_iterator(factory, data)
+    try:
+        success, values = engine.run(parser, iterator)
+    except Exception as error:
+        # Anything an engine raises is part of its outcome.
+        return 'raised', repr(error)
+    if success:
+        return 'success', values, iterator.offset
+    position = iterator.failure_position
+    return (
+        'failure',
+        None if position is None else position.value,
+        frozenset(map(str, iterator.failure_expected))
+    )
+
+
+def _comparable(expected, actual):
+    # Engines without values are only compared on the rest of the outcome.
+    if actual[0] == 'success' and actual[1] is None:
+        return expected[:1] + (None,) + expected[2:]
+    return expected
+
+
+def differences(seed, engines=ENGINES, inputs=20, max_length=8):
+    """Compare engines on a random grammar and random inputs.
+
+    :param seed: the seed for the grammar and inputs
+    :param engines: the engines to compare; the first is the reference
+    :param inputs: the number of inputs to try
+    :param max_length: the longest input
+    :return: the differences found
+
+    >>> differences(0)
+    []
+    """
+    factories = [engine.make_factory() for engine in engines]
+    grammars = [random_grammar(seed, factory) for factory in factories]
+    if grammars[0] is None:
+        return []
+    runs = list(zip(engines, factories, grammars))
+    found = []
+    for data in random_inputs(seed, inputs, max_length):
+        reference = outcome(*runs[0], data)
+        for engine, factory, grammar in runs[1:]:
+            actual = outcome(engine, factory, grammar, data)
+            expected = _comparable(reference, actual)
+            if actual != expected:
+                found.append(Difference(seed, data, engine.name, expected,
+                                        actual))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seeds', type=int, default=500)
+    parser.add_argument('--start', type=int, default=0)
+    parser.add_argument('--inputs', type=int, default=20)
+    parser.add_argument('--max-length', type=int, default=8)
+    parser.add_argument('--stress', action='store_true',
+                        help='compare static and streamed input only, over '
+                             'more and longer inputs')
+    args = parser.parse_args()
+
+    engines = ENGINES
+    inputs, max_length = args.inputs, args.max_length
+    if args.stress:
+        engines = STRESS_ENGINES
+        inputs, max_length = inputs * 5, max_length * 5
+    found = []
+    for seed in range(args.start, args.start + args.seeds):
+        found.extend(differences(seed, engines, inputs, max_length))
+    for difference in found:
+        print('seed {} input {!r}: {} gave {}, expected {}'.format(
+            difference.seed, difference.data, difference.engine,
+            difference.actual, difference.expected
+        ))
+    print('{} differences in {} grammars'.format(len(found), args.seeds))
+    return 1 if found else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
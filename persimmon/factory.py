@@ -1,5 +1,29 @@
+import decimal
+import re
+import string
+
+from persimmon import utils
+
+
+_DIGITS = string.digits
+_DIGIT_RUN = r'[0-9](?:_?[0-9])*'
+_INTEGER = re.compile(r'[+-]?' + _DIGIT_RUN)
+_DECIMAL = re.compile(r'[+-]?{0}(?:\.{0})?'.format(_DIGIT_RUN))
+_FLOAT = re.compile(
+    r'[+-]?(?:{0}(?:\.(?:{0})?)?|\.{0})(?:[eE][+-]?{0})?'.format(_DIGIT_RUN)
+)
+_HEX_INTEGER = re.compile(r'[+-]?0[xX]_?[0-9a-fA-F](?:_?[0-9a-fA-F])*')
+
+
+def _char_class(els, negated):
+    # Strings and bytes can be matched a run at a time.
+    if isinstance(els, (str, bytes)):
+        return utils.CharClass(els, negated)
+    return None
+
+
 class ParserFactory:
-    def make_rewind_iterator(self, data):
+    def make_rewind_iterator(self, data, position=None):
         raise NotImplementedError
 
     def make_success_parser(self, value):
@@ -22,12 +46,21 @@ class ParserFactory:
     def make_one_of_parser(self, els):
         return (
             self.make_satisfy_parser()
-            .filter(lambda e: e in els)
+            .filter(_char_class(els, False) or (lambda e: e in els))
             .labeled(els)
         )
 
     def make_none_of_parser(self, els):
-        return self.make_satisfy_parser().filter(lambda e: e not in els)
+        return self.make_satisfy_parser().filter(
+            _char_class(els, True) or (lambda e: e not in els)
+        )
+
+    def make_kind_parser(self, kind):
+        return (
+            self.make_satisfy_parser()
+                .filter(lambda token: token.kind == kind)
+                .labeled(kind)
+        )
 
     def make_digit_parser(self):
         return (
@@ -37,6 +70,45 @@ class ParserFactory:
                 .labeled('digit')
         )
 
+    def make_token_parser(self, pattern, charset, convert, label):
+        raise NotImplementedError
+
+    def make_integer_parser(self):
+        return self.make_token_parser(
+            _INTEGER,
+            _DIGITS + '+-_',
+            int,
+            'integer'
+        )
+
+    def make_decimal_parser(self):
+        return self.make_token_parser(
+            _DECIMAL,
+            _DIGITS + '+-_.',
+            decimal.Decimal,
+            'decimal'
+        )
+
+    def make_float_literal_parser(self):
+        return self.make_token_parser(
+            _FLOAT,
+            _DIGITS + '+-_.eE',
+            float,
+            'float'
+        )
+
+    def make_hex_integer_parser(self):
+        return self.make_token_parser(
+            _HEX_INTEGER,
+            string.hexdigits + '+-_xX',
+            lambda token: int(token, 16),
+            'hex integer'
+        )
+
+    def make_trivia_parser(self, whitespace=' \t\r\n', line_comment=None,
+                           block_comment=None):
+        raise NotImplementedError
+
     def make_choice_parser(self, parsers):
         raise NotImplementedError
 
@@ -46,8 +118,11 @@ class ParserFactory:
     def make_sequence_parser(self, seq):
         raise NotImplementedError
 
+    def make_literal_parser(self, literal):
+        raise NotImplementedError
+
     def make_string_parser(self, string):
-        return self.make_sequence_parser(string).map(''.join)
+        return self.make_literal_parser(string)
 
     def make_default_parser(self, parser, value):
         return parser | self.make_success_parser(value)
@@ -58,6 +133,12 @@ class ParserFactory:
     def make_attempt_parser(self, parser):
         raise NotImplementedError
 
+    def make_cut_parser(self):
+        raise NotImplementedError
+
+    def make_commit_parser(self, parser):
+        return self.combine_chain(parser, self.make_cut_parser())
+
     def make_map_parser(self, parser, func):
         raise NotImplementedError
 
@@ -76,6 +157,21 @@ class ParserFactory:
     def make_repeat_parser(self, parser, min_results=0, max_results=None):
         raise NotImplementedError
 
+    def make_sep_by_parser(self, parser, sep, min_results=0, trailing=False):
+        raise NotImplementedError
+
+    def make_end_by_parser(self, parser, sep, min_results=0):
+        raise NotImplementedError
+
+    def make_delimited_parser(self, parser, left, sep, right, trailing=False):
+        raise NotImplementedError
+
+    def make_fold_parser(self, parser, initial, func, sep=None):
+        raise NotImplementedError
+
+    def make_lexeme_parser(self, parser, trivia):
+        raise NotImplementedError
+
     def make_labeled_parser(self, parser, label):
         raise NotImplementedError
 
@@ -0,0 +1,407 @@
+"""JSON (RFC 8259) parsing built on persimmon.
+
+The value parser reads whole tokens at a time through the rewind iterator,
+so on static string input strings, numbers and whitespace are each scanned
+with a single regular expression. Nesting is handled with an explicit stack
+instead of recursion, and objects and arrays are filled in place as their
+members are parsed.
+
+For documents too large to hold in memory, events and items parse the same
+grammar incrementally from a stream.
+"""
+
+import codecs
+import functools
+import itertools
+import re
+import string as _string
+
+from persimmon import _factory, eof, result
+from persimmon.parser import Parser
+from persimmon.source import FileSource
+from persimmon.utils import END, Trivia
+
+
+class _Excluding:
+    """Character set of everything except some characters and the control
+    characters.
+    """
+
+    def __init__(self, chars):
+        self._chars = chars
+
+    def __contains__(self, value):
+        return value >= ' ' and value not in self._chars
+
+
+_WHITESPACE = Trivia(' \t\n\r')
+_NUMBER = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?')
+_NUMBER_CHARS = _string.digits + '+-.eE'
+_LITERAL = re.compile('true|false|null')
+_LITERAL_CHARS = 'truefalsn'
+_LITERALS = {'true': True, 'false': False, 'null': None}
+_STRING_RUN = re.compile(r'[^"\\\x00-\x1f]+')
+_STRING_RUN_CHARS = _Excluding('"\\')
+_HEX = re.compile('[0-9a-fA-F]{4}')
+_LOW_SURROGATE = re.compile(r'\\u[dD][c-fC-F][0-9a-fA-F]{2}')
+_SURROGATE_CHARS = '\\u' + _string.hexdigits
+_ESCAPES = {
+    '"': '"', '\\': '\\', '/': '/', 'b': '\b',
+    'f': '\f', 'n': '\n', 'r': '\r', 't': '\t',
+}
+
+
+class _JsonError(Exception):
+    def __init__(self, expected):
+        super().__init__(expected)
+        self.expected = expected
+
+
+class _Expectation:
+    """Stands in for a parser when recording a failure, expecting a single
+    thing.
+    """
+
+    def __init__(self, label):
+        self.expected = [label]
+
+    def unexpected_at(self, iterator):
+        return iterator.peek()
+
+
+@functools.lru_cache(maxsize=None)
+def _expectation(label):
+    return _Expectation(label)
+
+
+def _match(iterator, char):
+    return iterator.match_sequence(char)
+
+
+def _match_one_of(iterator, chars):
+    # Punctuation is a single character, so peeking is enough; matching it as
+    # a token would read ahead through a whole run of brackets each time.
+    char = iterator.peek()
+    if char is END or char not in chars:
+        return None
+    iterator.advance()
+    return char
+
+
+def _read_key(iterator):
+    if not _match(iterator, '"'):
+        raise _JsonError('string')
+    key = _read_string(iterator)
+    iterator.skip_trivia(_WHITESPACE)
+    if not _match(iterator, ':'):
+        raise _JsonError('":"')
+    return key
+
+
+def _read_number(iterator):
+    number = iterator.match_token(_NUMBER, _NUMBER_CHARS)
+    if number is None:
+        return None
+    if '.' in number or 'e' in number or 'E' in number:
+        return float(number)
+    return int(number)
+
+
+def _read_literal(iterator):
+    literal = iterator.match_token(_LITERAL, _LITERAL_CHARS)
+    if literal is None:
+        raise _JsonError('JSON value')
+    return _LITERALS[literal]
+
+
+def _read_string(iterator):
+    run = iterator.match_token(_STRING_RUN, _STRING_RUN_CHARS)
+    if _match(iterator, '"'):
+        return run if run is not None else ''
+    parts = [] if run is None else [run]
+    while _match(iterator, '\\'):
+        parts.append(_read_escape(iterator))
+        run = iterator.match_token(_STRING_RUN, _STRING_RUN_CHARS)
+        if run is not None:
+            parts.append(run)
+        if _match(iterator, '"'):
+            return ''.join(parts)
+    raise _JsonError('"\\""')
+
+
+def _read_escape(iterator):
+    char = iterator.peek()
+    if char in _ESCAPES:
+        iterator.advance()
+        return _ESCAPES[char]
+    if char != 'u':
+        raise _JsonError('escape sequence')
+    iterator.advance()
+    digits = iterator.match_token(_HEX, _string.hexdigits)
+    if digits is None:
+        raise _JsonError('4 hex digits')
+    code = int(digits, 16)
+    if 0xd800 <= code <= 0xdbff:
+        low = iterator.match_token(_LOW_SURROGATE, _SURROGATE_CHARS)
+        if low is not None:
+            low = int(low[2:], 16)
+            return chr(0x10000 + ((code - 0xd800) << 10) + (low - 0xdc00))
+    return chr(code)
+
+
+def _read_after(iterator, in_object):
+    """Read the separator or closing bracket that follows a member or
+    element, returning the separator or closing bracket read.
+    """
+    iterator.skip_trivia(_WHITESPACE)
+    if in_object:
+        sep = _match_one_of(iterator, ',}')
+        if sep is None:
+            raise _JsonError('"," or "}"')
+    else:
+        sep = _match_one_of(iterator, ',]')
+        if sep is None:
+            raise _JsonError('"," or "]"')
+    return sep
+
+
+class JsonValueParser(Parser):
+    def __init__(self, parser_factory):
+        super().__init__(parser_factory, False)
+
+    def do_parse(self, iterator):
+        start = iterator.offset
+        try:
+            value = self._read_value(iterator)
+        except _JsonError as error:
+            iterator.record_failure(_expectation(error.expected))
+            return result.Failure(iterator.offset != start)
+        return self._parse_success([value], consumed=True)
+
+    @property
+    def expected(self):
+        return ['JSON value']
+
+    @staticmethod
+    def _read_value(iterator):
+        # Each stack entry is a [container, key] pair; key is None for arrays.
+        stack = []
+        while True:
+            iterator.skip_trivia(_WHITESPACE)
+            start = _match_one_of(iterator, '{["')
+            if start == '{':
+                iterator.skip_trivia(_WHITESPACE)
+                if _match(iterator, '}'):
+                    value = {}
+                else:
+                    stack.append([{}, _read_key(iterator)])
+                    continue
+            elif start == '[':
+                iterator.skip_trivia(_WHITESPACE)
+                if _match(iterator, ']'):
+                    value = []
+                else:
+                    stack.append([[], None])
+                    continue
+            elif start == '"':
+                value = _read_string(iterator)
+            else:
+                value = _read_number(iterator)
+                if value is None:
+                    value = _read_literal(iterator)
+
+            while stack:
+                container, key = entry = stack[-1]
+                if key is None:
+                    container.append(value)
+                else:
+                    container[key] = value
+                if _read_after(iterator, key is not None) == ',':
+                    if key is not None:
+                        iterator.skip_trivia(_WHITESPACE)
+                        entry[1] = _read_key(iterator)
+                    break
+                value = container
+                stack.pop()
+            else:
+                return value
+
+
+value = JsonValueParser(_factory)
+document = value & _factory.make_trivia_parser(' \t\n\r') & eof
+
+
+def _as_text(source):
+    """Decode JSON given as bytes or read from a binary file as UTF-8, as the
+    standard library's json does for bytes.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source).decode('utf-8')
+    if isinstance(source, FileSource):
+        chunks = source.chunks()
+    elif hasattr(source, 'read'):
+        chunks = FileSource(source, closefd=False).chunks()
+    else:
+        return source
+    return itertools.chain.from_iterable(_decode_chunks(chunks))
+
+
+def _decode_chunks(chunks):
+    """Decode any bytes chunks incrementally, so that characters split
+    across chunks come out whole.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in chunks:
+        yield chunk if isinstance(chunk, str) else decoder.decode(chunk)
+    yield decoder.decode(b'', final=True)
+
+
+def loads(data):
+    """Parse a complete JSON document.
+
+    :param data: the JSON text, as a str or UTF-8 bytes, or any iterable of
+        its characters
+    :return: the parsed value
+
+    >>> loads('{"a": [1, 2.5, "\\\\u00e9"], "b": null}')
+    {'a': [1, 2.5, 'é'], 'b': None}
+    """
+    return document.parse(_as_text(data))
+
+
+def events(source):
+    """Lazily parse a JSON document into a flat sequence of events.
+
+    Events are (event, value) pairs. The events are start_map, map_key,
+    end_map, start_array, end_array, string, number, boolean and null; only
+    map_key and the scalar events carry a value. Only the current token is
+    kept in memory, so arbitrarily large documents can be read from a stream.
+
+    :param source: the JSON text, as a str or UTF-8 bytes, an iterable of
+        its characters, or a file object, decoded as UTF-8 if binary
+    :return: an iterator of events
+
+    >>> list(events('{"a": [1, true]}'))  # doctest: +NORMALIZE_WHITESPACE
+    [('start_map', None), ('map_key', 'a'), ('start_array', None),
+     ('number', 1), ('boolean', True), ('end_array', None), ('end_map', None)]
+    """
+    iterator = _factory.make_rewind_iterator(_as_text(source))
+    # Each entry is True for an object and False for an array.
+    stack = []
+    try:
+        while True:
+            iterator.skip_trivia(_WHITESPACE)
+            start = _match_one_of(iterator, '{["')
+            if start == '{':
+                yield 'start_map', None
+                iterator.skip_trivia(_WHITESPACE)
+                if not _match(iterator, '}'):
+                    stack.append(True)
+                    yield 'map_key', _read_key(iterator)
+                    continue
+                yield 'end_map', None
+            elif start == '[':
+                yield 'start_array', None
+                iterator.skip_trivia(_WHITESPACE)
+                if not _match(iterator, ']'):
+                    stack.append(False)
+                    continue
+                yield 'end_array', None
+            elif start == '"':
+                yield 'string', _read_string(iterator)
+            else:
+                number = _read_number(iterator)
+                if number is not None:
+                    yield 'number', number
+                else:
+                    literal = _read_literal(iterator)
+                    yield 'null' if literal is None else 'boolean', literal
+
+            while stack:
+                in_object = stack[-1]
+                if _read_after(iterator, in_object) == ',':
+                    if in_object:
+                        iterator.skip_trivia(_WHITESPACE)
+                        yield 'map_key', _read_key(iterator)
+                    break
+                stack.pop()
+                yield 'end_map' if in_object else 'end_array', None
+            else:
+                break
+        iterator.skip_trivia(_WHITESPACE)
+        if iterator.peek() is not END:
+            raise _JsonError('end of file')
+    except _JsonError as error:
+        iterator.record_failure(_expectation(error.expected))
+        raise iterator.parse_error()
+
+
+def _prefixed(event_iter):
+    """Annotate events with the dotted path of the value they belong to, using
+    item for array elements.
+    """
+    path = []
+    for event, value in event_iter:
+        if event == 'map_key':
+            path[-1] = value
+            yield '.'.join(path[:-1]), event, value
+        elif event == 'start_map' or event == 'start_array':
+            yield '.'.join(path), event, value
+            path.append(None if event == 'start_map' else 'item')
+        elif event == 'end_map' or event == 'end_array':
+            path.pop()
+            yield '.'.join(path), event, value
+        else:
+            yield '.'.join(path), event, value
+
+
+def _build(event, prefixed):
+    """Build the container started by event from the following events."""
+    root = {} if event == 'start_map' else []
+    # Each stack entry is a [container, key] pair; key is None for arrays.
+    stack = [[root, None]]
+    for _, event, value in prefixed:
+        if event == 'map_key':
+            stack[-1][1] = value
+            continue
+        if event == 'end_map' or event == 'end_array':
+            stack.pop()
+            if not stack:
+                return root
+            continue
+        if event == 'start_map':
+            value = {}
+        elif event == 'start_array':
+            value = []
+        container, key = stack[-1]
+        if key is None:
+            container.append(value)
+        else:
+            container[key] = value
+        if event == 'start_map' or event == 'start_array':
+            stack.append([value, None])
+
+
+def items(source, prefix):
+    """Lazily yield the complete values found at a path in a JSON document.
+
+    Paths are dotted object keys, with item standing for every element of an
+    array, so the records of a top-level array are at item. Only one value is
+    held in memory at a time.
+
+    :param source: the JSON text, as a str or UTF-8 bytes, an iterable of
+        its characters, or a file object, decoded as UTF-8 if binary
+    :param prefix: the path of the values to yield
+    :return: an iterator of values
+
+    >>> list(items('{"rows": [{"a": 1}, {"a": 2}]}', 'rows.item.a'))
+    [1, 2]
+    """
+    prefixed = _prefixed(events(source))
+    for path, event, value in prefixed:
+        if path != prefix or event == 'map_key':
+            continue
+        if event == 'start_map' or event == 'start_array':
+            yield _build(event, prefixed)
+        elif event != 'end_map' and event != 'end_array':
+            yield value
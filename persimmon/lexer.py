@@ -0,0 +1,128 @@
+import collections
+import re
+
+from persimmon import result
+
+
+Token = collections.namedtuple('Token', ['kind', 'text', 'start', 'end'])
+Token.__doc__ = """A single token produced by a lexer.
+
+Tokens remember their kind, the text they matched, and the slice of the
+source data the text came from.
+"""
+
+
+def literal(text):
+    """Create a token pattern matching a literal string.
+
+    :param text: the literal to match
+    :return: the pattern
+
+    >>> literal('+=')
+    '\\\\+='
+    """
+    return re.escape(text)
+
+
+def char_class(chars):
+    """Create a token pattern matching a run of one or more characters taken
+    from a set.
+
+    :param chars: the characters that can be in the run
+    :return: the pattern
+
+    >>> char_class(' \\t')
+    '[\\\\ \\\\\\t]+'
+    """
+    return '[{}]+'.format(''.join(re.escape(c) for c in chars))
+
+
+class Lexer:
+    """Splits data into tokens in a single linear pass, so that parsers can
+    work over a short sequence of tokens instead of individual characters.
+
+    At each point the rule with the longest match wins, so that a keyword
+    rule doesn't split an identifier that starts with the keyword. Among rules
+    matching the same length the one given first wins, so keywords should
+    come before any rule that would also match them.
+    """
+
+    def __init__(self, rules, skip=()):
+        """Create a new lexer.
+
+        :param rules: a sequence of (kind, pattern) pairs, where each pattern
+            is a regular expression
+        :param skip: the kinds of token to drop from the output, such as
+            whitespace and comments
+        """
+        self._skip = frozenset(skip)
+        self._kinds = []
+        groups = []
+        for kind, pattern in rules:
+            compiled = re.compile(pattern)
+            if compiled.match(''):
+                raise ValueError(
+                    'pattern for {} matches the empty string'.format(kind)
+                )
+            self._kinds.append(kind)
+            groups.append(('({})'.format(pattern), compiled.groups + 1))
+        # Each rule gets one combined pattern of itself and the rules after
+        # it, so one call finds the first rule that matches and the next
+        # only has to try the rules after that one.
+        self._matchers = []
+        for first in range(len(groups)):
+            rules_at = {}
+            index = 1
+            for rule in range(first, len(groups)):
+                rules_at[index] = rule
+                index += groups[rule][1]
+            pattern = '|'.join(group for group, _ in groups[first:])
+            self._matchers.append((re.compile(pattern).match, rules_at))
+
+    def tokenize(self, data):
+        """Split data into a list of tokens.
+
+        Raises a ParseError if some part of the data doesn't match any rule.
+
+        :param data: the string to split
+        :return: the tokens, excluding any skipped kinds
+
+        >>> lexer = Lexer([('num', '[0-9]+'), ('ws', ' +')], skip=['ws'])
+        >>> [token.text for token in lexer.tokenize('1 23')]
+        ['1', '23']
+        """
+        return list(self.iter_tokens(data))
+
+    def iter_tokens(self, data):
+        """Lazily split data into tokens.
+
+        :param data: the string to split
+        :return: an iterator of tokens, excluding any skipped kinds
+        """
+        matchers = self._matchers
+        kinds = self._kinds
+        count = len(matchers)
+        skip = self._skip
+        pos = 0
+        end = len(data)
+        while pos < end:
+            kind = None
+            token_end = pos
+            rule = 0
+            while rule < count:
+                match, rules_at = matchers[rule]
+                m = match(data, pos)
+                if m is None:
+                    break
+                rule = rules_at[m.lastindex]
+                if m.end() > token_end:
+                    kind = kinds[rule]
+                    token_end = m.end()
+                rule += 1
+            if kind is None:
+                raise result.ParseError(
+                    'Unexpected "{}" at {}'.format(data[pos], pos)
+                )
+            if kind not in skip:
+                yield Token(kind, data[pos:token_end], pos, token_end)
+            pos = token_end
@@ -4,7 +4,8 @@ from persimmon.parser import Parser
 class MultiChildParser(Parser):
     def __init__(self, parser_factory, parsers):
         super().__init__(parser_factory, all(p.noise for p in parsers))
-        self._parsers = parsers
+        # Copied so that changes to the caller's list can't reach the grammar.
+        self._parsers = list(parsers)
 
     def do_parse(self, iterator):
         raise NotImplementedError
@@ -18,21 +19,27 @@ class MultiChildParser(Parser):
             return self.extend(other._parsers)
         return self.append(other)
 
+    @property
+    def children(self):
+        return list(self._parsers)
+
     def prepend(self, parser):
-        return self.__class__(self._parser_factory, [parser] + self._parsers)
+        return self._rebuild([parser] + self._parsers)
 
     def append(self, parser):
-        return self.__class__(self._parser_factory, self._parsers + [parser])
+        return self._rebuild(self._parsers + [parser])
 
     def extend(self, parsers):
-        return self.__class__(self._parser_factory, self._parsers + parsers)
+        return self._rebuild(self._parsers + parsers)
+
+    def _rebuild(self, parsers):
+        raise NotImplementedError
 
 
 class ChoiceParser(MultiChildParser):
     def do_parse(self, iterator):
         first_success = None
         last_failure = None
-        expected = []
         for parser in self._parsers:
             res = parser.do_parse(iterator)
             if res.consumed:
@@ -41,16 +48,34 @@ class ChoiceParser(MultiChildParser):
                 first_success = first_success or res
             else:
                 last_failure = res
-            expected.extend(res.expected)
         if first_success is not None:
-            first_success.expected = expected
             return first_success
-        last_failure.expected = expected
         return last_failure
 
+    def do_match(self, iterator):
+        any_matched = False
+        for parser in self._parsers:
+            matched, consumed = parser.do_match(iterator)
+            if consumed:
+                return matched, consumed
+            any_matched = any_matched or matched
+        return any_matched, False
+
     @property
     def expected(self):
-        return [p.expected for p in self._parsers]
+        return [e for p in self._parsers for e in p.expected]
+
+    def _rebuild(self, parsers):
+        return self._parser_factory.make_choice_parser(parsers)
+
+    def nullable(self, analysis):
+        return any(analysis.is_nullable(p) for p in self._parsers)
+
+    def first(self, analysis):
+        return set().union(*(analysis.first(p) for p in self._parsers))
+
+    def check(self, analysis):
+        return analysis.check_alternatives(self, self._parsers)
 
     def __or__(self, other):
         return self.combine(other)
@@ -70,9 +95,27 @@ class ChainParser(MultiChildParser):
                 results.extend(res.values)
         return self._parse_success(results, consumed)
 
+    def do_match(self, iterator):
+        consumed = False
+        for parser in self._parsers:
+            matched, child_consumed = parser.do_match(iterator)
+            consumed = consumed or child_consumed
+            if not matched:
+                return False, consumed
+        return True, consumed
+
     @property
     def expected(self):
         return []
 
+    def _rebuild(self, parsers):
+        return self._parser_factory.make_chain_parser(parsers)
+
+    def nullable(self, analysis):
+        return all(analysis.is_nullable(p) for p in self._parsers)
+
+    def first(self, analysis):
+        return analysis.first_of_chain(self._parsers)
+
     def __and__(self, other):
         return self.combine(other)
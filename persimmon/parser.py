@@ -1,4 +1,7 @@
-from persimmon import result
+import concurrent.futures
+
+from persimmon import result, utils
+from persimmon import source as source_module
 
 
 class Parser:
@@ -9,25 +12,139 @@ class Parser:
     def do_parse(self, iterator):
         raise NotImplementedError
 
+    def do_match(self, iterator):
+        res = self.do_parse(iterator)
+        return res.is_success, res.consumed
+
     @property
     def expected(self):
         raise NotImplementedError
 
-    def _parse_success(self, values, consumed=False, expected=None):
-        return result.Success(values, consumed, expected or self.expected)
+    @property
+    def children(self):
+        return []
+
+    def nullable(self, analysis):
+        return False
+
+    def first(self, analysis):
+        # Parsers whose first elements can't be described stand for
+        # themselves.
+        return {self}
+
+    def check(self, analysis):
+        return []
+
+    def walk(self):
+        seen = set()
+        stack = [self]
+        while stack:
+            parser = stack.pop()
+            if id(parser) in seen:
+                continue
+            seen.add(id(parser))
+            yield parser
+            stack.extend(reversed(parser.children))
+
+    @property
+    def char_class(self):
+        return None
+
+    def unexpected_at(self, iterator):
+        return iterator.peek()
+
+    def _parse_success(self, values, consumed=False):
+        return result.Success(values, consumed)
 
-    def _parse_failure(self, unexpected, position, consumed=False,
-                       expected=None):
-        return result.Failure(unexpected, position, consumed,
-                              expected or self.expected)
+    def _parse_failure(self, iterator, consumed=False):
+        iterator.record_failure(self)
+        return result.Failure(consumed)
 
-    def parse(self, data):
-        iterator = self._parser_factory.make_rewind_iterator(data)
+    def parse(self, data, cache=None, max_steps=None, deadline=None,
+              max_lookback=None):
+        if cache is not None:
+            return cache.parse(self, data, max_steps, deadline, max_lookback)
+        iterator = self.make_rewind_iterator(data)
+        if max_steps is not None or deadline is not None:
+            iterator.set_budget(utils.ParseBudget(max_steps, deadline))
+        if max_lookback is not None:
+            iterator.set_max_lookback(max_lookback)
         res = self.do_parse(iterator)
         if not res.is_success:
-            raise result.ParseError(str(res))
+            raise iterator.parse_error()
+        return self._result_value(res)
+
+    @staticmethod
+    def _result_value(res):
         return res.values[0] if len(res.values) == 1 else res.values
 
+    def parse_many(self, inputs):
+        return list(self.parse_many_iter(inputs))
+
+    def parse_many_iter(self, inputs):
+        # Failures are yielded as ParseErrors instead of being raised.
+        for iterator, res in self._parse_each(inputs):
+            if res.is_success:
+                yield self._result_value(res)
+            else:
+                yield iterator.parse_error()
+
+    def parse_lines(self, source, errors='raise'):
+        # Checked here rather than in the generator, so that a bad mode is
+        # reported at the call instead of at the first line.
+        if errors not in ('raise', 'skip', 'collect'):
+            raise ValueError("errors must be 'raise', 'skip' or 'collect'")
+        return self._parse_lines(source, errors)
+
+    def _parse_lines(self, source, errors):
+        # Lines are parsed with plain index positions, which become line
+        # positions only for errors.
+        lines = source_module.iter_lines(source)
+        for number, (iterator, res) in enumerate(self._parse_each(lines), 1):
+            if res.is_success:
+                yield self._result_value(res)
+            elif errors != 'skip':
+                error = iterator.parse_error(
+                    lambda position: utils.LinePosition(number, position.value)
+                )
+                if errors == 'raise':
+                    raise error
+                yield error
+
+    def _parse_each(self, inputs):
+        # One iterator is reset for each input of the same type as the last.
+        iterator = None
+        data_type = None
+        for data in inputs:
+            # Memoryviews get different iterators depending on their format.
+            if type(data) is data_type and data_type is not memoryview:
+                iterator.reset(data)
+            else:
+                iterator = self.make_rewind_iterator(data)
+                data_type = type(data)
+            yield iterator, self.do_parse(iterator)
+
+    def parse_concurrent(self, inputs, threads=None, cache=None,
+                         max_steps=None, deadline=None, max_lookback=None):
+        # Grammars hold no per-parse state, so one can parse on many threads.
+        with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+            return list(executor.map(
+                lambda data: self.parse(data, cache, max_steps, deadline,
+                                        max_lookback),
+                inputs
+            ))
+
+    def make_rewind_iterator(self, data, position=None):
+        return self._parser_factory.make_rewind_iterator(data, position)
+
+    def validate(self, data):
+        iterator = self.make_rewind_iterator(data)
+        matched, _ = self.do_match(iterator)
+        return None if matched else iterator.failure_position
+
+    def matches(self, data):
+        return self.validate(data) is None
+
     def __or__(self, other):
         return self._parser_factory.combine_choice(self, other)
 
@@ -38,12 +155,19 @@ class Parser:
     def attempt(self):
         return self._parser_factory.make_attempt_parser(self)
 
+    @property
+    def commit(self):
+        return self._parser_factory.make_commit_parser(self)
+
     def map(self, func):
         return self._parser_factory.make_map_parser(self, func)
 
     def always(self, value):
         return self.map(lambda _: value)
 
+    def default(self, value):
+        return self._parser_factory.make_default_parser(self, value)
+
     def filter(self, pred):
         return self._parser_factory.make_filter_parser(self, pred)
 
@@ -58,11 +182,45 @@ class Parser:
     def one_or_more(self):
         return self._parser_factory.make_repeat_parser(self, min_results=1)
 
-    def zero_or_more_sep_by(self, sep):
-        return self.one_or_more_sep_by(sep).default([])
+    def zero_or_more_sep_by(self, sep, trailing=False):
+        return self._parser_factory.make_sep_by_parser(
+            self,
+            sep,
+            trailing=trailing
+        )
+
+    def one_or_more_sep_by(self, sep, trailing=False):
+        return self._parser_factory.make_sep_by_parser(
+            self,
+            sep,
+            min_results=1,
+            trailing=trailing
+        )
 
-    def one_or_more_sep_by(self, sep):
-        return (self & (sep & self).zero_or_more).map(lambda h, t: [h] + t)
+    def zero_or_more_end_by(self, sep):
+        return self._parser_factory.make_end_by_parser(self, sep)
+
+    def one_or_more_end_by(self, sep):
+        return self._parser_factory.make_end_by_parser(
+            self,
+            sep,
+            min_results=1
+        )
+
+    def delimited(self, left, sep, right, trailing=False):
+        return self._parser_factory.make_delimited_parser(
+            self,
+            left,
+            sep,
+            right,
+            trailing=trailing
+        )
+
+    def fold(self, initial, func):
+        return self._parser_factory.make_fold_parser(self, initial, func)
+
+    def sep_by_fold(self, sep, initial, func):
+        return self._parser_factory.make_fold_parser(self, initial, func, sep)
 
     def at_least(self, min_results):
         return self.repeat_between(min_results=min_results)
@@ -80,6 +238,9 @@ class Parser:
     def repeat(self, num_results):
         return self.repeat_between(num_results, num_results)
 
+    def lexeme(self, trivia):
+        return self._parser_factory.make_lexeme_parser(self, trivia)
+
     def labeled(self, label):
         return self._parser_factory.make_labeled_parser(self, label)
 
@@ -1,4 +1,18 @@
 from persimmon.parser import Parser
+from persimmon.utils import END, CharClass
+
+
+def _keyed(step, *key):
+    # Steps are fresh closures, so they carry a key describing what they do
+    # for the factory to compare them by when interning.
+    step.key = key
+    return step
+
+
+def _first_of_sequence(seq):
+    if len(seq) == 0:
+        return set()
+    return {seq[:1] if isinstance(seq, str) else seq[0]}
 
 
 class SuccessParser(Parser):
@@ -9,10 +23,19 @@ class SuccessParser(Parser):
     def do_parse(self, iterator):
         return self._parse_success([self._value])
 
+    def do_match(self, iterator):
+        return True, False
+
     @property
     def expected(self):
         return []
 
+    def nullable(self, analysis):
+        return True
+
+    def first(self, analysis):
+        return set()
+
 
 class SatisfyParser(Parser):
     def __init__(self, parser_factory, steps):
@@ -20,24 +43,42 @@ class SatisfyParser(Parser):
         self._steps = steps or []
 
     def do_parse(self, iterator):
-        with iterator.rewind_point() as point:
-            try:
-                initial = next(iterator)
-            except StopIteration:
-                iterator.rewind_to(point)
-                return self._parse_failure('end of input', iterator.position)
-            value = initial
-            for step in self._steps:
-                passes, value = step(value)
-                if not passes:
-                    iterator.rewind_to(point)
-                    return self._parse_failure(initial, iterator.position)
-            return self._parse_success([value], consumed=True)
+        value = iterator.peek()
+        if value is END:
+            return self._parse_failure(iterator)
+        for step in self._steps:
+            passes, value = step(value)
+            if not passes:
+                return self._parse_failure(iterator)
+        iterator.advance()
+        return self._parse_success([value], consumed=True)
+
+    def do_match(self, iterator):
+        value = iterator.peek()
+        if value is END:
+            iterator.record_failure(self)
+            return False, False
+        for step in self._steps:
+            passes, value = step(value)
+            if not passes:
+                iterator.record_failure(self)
+                return False, False
+        iterator.advance()
+        return True, True
 
     @property
     def expected(self):
         return []
 
+    @property
+    def char_class(self):
+        if len(self._steps) != 1:
+            return None
+        key = getattr(self._steps[0], 'key', ())
+        if key[:1] == ('filter',) and isinstance(key[1], CharClass):
+            return key[1]
+        return None
+
     def map(self, func):
         return self.with_step(self.map_step(func))
 
@@ -52,11 +93,11 @@ class SatisfyParser(Parser):
 
     @staticmethod
     def map_step(func):
-        return lambda value: (True, func(value))
+        return _keyed(lambda value: (True, func(value)), 'map', func)
 
     @staticmethod
     def filter_step(pred):
-        return lambda value: (pred(value), value)
+        return _keyed(lambda value: (pred(value), value), 'filter', pred)
 
     @staticmethod
     def transform_step(transform):
@@ -65,7 +106,7 @@ class SatisfyParser(Parser):
             if new_value is None:
                 return False, value
             return True, new_value
-        return run
+        return _keyed(run, 'transform', transform)
 
 
 class RawSequenceParser(Parser):
@@ -74,33 +115,194 @@ class RawSequenceParser(Parser):
         self._seq = seq
 
     def do_parse(self, iterator):
+        if iterator.match_sequence(self._seq):
+            return self._parse_success([list(self._seq)], consumed=True)
         accum = []
         for s in iter(self._seq):
-            value = next(iterator)
-            accum.append(value)
+            value = iterator.peek()
+            if value is END:
+                return self._parse_failure(iterator, consumed=bool(accum))
             if s != value:
-                return self._parse_failure(accum, iterator.position,
-                                           consumed=True)
+                failure = self._parse_failure(iterator, consumed=True)
+                iterator.advance()
+                return failure
+            iterator.advance()
+            accum.append(value)
         return self._parse_success([accum], consumed=True)
 
+    def do_match(self, iterator):
+        if iterator.match_sequence(self._seq):
+            return True, True
+        consumed = False
+        for s in iter(self._seq):
+            value = iterator.peek()
+            if value is END:
+                iterator.record_failure(self)
+                return False, consumed
+            if s != value:
+                iterator.record_failure(self)
+                iterator.advance()
+                return False, True
+            iterator.advance()
+            consumed = True
+        return True, True
+
     @property
     def expected(self):
         return [str(self._seq)]
 
+    def nullable(self, analysis):
+        return len(self._seq) == 0
+
+    def first(self, analysis):
+        return _first_of_sequence(self._seq)
+
+
+class LiteralParser(Parser):
+    def __init__(self, parser_factory, literal):
+        super().__init__(parser_factory, False)
+        self._literal = literal
+
+    def do_parse(self, iterator):
+        if iterator.match_sequence(self._literal):
+            return self._parse_success([self._literal],
+                                       consumed=len(self._literal) > 0)
+        return self._parse_failure(iterator)
+
+    def do_match(self, iterator):
+        if iterator.match_sequence(self._literal):
+            return True, len(self._literal) > 0
+        iterator.record_failure(self)
+        return False, False
+
+    def unexpected_at(self, iterator):
+        values = []
+        with iterator.rewind_point() as point:
+            for _ in range(len(self._literal)):
+                value = iterator.peek()
+                if value is END:
+                    break
+                values.append(value)
+                iterator.advance()
+            iterator.rewind_to(point)
+        if not values:
+            return END
+        if isinstance(self._literal, str):
+            return ''.join(values)
+        return type(self._literal)(values)
+
+    @property
+    def expected(self):
+        return [str(self._literal)]
+
+    @property
+    def literal(self):
+        return self._literal
+
+    def nullable(self, analysis):
+        return len(self._literal) == 0
+
+    def first(self, analysis):
+        return _first_of_sequence(self._literal)
+
+
+class TokenParser(Parser):
+    def __init__(self, parser_factory, pattern, charset, convert, label):
+        super().__init__(parser_factory, False)
+        self._pattern = pattern
+        self._charset = charset
+        self._convert = convert
+        self._label = label
+
+    def do_parse(self, iterator):
+        token = iterator.match_token(self._pattern, self._charset)
+        if token is None:
+            return self._parse_failure(iterator)
+        return self._parse_success([self._convert(token)], consumed=True)
+
+    def do_match(self, iterator):
+        if iterator.match_token(self._pattern, self._charset) is None:
+            iterator.record_failure(self)
+            return False, False
+        return True, True
+
+    @property
+    def expected(self):
+        return [self._label]
+
+    def first(self, analysis):
+        return {self._label}
+
+
+class TriviaParser(Parser):
+    def __init__(self, parser_factory, trivia):
+        super().__init__(parser_factory, True)
+        self._trivia = trivia
+
+    def do_parse(self, iterator):
+        return self._parse_success([], consumed=self.skip(iterator))
+
+    def do_match(self, iterator):
+        return True, self.skip(iterator)
+
+    def skip(self, iterator):
+        return iterator.skip_trivia(self._trivia)
+
+    @property
+    def expected(self):
+        return []
+
+    def nullable(self, analysis):
+        return True
+
+    def first(self, analysis):
+        return set()
+
+
+class CutParser(Parser):
+    def __init__(self, parser_factory):
+        super().__init__(parser_factory, True)
+
+    def do_parse(self, iterator):
+        iterator.commit()
+        return self._parse_success([])
+
+    def do_match(self, iterator):
+        iterator.commit()
+        return True, False
+
+    @property
+    def expected(self):
+        return []
+
+    def nullable(self, analysis):
+        return True
+
+    def first(self, analysis):
+        return set()
+
 
 class EndOfFileParser(Parser):
     def __init__(self, parser_factory):
         super().__init__(parser_factory, True)
 
     def do_parse(self, iterator):
-        with iterator.rewind_point() as point:
-            try:
-                value = next(iterator)
-                iterator.rewind_to(point)
-                return self._parse_failure(value, iterator.position)
-            except StopIteration:
-                return self._parse_success([])
+        if iterator.peek() is END:
+            return self._parse_success([])
+        return self._parse_failure(iterator)
+
+    def do_match(self, iterator):
+        if iterator.peek() is END:
+            return True, False
+        iterator.record_failure(self)
+        return False, False
 
     @property
     def expected(self):
         return ['end of file']
+
+    def nullable(self, analysis):
+        return True
+
+    def first(self, analysis):
+        return set()
@@ -1,7 +1,6 @@
 class Result:
-    def __init__(self, consumed, expected):
+    def __init__(self, consumed):
         self.consumed = consumed
-        self.expected = expected
 
     @property
     def is_success(self):
@@ -9,8 +8,8 @@ class Result:
 
 
 class Success(Result):
-    def __init__(self, values, consumed=False, expected=None):
-        super().__init__(consumed, expected or [])
+    def __init__(self, values, consumed=False):
+        super().__init__(consumed)
         self.values = values
 
     @property
@@ -19,21 +18,31 @@ class Success(Result):
 
 
 class Failure(Result):
-    def __init__(self, unexpected, position, consumed=False, expected=None):
-        super().__init__(consumed, expected or [])
-        self.unexpected = unexpected
-        self.position = position
+    def __init__(self, consumed=False):
+        super().__init__(consumed)
 
     @property
     def is_success(self):
         return False
 
-    def __str__(self):
-        return (
-            'Unexpected "{}" at {}\n'
-            'Expecting {}'
-        ).format(self.unexpected, self.position, ', '.join(self.expected))
+
+def describe_failure(unexpected, position, expected):
+    return (
+        'Unexpected "{}" at {}\n'
+        'Expecting {}'
+    ).format(unexpected, position, ', '.join(str(e) for e in expected))
 
 
 class ParseError(Exception):
     pass
+
+
+class ParseBudgetExceeded(Exception):
+    pass
+
+
+class LookbackExceeded(Exception):
+    def __init__(self, message, parser=None, position=None):
+        super().__init__(message)
+        self.parser = parser
+        self.position = position
@@ -1,3 +1,6 @@
+import threading
+
+from persimmon import result
 from persimmon.parser import Parser
 
 
@@ -10,27 +13,45 @@ class SingleChildParser(Parser):
     def do_parse(self, iterator):
         return self._child.do_parse(iterator)
 
+    def do_match(self, iterator):
+        return self._child.do_match(iterator)
+
     @property
     def expected(self):
         return self._child.expected
 
+    @property
+    def children(self):
+        return [self._child]
+
+    def nullable(self, analysis):
+        return analysis.is_nullable(self._child)
+
+    def first(self, analysis):
+        return analysis.first(self._child)
+
 
 class AttemptParser(SingleChildParser):
     def __init__(self, parser_factory, child):
         super().__init__(parser_factory, None, child)
 
     def do_parse(self, iterator):
-        with iterator.rewind_point() as point:
-            try:
-                res = super().do_parse(iterator)
-            except StopIteration:
-                iterator.rewind_to(point)
-                return self._parse_failure('end of input', iterator.position)
-            if not res.is_success:
+        with iterator.rewind_point(self) as point:
+            res = super().do_parse(iterator)
+            # A committed failure can't be backtracked out of.
+            if not res.is_success and not point.released:
                 iterator.rewind_to(point)
-            res.consumed = False
+                res.consumed = False
             return res
 
+    def do_match(self, iterator):
+        with iterator.rewind_point(self) as point:
+            matched, consumed = super().do_match(iterator)
+            if not matched and not point.released:
+                iterator.rewind_to(point)
+                return False, False
+            return matched, consumed
+
 
 def _apply_to_varying(func, values):
     # TODO: Maybe this should be in a class for "function-applying parsers?"
@@ -60,10 +81,12 @@ class FilterParser(SingleChildParser):
         if res.is_success:
             passes = _apply_to_varying(self._pred, res.values)
             if not passes:
-                return self._parse_failure('bad input', iterator.position,
-                                           consumed=True)
+                return self._parse_failure(iterator, consumed=True)
         return res
 
+    def do_match(self, iterator):
+        return Parser.do_match(self, iterator)
+
     @property
     def expected(self):
         return []
@@ -79,11 +102,13 @@ class TransformParser(SingleChildParser):
         if res.is_success:
             new_value = _apply_to_varying(self._transform, res.values)
             if new_value is None:
-                return self._parse_failure('bad input', iterator.position,
-                                           consumed=True)
+                return self._parse_failure(iterator, consumed=True)
             res.values = [new_value]
         return res
 
+    def do_match(self, iterator):
+        return Parser.do_match(self, iterator)
+
 
 class RepeatParser(SingleChildParser):
     def __init__(self, parser_factory, child, min_results=0, max_results=None):
@@ -93,24 +118,374 @@ class RepeatParser(SingleChildParser):
 
     def do_parse(self, iterator):
         results = []
+        count = 0
         consumed = False
-        expected = []
-        while self._max_results is None or len(results) < self._max_results:
+        char_class = self._child.char_class
+        if char_class is not None and self._max_results is None:
+            # Take the whole run at once; the child then fails where it ends,
+            # as it would have otherwise.
+            run = iterator.match_run(char_class)
+            if run:
+                iterator.spend_steps(len(run))
+                results.extend(run)
+                count = len(run)
+                consumed = True
+        while self._max_results is None or count < self._max_results:
+            iterator.spend_steps()
             res = super().do_parse(iterator)
             consumed = consumed or res.consumed
-            expected = res.expected
             if res.is_success:
                 results.extend(res.values)
+                count += 1
+            else:
+                if count < self._min_results:
+                    return result.Failure(consumed)
+                break
+        return self._parse_success([results], consumed)
+
+    def do_match(self, iterator):
+        count = 0
+        consumed = False
+        char_class = self._child.char_class
+        if char_class is not None and self._max_results is None:
+            run = iterator.match_run(char_class)
+            if run:
+                iterator.spend_steps(len(run))
+                count = len(run)
+                consumed = True
+        while self._max_results is None or count < self._max_results:
+            iterator.spend_steps()
+            matched, child_consumed = super().do_match(iterator)
+            consumed = consumed or child_consumed
+            if not matched:
+                if count < self._min_results:
+                    return False, consumed
+                break
+            count += 1
+        return True, consumed
+
+    def nullable(self, analysis):
+        return self._min_results == 0 or analysis.is_nullable(self._child)
+
+    def check(self, analysis):
+        if self._max_results is None and analysis.is_nullable(self._child):
+            return [analysis.issue(
+                'infinite loop',
+                self,
+                'repeats a parser that can succeed without consuming input'
+            )]
+        return []
+
+
+class FoldParser(SingleChildParser):
+    def __init__(self, parser_factory, child, initial, func, sep=None):
+        super().__init__(parser_factory, False, child)
+        self._initial = initial
+        self._func = func
+        self._sep = sep
+
+    def do_parse(self, iterator):
+        accum = self._initial
+        consumed = False
+        res = super().do_parse(iterator)
+        while res.is_success:
+            iterator.spend_steps()
+            consumed = consumed or res.consumed
+            accum = self._func(accum, *res.values)
+            if self._sep is not None:
+                sep_res = self._sep.do_parse(iterator)
+                consumed = consumed or sep_res.consumed
+                if not sep_res.is_success:
+                    return self._parse_success([accum], consumed)
+                res = super().do_parse(iterator)
+                if not res.is_success:
+                    if not sep_res.consumed and not res.consumed:
+                        return self._parse_success([accum], consumed)
+                    res.consumed = True
+                    return res
+            else:
+                res = super().do_parse(iterator)
+        return self._parse_success([accum], consumed or res.consumed)
+
+    def do_match(self, iterator):
+        consumed = False
+        matched, child_consumed = super().do_match(iterator)
+        while matched:
+            iterator.spend_steps()
+            consumed = consumed or child_consumed
+            if self._sep is not None:
+                matched, sep_consumed = self._sep.do_match(iterator)
+                consumed = consumed or sep_consumed
+                if not matched:
+                    return True, consumed
+                matched, child_consumed = super().do_match(iterator)
+                if not matched:
+                    if not sep_consumed and not child_consumed:
+                        return True, consumed
+                    return False, True
             else:
-                if len(results) < self._min_results:
-                    return self._parse_failure(
-                        res.unexpected,
-                        iterator.position,
-                        consumed,
-                        expected
-                    )
+                matched, child_consumed = super().do_match(iterator)
+        return True, consumed or child_consumed
+
+    @property
+    def children(self):
+        if self._sep is None:
+            return [self._child]
+        return [self._child, self._sep]
+
+    def nullable(self, analysis):
+        return True
+
+    def check(self, analysis):
+        loops = analysis.is_nullable(self._child) and (
+            self._sep is None or analysis.is_nullable(self._sep)
+        )
+        if loops:
+            return [analysis.issue(
+                'infinite loop',
+                self,
+                'folds over items that can be empty without consuming input'
+            )]
+        return []
+
+
+class SepByParser(SingleChildParser):
+    def __init__(self, parser_factory, child, sep, min_results=0,
+                 trailing=False):
+        super().__init__(parser_factory, False, child)
+        self._sep = sep
+        self._min_results = min_results
+        self._trailing = trailing
+
+    def do_parse(self, iterator):
+        results = []
+        res = super().do_parse(iterator)
+        consumed = res.consumed
+        count = 0
+        while res.is_success:
+            iterator.spend_steps()
+            results.extend(res.values)
+            count += 1
+            res = self._sep.do_parse(iterator)
+            if not res.is_success:
+                if res.consumed:
+                    res.consumed = True
+                    return res
+                break
+            sep_consumed = res.consumed
+            consumed = consumed or sep_consumed
+            res = super().do_parse(iterator)
+            if not res.is_success:
+                if res.consumed or (sep_consumed and not self._trailing):
+                    res.consumed = True
+                    return res
+                break
+            consumed = consumed or res.consumed
+        if res.consumed:
+            return res
+        if count < self._min_results:
+            return result.Failure(consumed)
+        return self._parse_success([results], consumed)
+
+    def do_match(self, iterator):
+        matched, consumed = super().do_match(iterator)
+        failed_consumed = consumed
+        count = 0
+        while matched:
+            iterator.spend_steps()
+            count += 1
+            matched, sep_consumed = self._sep.do_match(iterator)
+            if not matched:
+                failed_consumed = sep_consumed
+                break
+            consumed = consumed or sep_consumed
+            matched, child_consumed = super().do_match(iterator)
+            if not matched:
+                if child_consumed or (sep_consumed and not self._trailing):
+                    return False, True
+                failed_consumed = False
+                break
+            consumed = consumed or child_consumed
+        if failed_consumed:
+            return False, True
+        if count < self._min_results:
+            return False, consumed
+        return True, consumed
+
+    @property
+    def children(self):
+        return [self._child, self._sep]
+
+    def nullable(self, analysis):
+        return self._min_results == 0 or analysis.is_nullable(self._child)
+
+    def check(self, analysis):
+        loops = (analysis.is_nullable(self._child) and
+                 analysis.is_nullable(self._sep))
+        if loops:
+            return [analysis.issue(
+                'infinite loop',
+                self,
+                'separates items that can be empty with a separator that '
+                'can be empty'
+            )]
+        return []
+
+
+class EndByParser(SingleChildParser):
+    def __init__(self, parser_factory, child, sep, min_results=0):
+        super().__init__(parser_factory, False, child)
+        self._sep = sep
+        self._min_results = min_results
+
+    def do_parse(self, iterator):
+        results = []
+        consumed = False
+        count = 0
+        while True:
+            iterator.spend_steps()
+            res = super().do_parse(iterator)
+            if not res.is_success:
+                if res.consumed:
+                    res.consumed = True
+                    return res
                 break
-        return self._parse_success([results], consumed, expected)
+            item_consumed = res.consumed
+            values = res.values
+            res = self._sep.do_parse(iterator)
+            if not res.is_success:
+                if item_consumed or res.consumed:
+                    res.consumed = True
+                    return res
+                break
+            consumed = consumed or item_consumed or res.consumed
+            results.extend(values)
+            count += 1
+        if count < self._min_results:
+            return result.Failure(consumed)
+        return self._parse_success([results], consumed)
+
+    def do_match(self, iterator):
+        consumed = False
+        count = 0
+        while True:
+            iterator.spend_steps()
+            matched, item_consumed = super().do_match(iterator)
+            if not matched:
+                if item_consumed:
+                    return False, True
+                break
+            matched, sep_consumed = self._sep.do_match(iterator)
+            if not matched:
+                if item_consumed or sep_consumed:
+                    return False, True
+                break
+            consumed = consumed or item_consumed or sep_consumed
+            count += 1
+        if count < self._min_results:
+            return False, consumed
+        return True, consumed
+
+    @property
+    def children(self):
+        return [self._child, self._sep]
+
+    def nullable(self, analysis):
+        return self._min_results == 0 or (
+            analysis.is_nullable(self._child) and
+            analysis.is_nullable(self._sep)
+        )
+
+    def first(self, analysis):
+        return analysis.first_of_chain([self._child, self._sep])
+
+    def check(self, analysis):
+        loops = (analysis.is_nullable(self._child) and
+                 analysis.is_nullable(self._sep))
+        if loops:
+            return [analysis.issue(
+                'infinite loop',
+                self,
+                'repeats items and separators that can both be empty'
+            )]
+        return []
+
+
+class DelimitedParser(SepByParser):
+    def __init__(self, parser_factory, child, left, sep, right,
+                 trailing=False):
+        super().__init__(parser_factory, child, sep, trailing=trailing)
+        self._left = left
+        self._right = right
+
+    def do_parse(self, iterator):
+        res = self._left.do_parse(iterator)
+        if not res.is_success:
+            return res
+        consumed = res.consumed
+        body = super().do_parse(iterator)
+        consumed = consumed or body.consumed
+        if not body.is_success:
+            body.consumed = consumed
+            return body
+        res = self._right.do_parse(iterator)
+        if not res.is_success:
+            res.consumed = consumed or res.consumed
+            return res
+        body.consumed = consumed or res.consumed
+        return body
+
+    def do_match(self, iterator):
+        matched, consumed = self._left.do_match(iterator)
+        if not matched:
+            return False, consumed
+        matched, body_consumed = super().do_match(iterator)
+        consumed = consumed or body_consumed
+        if not matched:
+            return False, consumed
+        matched, right_consumed = self._right.do_match(iterator)
+        return matched, consumed or right_consumed
+
+    @property
+    def expected(self):
+        return self._left.expected
+
+    @property
+    def children(self):
+        return [self._left, self._child, self._sep, self._right]
+
+    def nullable(self, analysis):
+        return (analysis.is_nullable(self._left) and
+                analysis.is_nullable(self._right))
+
+    def first(self, analysis):
+        first = set(analysis.first(self._left))
+        if analysis.is_nullable(self._left):
+            first |= analysis.first(self._child)
+            first |= analysis.first(self._right)
+        return first
+
+
+class LexemeParser(SingleChildParser):
+    def __init__(self, parser_factory, child, trivia):
+        super().__init__(parser_factory, None, child)
+        self._trivia = trivia
+
+    def do_parse(self, iterator):
+        res = super().do_parse(iterator)
+        if res.is_success and self._trivia.skip(iterator):
+            res.consumed = True
+        return res
+
+    def do_match(self, iterator):
+        matched, consumed = super().do_match(iterator)
+        if matched and self._trivia.skip(iterator):
+            consumed = True
+        return matched, consumed
+
+    @property
+    def children(self):
+        return [self._child, self._trivia]
 
 
 class LabeledParser(SingleChildParser):
@@ -119,15 +494,43 @@ class LabeledParser(SingleChildParser):
         self._label = label
 
     def do_parse(self, iterator):
+        start = iterator.offset
+        mark = iterator.failure_mark()
+        # Rewind points made inside are named by the label.
+        outer_label = iterator.label
+        iterator.label = self._label
         res = super().do_parse(iterator)
+        iterator.label = outer_label
         if not res.consumed:
-            res.expected = self.expected
+            iterator.relabel_failures(start, mark, self)
         return res
 
+    def do_match(self, iterator):
+        start = iterator.offset
+        mark = iterator.failure_mark()
+        outer_label = iterator.label
+        iterator.label = self._label
+        matched, consumed = super().do_match(iterator)
+        iterator.label = outer_label
+        if not consumed:
+            iterator.relabel_failures(start, mark, self)
+        return matched, consumed
+
     @property
     def expected(self):
         return [self._label]
 
+    @property
+    def char_class(self):
+        return self._child.char_class
+
+    def first(self, analysis):
+        # Name elements that can't be described after the label.
+        return {
+            self._label if isinstance(e, Parser) else e
+            for e in analysis.first(self._child)
+        }
+
     def _inject(self, parser):
         return self._parser_factory.make_labeled_parser(parser, self._label)
 
@@ -156,12 +559,35 @@ class NoisyParser(SingleChildParser):
 
 
 class DelayedParser(SingleChildParser):
+    def __init__(self, parser_factory, noise, parser_func):
+        super().__init__(parser_factory, noise, None)
+        self._parser_func = parser_func
+        # Grammars are shared between threads, so the child is built exactly
+        # once, by whichever thread needs it first.
+        self._lock = threading.RLock()
+
     def do_parse(self, iterator):
-        if hasattr(self._child, '__call__'):
-            self._child = self._child(self)
-        return super().do_parse(iterator)
+        if self._child is None:
+            self._resolve()
+        return self._child.do_parse(iterator)
+
+    def do_match(self, iterator):
+        if self._child is None:
+            self._resolve()
+        return self._child.do_match(iterator)
+
+    def _resolve(self):
+        with self._lock:
+            if self._child is None:
+                self._child = self._parser_func(self)
 
     @property
     def expected(self):
         # TODO: is it safe to eval _delayed to get this?
         return []
+
+    @property
+    def children(self):
+        if self._child is None:
+            self._resolve()
+        return [self._child]
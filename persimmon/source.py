@@ -0,0 +1,254 @@
+"""Input sources that read files in large chunks.
+
+A file object given to parse is read through a FileSource, so its elements
+are characters for text files and byte values for binary files, the same as
+for str and bytes data. open_source also decodes binary files with an
+incremental codec and decompresses gzip, bzip2 and xz files as it goes,
+without writing anything to disk.
+"""
+
+import bz2
+import codecs
+import collections
+import gzip
+import itertools
+import lzma
+
+
+_CHUNK_SIZE = 1 << 16
+
+# Magic numbers at the start of compressed files, and the modules that read
+# them.
+_COMPRESSIONS = {
+    'gzip': (b'\x1f\x8b', gzip),
+    'bz2': (b'BZh', bz2),
+    'xz': (b'\xfd7zXZ\x00', lzma),
+}
+_MAGIC_LENGTH = max(len(magic) for magic, _ in _COMPRESSIONS.values())
+
+
+class FileSource:
+    """Iterable of the elements of a file object, read a chunk at a time.
+
+    Text files give characters. Binary files give byte values, or characters
+    if an encoding is given, in which case chunks are decoded incrementally
+    so that characters split across chunks come out whole.
+    """
+
+    def __init__(self, file, encoding=None, errors='strict',
+                 chunk_size=_CHUNK_SIZE, closefd=True):
+        """Create a new file source.
+
+        :param file: the file object to read
+        :param encoding: the encoding of a binary file, or None to give its
+            byte values
+        :param errors: how decoding errors are handled, as for bytes.decode
+        :param chunk_size: how much to read at a time
+        :param closefd: whether closing the source closes the file
+        """
+        self._file = file
+        self._closefd = closefd
+        self._encoding = encoding
+        self._errors = errors
+        self._chunk_size = chunk_size
+        # (offset, seek cookie) for every chunk that may hold a point still
+        # to be resumed from, when offsets are tracked.
+        self._starts = None
+        self._offset = 0
+
+    def __iter__(self):
+        """Return an iterator over the elements of the file.
+
+        >>> import io
+        >>> list(FileSource(io.BytesIO('né'.encode()), 'utf-8', chunk_size=2))
+        ['n', 'é']
+        """
+        return itertools.chain.from_iterable(self.chunks())
+
+    def chunks(self):
+        """Read the file a chunk at a time, decoding if there's an encoding.
+
+        :return: an iterator of chunks
+        """
+        if self._starts is not None:
+            yield from self._tracked_chunks()
+            return
+        read = self._file.read
+        size = self._chunk_size
+        if self._encoding is None:
+            chunk = read(size)
+            while chunk:
+                yield chunk
+                chunk = read(size)
+            return
+        decoder = codecs.getincrementaldecoder(self._encoding)(self._errors)
+        chunk = read(size)
+        while chunk:
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+            chunk = read(size)
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+
+    def _tracked_chunks(self):
+        """Internal method to read chunks, remembering where each started."""
+        tell = self._file.tell
+        read = self._file.read
+        size = self._chunk_size
+        while True:
+            cookie = tell()
+            chunk = read(size)
+            if not chunk:
+                return
+            self._starts.append((self._offset, cookie))
+            self._offset += len(chunk)
+            yield chunk
+
+    def track_offsets(self, offset=0, resume=None):
+        """Remember where the chunks read from now on start, so that the file
+        can later be sought back to any offset in them.
+
+        Only files read without an encoding can be tracked, and they must
+        support tell and seek.
+
+        :param offset: the offset of the element the file is at, or is moved
+            to by resume
+        :param resume: a (seek cookie, elements to skip) pair from resume_at
+            to move the file to first, or None to stay where it is
+        """
+        if self._encoding is not None:
+            raise ValueError('offsets of decoded files cannot be tracked')
+        if resume is not None:
+            cookie, skip = resume
+            self._file.seek(cookie)
+            self._file.read(skip)
+        self._offset = offset
+        self._starts = collections.deque()
+
+    def resume_at(self, offset):
+        """Find how to seek the file back to an offset at or after the last
+        one asked for.
+
+        Chunks that end before the offset are forgotten.
+
+        :param offset: the offset, which must be in a chunk already read
+        :return: the (seek cookie, elements to skip) pair to pass to
+            track_offsets
+        """
+        starts = self._starts
+        while len(starts) > 1 and starts[1][0] <= offset:
+            starts.popleft()
+        start, cookie = starts[0]
+        return cookie, offset - start
+
+    def close(self):
+        """Close the file, unless the source was told not to."""
+        if self._closefd:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def iter_lines(data):
+    """Lazily split data into lines, without their newlines.
+
+    Strings and bytes are split in one go, and file objects and FileSources
+    a chunk at a time. Other iterables are taken to give lines already, as
+    text files iterated by line do. Lines may end in \\n or \\r\\n, and a
+    newline at the very end of the data doesn't start another line.
+
+    :param data: the data to split
+    :return: an iterator of lines
+
+    >>> list(iter_lines('a\\r\\n\\nb\\n'))
+    ['a', '', 'b']
+    """
+    if isinstance(data, (str, bytes, bytearray)):
+        chunks = [data]
+    elif isinstance(data, FileSource):
+        chunks = data.chunks()
+    elif hasattr(data, 'read'):
+        chunks = FileSource(data, closefd=False).chunks()
+    else:
+        for line in data:
+            newline = '\n' if isinstance(line, str) else b'\n'
+            yield _strip_return(line[:-1] if line.endswith(newline) else line)
+        return
+    partial = None
+    for chunk in chunks:
+        lines = chunk.split('\n' if isinstance(chunk, str) else b'\n')
+        if partial:
+            lines[0] = partial + lines[0]
+        partial = lines.pop()
+        for line in lines:
+            yield _strip_return(line)
+    if partial:
+        yield _strip_return(partial)
+
+
+def _strip_return(line):
+    """Drop the carriage return left at the end of a line that ended in
+    \\r\\n.
+    """
+    carriage_return = '\r' if isinstance(line, str) else b'\r'
+    return line[:-1] if line.endswith(carriage_return) else line
+
+
+def _detect_compression(file):
+    """Find the compression of a binary file from its first bytes, without
+    moving past them.
+    """
+    if hasattr(file, 'peek'):
+        start = file.peek(_MAGIC_LENGTH)[:_MAGIC_LENGTH]
+    elif hasattr(file, 'seekable') and file.seekable():
+        offset = file.tell()
+        start = file.read(_MAGIC_LENGTH)
+        file.seek(offset)
+    else:
+        return None
+    for name, (magic, _) in _COMPRESSIONS.items():
+        if start.startswith(magic):
+            return name
+    return None
+
+
+def open_source(file, encoding=None, errors='strict', compression='auto',
+                chunk_size=_CHUNK_SIZE):
+    """Open a file for parsing, decompressing it if it's compressed.
+
+    :param file: a path, or a binary file object, which is left open when
+        the source is closed
+    :param encoding: the encoding of the (decompressed) data, or None to
+        parse its byte values
+    :param errors: how decoding errors are handled, as for bytes.decode
+    :param compression: 'gzip', 'bz2' or 'xz', None for uncompressed data, or
+        'auto' to tell from the start of the data
+    :param chunk_size: how much to read at a time
+    :return: the FileSource
+    """
+    if compression not in _COMPRESSIONS and compression not in ('auto', None):
+        raise ValueError('compression must be one of {}, None or auto'.format(
+            ', '.join(_COMPRESSIONS)
+        ))
+    if isinstance(file, (str, bytes)) or hasattr(file, '__fspath__'):
+        if compression == 'auto':
+            with open(file, 'rb') as raw:
+                compression = _detect_compression(raw)
+        if compression is None:
+            file = open(file, 'rb')
+        else:
+            file = _COMPRESSIONS[compression][1].open(file, 'rb')
+        return FileSource(file, encoding, errors, chunk_size)
+    if compression == 'auto':
+        compression = _detect_compression(file)
+    if compression is None:
+        return FileSource(file, encoding, errors, chunk_size, closefd=False)
+    # Closing the decompressor leaves the caller's file open.
+    file = _COMPRESSIONS[compression][1].open(file, 'rb')
+    return FileSource(file, encoding, errors, chunk_size)
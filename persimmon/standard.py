@@ -1,61 +1,245 @@
+import functools
+import threading
+import weakref
+
 from persimmon import primitive, single, multi, utils
 from persimmon.factory import ParserFactory
 
 
+def _step_key(step):
+    return getattr(step, 'key', step)
+
+
 class StandardParserFactory(ParserFactory):
-    def make_rewind_iterator(self, data):
-        return utils.RewindIterator.make_rewind_iterator(data)
+    def __init__(self, intern=False):
+        # When interning, structurally equal calls share a single parser.
+        # Parsers compare by identity, so a key built from a parser's
+        # children only matches parsers built from those same children.
+        self._interned = weakref.WeakValueDictionary() if intern else None
+        self._lock = threading.Lock()
+
+    def _intern(self, key, build):
+        if self._interned is None:
+            return build()
+        try:
+            with self._lock:
+                parser = self._interned.get(key)
+        except TypeError:
+            # Unhashable arguments, such as list literals, aren't shared.
+            return build()
+        if parser is None:
+            # Building may intern other parsers, so it happens unlocked, and
+            # a parser built by another thread in the meantime wins.
+            built = build()
+            with self._lock:
+                parser = self._interned.setdefault(key, built)
+        return parser
+
+    @property
+    def interned_count(self):
+        if self._interned is None:
+            return 0
+        with self._lock:
+            return len(self._interned)
+
+    def make_rewind_iterator(self, data, position=None):
+        return utils.RewindIterator.make_rewind_iterator(data, position)
 
     def make_success_parser(self, value):
-        return primitive.SuccessParser(self, value)
+        return self._intern(
+            ('success', utils.value_key(value)),
+            lambda: primitive.SuccessParser(self, value)
+        )
 
     def make_satisfy_parser(self, steps=None):
         steps = steps if steps is not None else []
-        return primitive.SatisfyParser(self, steps)
+        return self._intern(
+            ('satisfy',) + tuple(_step_key(step) for step in steps),
+            lambda: primitive.SatisfyParser(self, steps)
+        )
+
+    def make_any_elem_parser(self):
+        return self._intern(
+            ('any elem',),
+            super().make_any_elem_parser
+        )
+
+    def make_elem_parser(self, el):
+        return self._intern(
+            ('elem', utils.value_key(el)),
+            functools.partial(super().make_elem_parser, el)
+        )
+
+    def make_one_of_parser(self, els):
+        return self._intern(
+            ('one of', utils.value_key(els)),
+            functools.partial(super().make_one_of_parser, els)
+        )
+
+    def make_none_of_parser(self, els):
+        return self._intern(
+            ('none of', utils.value_key(els)),
+            functools.partial(super().make_none_of_parser, els)
+        )
+
+    def make_kind_parser(self, kind):
+        return self._intern(
+            ('kind', utils.value_key(kind)),
+            functools.partial(super().make_kind_parser, kind)
+        )
+
+    def make_hex_integer_parser(self):
+        return self._intern(
+            ('hex integer',),
+            super().make_hex_integer_parser
+        )
+
+    def make_token_parser(self, pattern, charset, convert, label):
+        return self._intern(
+            ('token', pattern, charset, convert, label),
+            lambda: primitive.TokenParser(self, pattern, charset, convert,
+                                          label)
+        )
+
+    def make_trivia_parser(self, whitespace=' \t\r\n', line_comment=None,
+                           block_comment=None):
+        return self._intern(
+            ('trivia', whitespace, line_comment, block_comment),
+            lambda: primitive.TriviaParser(
+                self,
+                utils.Trivia(whitespace, line_comment, block_comment)
+            )
+        )
 
     def make_choice_parser(self, parsers):
-        return multi.ChoiceParser(self, parsers)
+        return self._intern(
+            ('choice',) + tuple(parsers),
+            lambda: multi.ChoiceParser(self, parsers)
+        )
 
     def make_chain_parser(self, parsers):
-        return multi.ChainParser(self, parsers)
+        return self._intern(
+            ('chain',) + tuple(parsers),
+            lambda: multi.ChainParser(self, parsers)
+        )
 
     def make_sequence_parser(self, seq):
-        return single.AttemptParser(
-            self,
-            primitive.RawSequenceParser(self, seq)
+        return self._intern(
+            ('sequence', utils.value_key(seq)),
+            lambda: single.AttemptParser(
+                self,
+                primitive.RawSequenceParser(self, seq)
+            )
+        )
+
+    def make_literal_parser(self, literal):
+        return self._intern(
+            ('literal', utils.value_key(literal)),
+            lambda: primitive.LiteralParser(self, literal)
         )
 
     def make_eof_parser(self):
-        return primitive.EndOfFileParser(self)
+        return self._intern(
+            ('eof',),
+            lambda: primitive.EndOfFileParser(self)
+        )
 
     def make_attempt_parser(self, parser):
-        return single.AttemptParser(self, parser)
+        return self._intern(
+            ('attempt', parser),
+            lambda: single.AttemptParser(self, parser)
+        )
+
+    def make_cut_parser(self):
+        return self._intern(
+            ('cut',),
+            lambda: primitive.CutParser(self)
+        )
+
+    def make_commit_parser(self, parser):
+        return self._intern(
+            ('commit', parser),
+            functools.partial(super().make_commit_parser, parser)
+        )
 
     def make_map_parser(self, parser, func):
-        return single.MapParser(self, parser, func)
+        return self._intern(
+            ('map', parser, func),
+            lambda: single.MapParser(self, parser, func)
+        )
 
     def make_filter_parser(self, parser, pred):
-        return single.FilterParser(self, parser, pred)
+        return self._intern(
+            ('filter', parser, pred),
+            lambda: single.FilterParser(self, parser, pred)
+        )
 
     def make_transform_parser(self, parser, transform):
-        return single.TransformParser(self, parser, transform)
+        return self._intern(
+            ('transform', parser, transform),
+            lambda: single.TransformParser(self, parser, transform)
+        )
 
     def combine_choice(self, left, right):
-        # TODO: how to combine?
-        pass
+        if isinstance(right, multi.ChoiceParser):
+            return right.prepend(left)
+        return self.make_choice_parser([left, right])
 
     def combine_chain(self, left, right):
-        # TODO: how to combine?
-        pass
+        if isinstance(right, multi.ChainParser):
+            return right.prepend(left)
+        return self.make_chain_parser([left, right])
 
     def make_repeat_parser(self, parser, min_results=0, max_results=None):
-        return single.RepeatParser(self, parser, min_results, max_results)
+        return self._intern(
+            ('repeat', parser, min_results, max_results),
+            lambda: single.RepeatParser(self, parser, min_results,
+                                        max_results)
+        )
+
+    def make_sep_by_parser(self, parser, sep, min_results=0, trailing=False):
+        return self._intern(
+            ('sep by', parser, sep, min_results, trailing),
+            lambda: single.SepByParser(self, parser, sep, min_results,
+                                       trailing)
+        )
+
+    def make_end_by_parser(self, parser, sep, min_results=0):
+        return self._intern(
+            ('end by', parser, sep, min_results),
+            lambda: single.EndByParser(self, parser, sep, min_results)
+        )
+
+    def make_delimited_parser(self, parser, left, sep, right, trailing=False):
+        return self._intern(
+            ('delimited', parser, left, sep, right, trailing),
+            lambda: single.DelimitedParser(self, parser, left, sep, right,
+                                           trailing)
+        )
+
+    def make_fold_parser(self, parser, initial, func, sep=None):
+        return self._intern(
+            ('fold', parser, utils.value_key(initial), func, sep),
+            lambda: single.FoldParser(self, parser, initial, func, sep)
+        )
+
+    def make_lexeme_parser(self, parser, trivia):
+        return self._intern(
+            ('lexeme', parser, trivia),
+            lambda: single.LexemeParser(self, parser, trivia)
+        )
 
     def make_labeled_parser(self, parser, label):
-        return single.LabeledParser(self, parser, label)
+        return self._intern(
+            ('labeled', parser, utils.value_key(label)),
+            lambda: single.LabeledParser(self, parser, label)
+        )
 
     def make_noisy_parser(self, parser, noise):
-        return single.NoisyParser(self, noise, parser)
+        return self._intern(
+            ('noisy', parser, noise),
+            lambda: single.NoisyParser(self, noise, parser)
+        )
 
     def make_delayed_parser(self, parser_func):
         return single.DelayedParser(self, False, parser_func)
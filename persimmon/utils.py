@@ -1,6 +1,24 @@
+import array
 import collections
+import collections.abc
 import copy
+import decimal
 import functools
+import re
+import time
+
+from persimmon import result, source
+
+
+class _EndOfInput:
+    """Type of the END sentinel."""
+
+    def __repr__(self):
+        return 'end of input'
+
+
+END = _EndOfInput()
+"""Sentinel returned by RewindIterator.peek when there are no more elements."""
 
 
 class Zipper:
@@ -199,20 +217,184 @@ class Zipper:
         return new_start
 
 
+def value_key(value):
+    """Make a key for a value that only equals the key of values that are
+    interchangeable with it.
+
+    Equal values of different types, such as 1 and True, get different keys,
+    and so do those inside tuples and frozensets. Floats and decimals are
+    keyed by repr, which tells 0.0 from -0.0 and Decimal('1.0') from
+    Decimal('1.00').
+
+    :param value: the value
+    :return: the key, which is only hashable if the value is
+
+    >>> value_key((1,)) == value_key((True,))
+    False
+    """
+    if isinstance(value, tuple):
+        return type(value), tuple(value_key(item) for item in value)
+    if isinstance(value, frozenset):
+        return type(value), frozenset(value_key(item) for item in value)
+    if isinstance(value, (float, complex, decimal.Decimal)):
+        return type(value), repr(value)
+    return type(value), value
+
+
+@functools.lru_cache(maxsize=None)
+def _byte_pattern(pattern):
+    """Internal function to compile a str pattern for matching bytes, or
+    return None if it has characters no byte value stands for.
+    """
+    try:
+        source = pattern.pattern.encode('latin-1')
+    except UnicodeEncodeError:
+        return None
+    return re.compile(source, pattern.flags & ~re.U)
+
+
+def _as_char(value):
+    """Internal function to give a byte value as the character it stands for,
+    so that it can be compared with text.
+    """
+    return chr(value) if isinstance(value, int) else value
+
+
+def _as_elements(literal, value):
+    """Internal function to give a str literal as the code points of its
+    characters when the elements being read, like value, are byte values.
+    Characters past 255 then never match, as no byte value stands for them.
+    """
+    if isinstance(value, int) and isinstance(literal, str):
+        return [ord(char) for char in literal]
+    return literal
+
+
+class Trivia:
+    """Describes the whitespace and comments that can be skipped between
+    tokens.
+    """
+
+    def __init__(self, whitespace=' \t\r\n', line_comment=None,
+                 block_comment=None):
+        """Create a new trivia description.
+
+        :param whitespace: the elements that count as whitespace
+        :param line_comment: the literal that starts a comment running to the
+            end of the line, if any
+        :param block_comment: an (opener, closer) pair of literals delimiting a
+            block comment, if any
+        """
+        self.whitespace = whitespace
+        self.line_comment = line_comment
+        self.block_comment = block_comment
+        self.pattern = self._compile()
+
+    def _compile(self):
+        """Internal method to build a pattern matching a run of trivia."""
+        alternatives = []
+        if self.whitespace:
+            alternatives.append('[{}]+'.format(
+                ''.join(re.escape(c) for c in self.whitespace)
+            ))
+        if self.line_comment is not None:
+            alternatives.append(re.escape(self.line_comment) + r'[^\n]*\n?')
+        if self.block_comment is not None:
+            opener, closer = self.block_comment
+            alternatives.append(re.escape(opener) + '.*?' + re.escape(closer))
+        return re.compile('(?:{})*'.format('|'.join(alternatives)), re.DOTALL)
+
+
+class CharClass:
+    """A set of characters or byte values, or everything but such a set, that
+    runs of can be matched in one go.
+    """
+
+    def __init__(self, chars, negated=False):
+        """Create a new character class.
+
+        :param chars: the characters, as a str, or the byte values, as bytes
+        :param negated: whether the class holds every element not in chars
+        """
+        self.chars = chars
+        self.negated = negated
+        self.pattern = self._compile()
+
+    def __call__(self, value):
+        """Check whether an element is in the class.
+
+        :param value: the element to check
+        :return: whether it's in the class
+
+        >>> CharClass(',\\n', negated=True)('a')
+        True
+        """
+        return (value in self.chars) != self.negated
+
+    def _compile(self):
+        """Internal method to build a pattern matching a run of the class."""
+        escaped = ''.join(re.escape(chr(c) if isinstance(c, int) else c)
+                          for c in self.chars)
+        if not escaped:
+            pattern = '(?s:.*)' if self.negated else ''
+        else:
+            pattern = '[{}{}]*'.format('^' if self.negated else '', escaped)
+        if isinstance(self.chars, bytes):
+            return re.compile(pattern.encode('latin-1'))
+        return re.compile(pattern)
+
+
+class ParseBudget:
+    """Limits how much work, such as backtracking, a single parse can do."""
+
+    def __init__(self, max_steps=None, deadline=None):
+        """Create a new budget.
+
+        :param max_steps: the most steps the parse can take, counting
+            elements re-read after rewinding and repetitions of repeated
+            parsers, or None for no limit
+        :param deadline: the time.monotonic() time after which the parse is
+            abandoned, or None for no limit
+        """
+        self._max_steps = max_steps
+        self._deadline = deadline
+        self.steps = 0
+
+    def spend(self, steps):
+        """Spend steps from the budget, raising ParseBudgetExceeded if the
+        budget has run out.
+
+        :param steps: the number of steps about to be taken
+        """
+        self.steps += steps
+        if self._max_steps is not None and self.steps > self._max_steps:
+            raise result.ParseBudgetExceeded(
+                'Took more than {} steps'.format(self._max_steps)
+            )
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise result.ParseBudgetExceeded('Passed the parse deadline')
+
+
 @functools.total_ordering
 class RewindPoint:
     """Represents a point that a specific RewindIterator can be rewound to."""
 
-    def __init__(self, rewinder, index, position):
+    def __init__(self, rewinder, index, position, owner=None, label=None):
         """Create a new rewind point.
 
         :param rewinder: the rewinder this point belongs to
         :param index: the index of the rewind point
         :param position: the position the rewind happened at
+        :param owner: the parser that made the point, if any
+        :param label: the label of the innermost labeled parser the point was
+            made in, if any
         """
         self._rewinder = rewinder
         self.index = index
         self.position = position
+        self.owner = owner
+        self.label = label
+        self.released = False
 
     def __enter__(self):
         """Called when the rewind point is created in a with statement.
@@ -260,6 +442,17 @@ class Position:
         """
         raise NotImplementedError
 
+    def shift_all(self, values):
+        """Adjusts the current position by a run of elements read in one go.
+
+        :param values: the elements read in by the iterator
+        :return: the position after shifting past all the elements
+        """
+        position = self
+        for value in values:
+            position = position.shift(value)
+        return position
+
     @property
     def value(self):
         raise NotImplementedError
@@ -275,6 +468,9 @@ class BasicPosition(Position):
     def shift(self, value):
         return BasicPosition(self._index + 1)
 
+    def shift_all(self, values):
+        return BasicPosition(self._index + len(values))
+
     def __repr__(self):
         return repr(self._index)
 
@@ -296,6 +492,15 @@ class LinePosition(Position):
             return LinePosition(self._line + 1, 0)
         return LinePosition(self._line, self._col + 1)
 
+    def shift_all(self, values):
+        if not isinstance(values, str):
+            return super().shift_all(values)
+        lines = values.count('\n')
+        if not lines:
+            return LinePosition(self._line, self._col + len(values))
+        return LinePosition(self._line + lines,
+                            len(values) - values.rfind('\n') - 1)
+
     def __repr__(self):
         return 'line {}, column {}'.format(self._line, self._col)
 
@@ -304,7 +509,7 @@ class LinePosition(Position):
         return self._line, self._col
 
 
-class RewindIterator(collections.Iterator):
+class RewindIterator(collections.abc.Iterator):
     """Wrapper around some backing type that provides standard iterator features
     as well as allowing for setting and deleting backtracking points.
     """
@@ -313,6 +518,33 @@ class RewindIterator(collections.Iterator):
         """Create a new rewind iterator."""
         self._points = []
         self._position = position if position is not None else BasicPosition()
+        self._failure_offset = -1
+        self._failure_position = None
+        self._failure_unexpected = None
+        self._failure_parsers = []
+        self._budget = None
+        self._max_lookback = None
+        # The label of the innermost labeled parser being run, which names
+        # the rewind points made inside it.
+        self.label = None
+
+    def reset(self, data, position=None):
+        """Start over on new data of the same kind, so that one iterator can
+        be reused for many parses.
+
+        Rewind points, failures and the budget are dropped; a maximum lookback
+        is kept.
+
+        :param data: the new data
+        :param position: the position of the start of the data
+        """
+        if self._points:
+            self._points = []
+        self._position = position if position is not None else BasicPosition()
+        if self._failure_offset >= 0:
+            self.clear_failures()
+        self._budget = None
+        self.label = None
 
     def __next__(self):
         """Return the next element of the backing data."""
@@ -333,20 +565,128 @@ class RewindIterator(collections.Iterator):
     def index(self, index):
         raise NotImplementedError
 
+    @property
+    def offset(self):
+        """The number of elements read so far, counting from the start of the
+        data rather than from any trimmed buffer.
+        """
+        return self.index
+
     @property
     def position(self):
         """The position in the data the rewind iterator is currently at."""
         return self._position
 
-    def rewind_point(self):
+    @property
+    def failure_position(self):
+        """The position of the farthest failure recorded so far, or None if
+        nothing has failed.
+        """
+        return self._failure_position
+
+    def record_failure(self, parser):
+        """Record that a parser failed at the current offset.
+
+        Only the failures at the farthest offset reached are kept, and only
+        the parsers themselves are stored; what they expected is worked out
+        by parse_error if the parse as a whole fails.
+
+        :param parser: the parser that failed
+        """
+        offset = self.offset
+        if offset > self._failure_offset:
+            self._failure_offset = offset
+            self._failure_position = self._position
+            self._failure_unexpected = parser.unexpected_at(self)
+            self._failure_parsers = [parser]
+        elif offset == self._failure_offset:
+            self._failure_parsers.append(parser)
+
+    def clear_failures(self):
+        """Forget every failure recorded so far, before parsing something
+        new from the same iterator.
+        """
+        self._failure_offset = -1
+        self._failure_position = None
+        self._failure_unexpected = None
+        self._failure_parsers = []
+
+    def failure_mark(self):
+        """Mark the failures recorded so far, for use with relabel_failures.
+
+        :return: the mark
+        """
+        return self._failure_offset, len(self._failure_parsers)
+
+    def relabel_failures(self, start, mark, parser):
+        """Replace the failures recorded at an offset since a mark with a
+        single failure of the given parser.
+
+        :param start: the offset the parser started at
+        :param mark: a mark from failure_mark, taken when the parser started
+        :param parser: the parser to record instead
+        """
+        if self._failure_offset != start:
+            return
+        offset, count = mark
+        if offset != start:
+            count = 0
+        if len(self._failure_parsers) > count:
+            del self._failure_parsers[count:]
+            self._failure_parsers.append(parser)
+
+    @property
+    def failure_unexpected(self):
+        """What was found at the farthest failure recorded so far, which is
+        END if the data ran out there.
+        """
+        return self._failure_unexpected
+
+    @property
+    def failure_expected(self):
+        """What the parsers that failed farthest expected, in the order they
+        failed.
+        """
+        expected = []
+        for parser in self._failure_parsers:
+            for label in parser.expected:
+                if label not in expected:
+                    expected.append(label)
+        return expected
+
+    def parse_error(self, locate=None):
+        """Build an error describing the farthest failure recorded.
+
+        :param locate: a function from the position of the failure to the
+            position to report, or None to report it as it is
+        :return: the ParseError
+        """
+        if not self._failure_parsers:
+            position = self._position
+            unexpected = self.peek()
+        else:
+            position = self._failure_position
+            unexpected = self._failure_unexpected
+        if locate is not None:
+            position = locate(position)
+        return result.ParseError(result.describe_failure(
+            unexpected,
+            position,
+            self.failure_expected
+        ))
+
+    def rewind_point(self, owner=None):
         """Create a new rewind point at the current index.
 
         The point can be used to rewind the iterator to the state it was at when
         the point was created.
 
+        :param owner: the parser making the point, named in errors if the
+            point holds too much data
         :return: the rewind point
         """
-        point = RewindPoint(self, self.index, self._position)
+        point = RewindPoint(self, self.index, self._position, owner,
+                            self.label)
         self._points.append(point)
         return point
 
@@ -356,9 +696,44 @@ class RewindIterator(collections.Iterator):
         :param point: the point to rewind to
         :return:
         """
+        if point.released:
+            raise ValueError('Cannot rewind past a commit')
+        self.spend_steps(self.index - point.index)
         self.index = point.index
         self._position = point.position
 
+    def spend_steps(self, steps=1):
+        """Charge steps of parsing work to the budget, if there is one.
+
+        Repeated parsers charge a step for every repetition, so that the
+        budget also bounds parses that never rewind.
+
+        :param steps: the number of steps to charge
+        """
+        if self._budget is not None:
+            self._budget.spend(steps)
+
+    def set_budget(self, budget):
+        """Limit the work done through this iterator.
+
+        Every rewind spends the number of elements it rewinds past, and every
+        repetition of a repeated parser spends a step.
+
+        :param budget: the ParseBudget to spend from, or None for no limit
+        """
+        self._budget = budget
+
+    def set_max_lookback(self, max_lookback):
+        """Limit how many elements can be kept for rewinding.
+
+        Only iterators that buffer their data, such as stream rewind
+        iterators, are affected; the others keep nothing.
+
+        :param max_lookback: the most elements before the current one that can
+            be kept, or None for no limit
+        """
+        self._max_lookback = max_lookback
+
     def forget(self, point):
         """Forget a point.
 
@@ -368,25 +743,193 @@ class RewindIterator(collections.Iterator):
 
         :param point: the point to forget
         """
-        self._points.remove(point)
+        if point.released:
+            return
+        # Points compare equal by index, so find this one by identity. Points
+        # are usually forgotten in the reverse of the order they were made.
+        points = self._points
+        for i in range(len(points) - 1, -1, -1):
+            if points[i] is point:
+                del points[i]
+                return
+        raise ValueError('Unknown rewind point')
+
+    def commit(self):
+        """Release every rewind point, promising never to rewind before the
+        current index.
+
+        Released points can still be forgotten, but rewinding to one raises a
+        ValueError.
+        """
+        for point in self._points:
+            point.released = True
+        self._points = []
+
+    def peek(self):
+        """Return the next element of the backing data without advancing past
+        it.
+
+        :return: the next element, or END if there are no more elements
+        """
+        with self.rewind_point() as point:
+            try:
+                value = next(self)
+            except StopIteration:
+                return END
+            self.rewind_to(point)
+            return value
+
+    def advance(self):
+        """Advance past the next element.
+
+        There must be a next element; check with peek first.
+        """
+        next(self)
+
+    def match_sequence(self, seq):
+        """Match a sequence of elements against the upcoming elements,
+        advancing past them only if they all match.
+
+        :param seq: the elements to match
+        :return: whether the sequence matched
+        """
+        with self.rewind_point() as point:
+            for expected in seq:
+                value = self.peek()
+                if value is END or value != expected:
+                    self.rewind_to(point)
+                    return False
+                self.advance()
+            return True
+
+    def match_token(self, pattern, charset):
+        """Match a compiled regular expression against the upcoming elements,
+        advancing past the match if there is one.
+
+        Only the run of upcoming elements that are all in charset is matched
+        against, so the pattern must never need to look beyond such a run.
+
+        Byte values are matched as the characters they stand for.
+
+        :param pattern: the compiled pattern to match
+        :param charset: the elements a match can be made of
+        :return: the matched text, or None if the pattern didn't match
+        """
+        run = []
+        with self.rewind_point() as point:
+            value = self.peek()
+            while value is not END and _as_char(value) in charset:
+                run.append(_as_char(value))
+                self.advance()
+                value = self.peek()
+            self.rewind_to(point)
+        match = pattern.match(''.join(run))
+        if match is None:
+            return None
+        token = match.group()
+        for _ in range(len(token)):
+            self.advance()
+        return token
+
+    def match_run(self, char_class):
+        """Advance past the run of upcoming elements in a character class,
+        if this iterator can do that in one go.
+
+        :param char_class: the CharClass the elements must be in
+        :return: the run of elements, or None if the iterator can't match runs
+        """
+        return None
+
+    def skip_trivia(self, trivia):
+        """Skip past any whitespace and comments at the current index.
+
+        :param trivia: the trivia to skip
+        :return: whether anything was skipped
+        """
+        skipped = False
+        while self._skip_trivia_item(trivia):
+            skipped = True
+        return skipped
+
+    def _skip_trivia_item(self, trivia):
+        """Internal method to skip a single whitespace element or comment."""
+        value = self.peek()
+        if value is END:
+            return False
+        if _as_char(value) in trivia.whitespace:
+            self.advance()
+            return True
+        if trivia.line_comment is not None:
+            if self.match_sequence(_as_elements(trivia.line_comment, value)):
+                self._skip_line()
+                return True
+        if trivia.block_comment is not None:
+            opener, closer = (_as_elements(literal, value)
+                              for literal in trivia.block_comment)
+            with self.rewind_point() as point:
+                if self.match_sequence(opener) and self._skip_past(closer):
+                    return True
+                self.rewind_to(point)
+        return False
+
+    def _skip_line(self):
+        """Internal method to read past the next newline or to the end."""
+        value = self.peek()
+        while value is not END:
+            self.advance()
+            if _as_char(value) == '\n':
+                return
+            value = self.peek()
+
+    def _skip_past(self, literal):
+        """Internal method to read past the next occurrence of literal,
+        returning if there was one.
+        """
+        # Restarting the match on a mismatch would miss closers that overlap
+        # a false start, such as --> in --->, so the last elements read are
+        # kept and compared instead.
+        target = tuple(literal)
+        window = collections.deque(maxlen=len(target))
+        while tuple(window) != target:
+            value = self.peek()
+            if value is END:
+                return False
+            self.advance()
+            window.append(value)
+        return True
 
     @staticmethod
-    def make_rewind_iterator(data):
+    def make_rewind_iterator(data, position=None):
         """Create a new rewind iterator, specializing it based on the type of
         the data.
 
         For efficiency, a static rewind iterator is used, but it only works if
         the data supports indexing (has the __getitem__ method defined.)
-        Iterables and iterators are made into a stream rewinder. Other values
-        are not supported.
+        Strings, bytes-like objects and arrays get static rewind iterators
+        specialized to their type.
+        File objects are read in chunks through a FileSource, and they and
+        other iterables and iterators are made into a stream rewinder. Other
+        values are not supported.
 
         :param data: the data to wrap
+        :param position: the position of the start of the data
         :return: the rewind iterator
         """
-        if hasattr(data, '__getitem__'):
-            return StaticRewindIterator(data)
+        if isinstance(data, str):
+            return StringRewindIterator(data, position)
+        elif isinstance(data, (bytes, bytearray)):
+            return BytesRewindIterator(data, position)
+        elif isinstance(data, memoryview) and data.format == 'B':
+            return BytesRewindIterator(data, position)
+        elif isinstance(data, array.array):
+            return ArrayRewindIterator(data, position)
+        elif hasattr(data, '__getitem__'):
+            return StaticRewindIterator(data, position)
+        elif hasattr(data, 'read'):
+            return StreamRewindIterator(source.FileSource(data, closefd=False),
+                                        position)
         elif hasattr(data, '__iter__'):
-            return StreamRewindIterator(data)
+            return StreamRewindIterator(data, position)
         # TODO: customize exception
         raise Exception
 
@@ -399,30 +942,89 @@ class StreamRewindIterator(RewindIterator):
     before the first rewind point can be deleted at any time.
     """
 
-    def __init__(self, iterable, position=None):
+    def __init__(self, iterable, position=None, max_lookback=None):
         """Create a new stream rewind iterator.
 
         The iterable has to support either __iter__ or __next__.
 
         :param iterable: the iterable stream to wrap
+        :param max_lookback: the most elements before the current one that can
+            be kept for rewinding, or None for no limit
         """
         super().__init__(position)
         self._iterator = iter(iterable)
         self._store = Zipper()
+        # Number of elements read that are no longer in the store.
+        self._base = 0
+        self._max_lookback = max_lookback
+
+    def reset(self, data, position=None):
+        super().reset(data, position)
+        if hasattr(data, 'read'):
+            data = source.FileSource(data, closefd=False)
+        self._iterator = iter(data)
+        self._store = Zipper()
+        self._base = 0
 
     def _next(self):
         if self._store.is_at_end:
             value = next(self._iterator)
             if not self._points:
+                self._base += 1
                 return value
             self._store.append(value)
         else:
             value = self._store.cur_item
         self._store.advance()
         if not self._points and self._store.is_at_end:
+            self._base += len(self._store)
             self._store = Zipper()
+        elif (self._max_lookback is not None and
+              self._store.index > self._max_lookback):
+            self._check_lookback()
         return value
 
+    def _check_lookback(self):
+        """Internal method to drop the elements before the earliest rewind
+        point, raising LookbackExceeded if that isn't enough.
+        """
+        if not self._points:
+            return
+        earliest = min(self._points, key=lambda point: point.index)
+        new_start = self._store.delete_up_to(earliest.index)
+        self._base += new_start
+        for point in self._points:
+            point.index -= new_start
+        if self._store.index <= self._max_lookback:
+            return
+        owner = earliest.owner
+        if owner is None:
+            holder = 'the iterator'
+        else:
+            holder = type(owner).__name__
+            if owner.expected:
+                holder += ' expecting ' + ', '.join(map(str, owner.expected))
+        if earliest.label is not None:
+            holder += ' in {}'.format(earliest.label)
+        raise result.LookbackExceeded(
+            'Kept more than {} elements for rewinding to offset {} ({}), '
+            'held by {}'.format(self._max_lookback,
+                                self._base + earliest.index,
+                                earliest.position, holder),
+            owner,
+            earliest.position
+        )
+
+    def peek(self):
+        if self._store.is_at_end:
+            try:
+                value = next(self._iterator)
+            except StopIteration:
+                return END
+            self._store.append(value)
+            return value
+        return self._store.cur_item
+
     @property
     def index(self):
         return self._store.index
@@ -431,6 +1033,14 @@ class StreamRewindIterator(RewindIterator):
     def index(self, index):
         self._store.index = index
 
+    @property
+    def offset(self):
+        return self._base + self._store.index
+
+    def commit(self):
+        super().commit()
+        self._base += self._store.delete_up_to(self._store.index)
+
     def forget(self, point):
         super().forget(point)
         if self._points and point.index == 0:
@@ -439,6 +1049,7 @@ class StreamRewindIterator(RewindIterator):
                 if earliest is None or point.index < earliest.index:
                     earliest = point
             new_start = self._store.delete_up_to(earliest.index)
+            self._base += new_start
             for point in self._points:
                 point.index -= new_start
 
@@ -462,6 +1073,11 @@ class StaticRewindIterator(RewindIterator):
         self._data = data
         self._index = 0
 
+    def reset(self, data, position=None):
+        super().reset(data, position)
+        self._data = data
+        self._index = 0
+
     def _next(self):
         if self._index >= len(self._data):
             raise StopIteration
@@ -469,6 +1085,21 @@ class StaticRewindIterator(RewindIterator):
         self._index += 1
         return value
 
+    def peek(self):
+        if self._index >= len(self._data):
+            return END
+        return self._data[self._index]
+
+    def advance(self):
+        value = self._data[self._index]
+        self._index += 1
+        self._position = self._position.shift(value)
+
+    @property
+    def data(self):
+        """The backing data, for primitives that can work on it directly."""
+        return self._data
+
     @property
     def index(self):
         return self._index
@@ -476,3 +1107,144 @@ class StaticRewindIterator(RewindIterator):
     @index.setter
     def index(self, index):
         self._index = index
+
+
+class _SequenceRewindIterator(StaticRewindIterator):
+    """Static rewind iterator for built-in sequences, whose length is fixed
+    and can be checked once up front.
+    """
+
+    def __init__(self, data, position=None):
+        super().__init__(data, position)
+        self._end = len(data)
+
+    def reset(self, data, position=None):
+        super().reset(data, position)
+        self._end = len(data)
+
+    def __next__(self):
+        index = self._index
+        if index >= self._end:
+            raise StopIteration
+        value = self._data[index]
+        self._index = index + 1
+        self._position = self._position.shift(value)
+        return value
+
+    def peek(self):
+        if self._index >= self._end:
+            return END
+        return self._data[self._index]
+
+
+class StringRewindIterator(_SequenceRewindIterator):
+    """Static rewind iterator specialized for strings.
+
+    Literals are matched with str.startswith, and tokens and trivia are matched
+    with regular expressions directly against the string, without stepping
+    through elements.
+    """
+
+    def match_sequence(self, seq):
+        if not isinstance(seq, str):
+            return super().match_sequence(seq)
+        if not self._data.startswith(seq, self._index):
+            return False
+        self._index += len(seq)
+        self._position = self._position.shift_all(seq)
+        return True
+
+    def match_token(self, pattern, charset):
+        match = pattern.match(self._data, self._index)
+        if match is None:
+            return None
+        token = match.group()
+        self._position = self._position.shift_all(token)
+        self._index = match.end()
+        return token
+
+    def match_run(self, char_class):
+        if not isinstance(char_class.chars, str):
+            return None
+        end = char_class.pattern.match(self._data, self._index).end()
+        run = self._data[self._index:end]
+        self._position = self._position.shift_all(run)
+        self._index = end
+        return run
+
+    def skip_trivia(self, trivia):
+        end = trivia.pattern.match(self._data, self._index).end()
+        if end == self._index:
+            return False
+        self._position = self._position.shift_all(self._data[self._index:end])
+        self._index = end
+        return True
+
+
+class BytesRewindIterator(_SequenceRewindIterator):
+    """Static rewind iterator specialized for bytes, bytearrays and byte
+    memoryviews.
+
+    Literals are matched by comparing a slice of the data in one go, and
+    tokens and trivia are matched with regular expressions compiled for bytes.
+    Patterns with characters outside latin-1 are matched element by element
+    instead.
+    """
+
+    def match_sequence(self, seq):
+        if not isinstance(seq, (bytes, bytearray)):
+            return super().match_sequence(seq)
+        end = self._index + len(seq)
+        if self._data[self._index:end] != seq:
+            return False
+        self._index = end
+        self._position = self._position.shift_all(seq)
+        return True
+
+    def match_token(self, pattern, charset):
+        byte_pattern = _byte_pattern(pattern)
+        if byte_pattern is None:
+            return super().match_token(pattern, charset)
+        match = byte_pattern.match(self._data, self._index)
+        if match is None:
+            return None
+        token = match.group()
+        self._position = self._position.shift_all(token)
+        self._index = match.end()
+        return token.decode('latin-1')
+
+    def match_run(self, char_class):
+        if not isinstance(char_class.chars, bytes):
+            return None
+        end = char_class.pattern.match(self._data, self._index).end()
+        run = self._data[self._index:end]
+        self._position = self._position.shift_all(run)
+        self._index = end
+        return run
+
+    def skip_trivia(self, trivia):
+        pattern = _byte_pattern(trivia.pattern)
+        if pattern is None:
+            return super().skip_trivia(trivia)
+        end = pattern.match(self._data, self._index).end()
+        if end == self._index:
+            return False
+        self._position = self._position.shift_all(self._data[self._index:end])
+        self._index = end
+        return True
+
+
+class ArrayRewindIterator(_SequenceRewindIterator):
+    """Static rewind iterator specialized for array.array data.
+
+    Literals are matched by comparing a slice of the array in one go.
+    """
+
+    def match_sequence(self, seq):
+        values = list(seq)
+        end = self._index + len(values)
+        if self._data[self._index:end].tolist() != values:
+            return False
+        self._index = end
+        self._position = self._position.shift_all(values)
+        return True
@@ -5,6 +5,27 @@ from persimmon.utils import (
 )
 
 
+def pytest_addoption(parser):
+    parser.addoption('--run-slow', action='store_true',
+                     help='run slow tests, such as wall-clock timings')
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'slow: slow or timing-sensitive, run with --run-slow'
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Timings are unreliable on loaded machines, so they're run on request.
+    if config.getoption('--run-slow'):
+        return
+    skip = pytest.mark.skip(reason='slow, run with --run-slow')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(params=[
     (StreamRewindIterator, range(1, 10)),
     (StaticRewindIterator, list(range(1, 10)))
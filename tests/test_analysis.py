@@ -0,0 +1,72 @@
+import pytest
+
+from persimmon import (
+    any_elem, delayed, digit, elem, eof, none_of, one_of, string, success
+)
+from persimmon.analysis import analyze
+
+
+def kinds(parser):
+    return [issue.kind for issue in analyze(parser).issues]
+
+
+@pytest.mark.parametrize('parser', [
+    success(1).zero_or_more,
+    none_of('x').zero_or_more.zero_or_more,
+    success(1).fold(0, lambda a, b: a),
+    digit.zero_or_more.zero_or_more_sep_by(success(None)),
+    success(1).zero_or_more_end_by(success(None)),
+])
+def test_repeating_nullable_parsers_loops_forever(parser):
+    assert kinds(parser) == ['infinite loop']
+
+
+@pytest.mark.parametrize('parser', [
+    digit.zero_or_more,
+    success(1).repeat_between(0, 3),
+    digit.zero_or_more.zero_or_more_sep_by(string(',')),
+])
+def test_terminating_repeats_are_not_flagged(parser):
+    assert kinds(parser) == []
+
+
+def test_nullability_and_first_sets():
+    digits = digit.zero_or_more
+    parser = digits & string('ab')
+    analysis = analyze(parser)
+    assert analysis.is_nullable(digits)
+    assert not analysis.is_nullable(parser)
+    assert analysis.first(parser) == {'digit', 'a'}
+
+
+def test_recursive_grammars_reach_a_fixed_point():
+    parens = delayed(lambda self: (string('(') & self & string(')')) |
+                     success(None))
+    analysis = analyze(parens & eof)
+    assert analysis.is_nullable(parens)
+    assert analysis.first(parens) == {'('}
+    assert analysis.issues == []
+
+
+@pytest.mark.parametrize('parser', [
+    string('a') | string('ab'),
+    elem('a') | string('ab'),
+    (string('[') & digit) | (string('[') & any_elem),
+    digit | digit,
+])
+def test_unreachable_alternatives_are_shadowed(parser):
+    assert kinds(parser) == ['shadowed alternative']
+
+
+def test_attempted_shared_prefixes_backtrack():
+    parser = (string('[') & digit).attempt | (string('[') & any_elem)
+    assert kinds(parser) == ['backtracking']
+
+
+@pytest.mark.parametrize('parser', [
+    string('ab') | string('ac'),
+    one_of('ab') | digit,
+    success(None) | digit,
+])
+def test_distinct_alternatives_are_not_flagged(parser):
+    assert kinds(parser) == []
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from persimmon import delayed, elem, eof, string, success
+from persimmon.cache import ParseCache
+from persimmon.result import ParseBudgetExceeded, ParseError
+
+
+# Tries both alternatives at every level before failing, so it backtracks
+# exponentially on a run of a's that doesn't end in b or c.
+nested = delayed(
+    lambda self: (elem('a') & self & elem('b')).attempt
+    | (elem('a') & self & elem('c')).attempt
+    | success(None)
+)
+grammar = nested & eof
+
+
+def test_parses_within_budget_succeed():
+    assert grammar.parse('aacb', max_steps=100) is None
+
+
+def test_step_budget_stops_runaway_backtracking():
+    with pytest.raises(ParseBudgetExceeded) as error:
+        grammar.parse('a' * 30 + 'd', max_steps=1000)
+    assert str(error.value) == 'Took more than 1000 steps'
+
+
+def test_budget_is_not_a_parse_error():
+    assert not issubclass(ParseBudgetExceeded, ParseError)
+
+
+def test_ordinary_failures_still_raise_parse_errors():
+    with pytest.raises(ParseError):
+        grammar.parse('ad', max_steps=1000)
+
+
+def test_passed_deadline_stops_parse():
+    with pytest.raises(ParseBudgetExceeded):
+        grammar.parse('a' * 30 + 'd', deadline=time.monotonic())
+
+
+def test_budget_applies_to_cached_parses():
+    cache = ParseCache()
+    with pytest.raises(ParseBudgetExceeded):
+        grammar.parse('a' * 30 + 'd', cache=cache, max_steps=1000)
+    assert cache.cache_info().entries == 0
+
+
+def test_stream_input_is_budgeted():
+    with pytest.raises(ParseBudgetExceeded):
+        grammar.parse(iter('a' * 30 + 'd'), max_steps=1000)
+
+
+def test_step_budget_stops_loops_that_never_rewind():
+    with pytest.raises(ParseBudgetExceeded) as error:
+        success(1).zero_or_more.parse('', max_steps=1000)
+    assert str(error.value) == 'Took more than 1000 steps'
+
+
+def test_deadline_stops_loops_that_never_rewind():
+    with pytest.raises(ParseBudgetExceeded):
+        success(1).zero_or_more.parse('', deadline=time.monotonic() + 0.1)
+
+
+def test_long_linear_parses_are_budgeted():
+    words = string('ab').zero_or_more & eof
+    assert len(words.parse('ab' * 100, max_steps=1000)) == 100
+    with pytest.raises(ParseBudgetExceeded):
+        words.parse('ab' * 1000, max_steps=1000)
@@ -0,0 +1,107 @@
+import pytest
+
+from persimmon import digit, eof, satisfy, string
+from persimmon.cache import ParseCache
+from persimmon.result import ParseError
+
+
+digits = digit.one_or_more & eof
+
+
+def test_repeated_parses_hit_the_cache():
+    cache = ParseCache()
+    assert digits.parse('123', cache=cache) == [1, 2, 3]
+    assert digits.parse('123', cache=cache) == [1, 2, 3]
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+
+
+def test_cache_is_keyed_by_parser():
+    cache = ParseCache()
+    other = digit.one_or_more.map(sum) & eof
+    assert digits.parse('12', cache=cache) == [1, 2]
+    assert other.parse('12', cache=cache) == 3
+    assert cache.cache_info().misses == 2
+
+
+def test_iterators_are_not_cached():
+    cache = ParseCache()
+    assert digits.parse(iter('12'), cache=cache) == [1, 2]
+    assert digits.parse(iter('12'), cache=cache) == [1, 2]
+    assert cache.cache_info() == (0, 0, 0, 0)
+
+
+def test_byte_arrays_are_keyed_by_contents():
+    cache = ParseCache()
+    parser = string(b'ab') & eof
+    parser.parse(bytearray(b'ab'), cache=cache)
+    parser.parse(b'ab', cache=cache)
+    assert cache.cache_info().hits == 1
+
+
+def test_elements_of_different_types_are_keyed_apart():
+    cache = ParseCache()
+    parser = satisfy.map(type) & eof
+    assert parser.parse((1,), cache=cache) is int
+    assert parser.parse((True,), cache=cache) is bool
+    assert cache.cache_info().hits == 0
+
+
+def test_failures_are_cached():
+    cache = ParseCache()
+    for _ in range(2):
+        with pytest.raises(ParseError) as info:
+            digits.parse('1a', cache=cache)
+        assert 'Expecting digit, end of file' in str(info.value)
+    assert cache.cache_info().hits == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ParseCache(max_entries=2)
+    digits.parse('1', cache=cache)
+    digits.parse('2', cache=cache)
+    digits.parse('1', cache=cache)
+    digits.parse('3', cache=cache)
+    digits.parse('1', cache=cache)
+    assert cache.cache_info().hits == 2
+    digits.parse('2', cache=cache)
+    assert cache.cache_info().hits == 2
+
+
+def test_byte_bound_limits_cache_size():
+    cache = ParseCache(max_bytes=400)
+    for data in ['1', '12', '123', '1234', '12345']:
+        digits.parse(data, cache=cache)
+    info = cache.cache_info()
+    assert 0 < info.bytes <= 400
+    assert info.entries < 5
+
+
+def test_copied_results_cant_corrupt_the_cache():
+    cache = ParseCache()
+    digits.parse('12', cache=cache).append(3)
+    digits.parse('12', cache=cache).append(4)
+    assert digits.parse('12', cache=cache) == [1, 2]
+
+
+def test_frozen_results_are_immutable():
+    cache = ParseCache(results='freeze')
+    assert digits.parse('12', cache=cache) == (1, 2)
+    assert digits.parse('12', cache=cache) == (1, 2)
+
+
+def test_shared_results_are_the_cached_value():
+    cache = ParseCache(results='shared')
+    assert digits.parse('12', cache=cache) is digits.parse('12', cache=cache)
+
+
+def test_unknown_result_mode_is_rejected():
+    with pytest.raises(ValueError):
+        ParseCache(results='mutable')
+
+
+def test_clear_resets_the_cache():
+    cache = ParseCache()
+    digits.parse('12', cache=cache)
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 0, 0)
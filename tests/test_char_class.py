@@ -0,0 +1,67 @@
+import pytest
+
+from persimmon import eof, none_of, one_of, string
+from persimmon.result import ParseError
+from persimmon.utils import (
+    CharClass, LinePosition, StaticRewindIterator, StringRewindIterator
+)
+
+
+_cell = none_of(',\n').zero_or_more.map(''.join)
+_row = _cell.zero_or_more_sep_by(string(','))
+
+
+def test_char_class_membership():
+    assert CharClass('ab')('a')
+    assert not CharClass('ab', negated=True)('a')
+    assert CharClass(b'ab')(ord('a'))
+    assert CharClass('', negated=True)('x')
+
+
+def test_one_of_and_none_of_have_char_classes():
+    assert one_of('ab').char_class.chars == 'ab'
+    assert none_of('ab').char_class.negated
+    assert one_of(['a', 'b']).char_class is None
+    assert none_of('ab').map(str.upper).char_class is None
+
+
+def test_runs_match_element_by_element_parsing():
+    data = 'ab,,cd e\n,x]\\^-'
+    grammar = one_of('abcd ').zero_or_more & none_of('\n]^\\-').zero_or_more
+    expected = grammar.do_parse(StaticRewindIterator(data))
+    actual = grammar.do_parse(StringRewindIterator(data))
+    assert actual.values == expected.values
+    assert actual.consumed == expected.consumed
+
+
+def test_run_of_special_characters():
+    assert none_of(']^\\-').zero_or_more.parse('ab]') == ['a', 'b']
+    assert one_of(']^\\-').one_or_more.parse('^-]\\a') == ['^', '-', ']', '\\']
+
+
+def test_runs_over_bytes():
+    grammar = none_of(b',').zero_or_more.map(bytes) & string(b',').noisy
+    assert grammar.parse(b'abc,') == b'abc'
+
+
+def test_run_updates_position():
+    iterator = StringRewindIterator('ab\ncd,', LinePosition())
+    _cell.do_parse(iterator)
+    assert iterator.position.value == (1, 2)
+    iterator.index = 3
+    assert iterator.match_run(none_of(',').char_class) == 'cd'
+
+
+def test_error_after_run_matches_element_by_element_parsing():
+    grammar = one_of('ab').one_or_more & eof
+    with pytest.raises(ParseError) as error:
+        grammar.parse('abx')
+    assert str(error.value) == 'Unexpected "x" at 2\nExpecting ab, end of file'
+
+
+def test_bounded_repeat_steps_through_elements():
+    assert one_of('a').repeat_between(0, 2).parse('aaa') == ['a', 'a']
+
+
+def test_csv_rows():
+    assert _row.parse('a,bc,,d') == ['a', 'bc', '', 'd']
@@ -0,0 +1,112 @@
+import io
+import pickle
+
+import pytest
+
+from persimmon import checkpoint as checkpoint_module
+from persimmon import integer, none_of, string
+from persimmon.checkpoint import parse_items
+from persimmon.result import ParseError
+from persimmon.utils import LinePosition
+
+
+_line = none_of('\n').zero_or_more.map(''.join) & string('\n').noisy
+_number = integer & string('\n').noisy
+
+
+def _values(pairs):
+    return [value for value, _ in pairs]
+
+
+def test_items_parsed_in_order():
+    assert _values(parse_items(_number, '1\n22\n333\n')) == [1, 22, 333]
+
+
+def test_checkpoints_count_items_and_offsets():
+    checkpoints = [c for _, c in parse_items(_number, '1\n22\n')]
+    assert [c.items for c in checkpoints] == [1, 2]
+    assert [c.offset for c in checkpoints] == [2, 5]
+
+
+def test_unfinished_item_is_left_for_later():
+    pairs = list(parse_items(_number, '1\n2'))
+    assert _values(pairs) == [1]
+    _, last = pairs[-1]
+    assert _values(parse_items(_number, '1\n23\n', last)) == [23]
+
+
+def test_invalid_item_raises():
+    with pytest.raises(ParseError):
+        list(parse_items(_number, '1\nx\n'))
+
+
+def test_positions_continue_after_resume():
+    data = 'a\nb\nc\n'
+    pairs = list(parse_items(_line, data[:4], position=LinePosition()))
+    _, last = pairs[-1]
+    assert last.position.value == (3, 0)
+    (_, resumed), = parse_items(_line, data, last)
+    assert resumed.position.value == (4, 0)
+    assert resumed.items == 3
+
+
+def test_resume_from_growing_binary_file(tmp_path):
+    path = tmp_path / 'log'
+    path.write_bytes(b'first\nsecond\nthi')
+    with open(path, 'rb') as f:
+        pairs = list(parse_items(_line_bytes(), f))
+    assert _values(pairs) == [b'first', b'second']
+    _, last = pairs[-1]
+    with open(path, 'ab') as f:
+        f.write(b'rd\nfourth\n')
+    with open(path, 'rb') as f:
+        pairs = list(parse_items(_line_bytes(), f, pickle.loads(
+            pickle.dumps(last)
+        )))
+    assert _values(pairs) == [b'third', b'fourth']
+    assert pairs[-1][1].items == 4
+
+
+def _line_bytes():
+    return none_of(b'\n').zero_or_more.map(bytes) & string(b'\n').noisy
+
+
+def test_resume_text_file_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(checkpoint_module, '_CHUNK_SIZE', 7)
+    lines = ['é{}ü'.format(i) for i in range(50)]
+    path = tmp_path / 'log.txt'
+    path.write_text(''.join(line + '\n' for line in lines[:30]),
+                    encoding='utf-8')
+    with open(path, encoding='utf-8') as f:
+        pairs = list(parse_items(_line, f))
+    assert _values(pairs) == lines[:30]
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(''.join(line + '\n' for line in lines[30:]))
+    for _, checkpoint in pairs[::7]:
+        with open(path, encoding='utf-8') as f:
+            resumed = _values(parse_items(_line, f, checkpoint))
+        assert resumed == lines[checkpoint.items:]
+
+
+def test_resume_only_reads_from_checkpoint():
+    class CountingFile(io.BytesIO):
+        read_bytes = 0
+
+        def read(self, size=-1):
+            data = super().read(size)
+            self.read_bytes += len(data)
+            return data
+
+    data = b''.join(b'%d\n' % i for i in range(10000))
+    pairs = list(parse_items(_number_bytes(), CountingFile(data)))
+    _, last = pairs[-1]
+    grown = CountingFile(data + b'10000\n')
+    assert _values(parse_items(_number_bytes(), grown, last)) == [10000]
+    assert grown.read_bytes <= 1 << 16
+
+
+def _number_bytes():
+    return (
+        none_of(b'\n').one_or_more.map(lambda digits: int(bytes(digits))) &
+        string(b'\n').noisy
+    )
@@ -0,0 +1,74 @@
+import pytest
+
+from persimmon import cut, eof, integer, string
+from persimmon.result import ParseError
+from persimmon.utils import StreamRewindIterator
+
+
+_record = integer & string(';').noisy
+
+
+def test_commit_keeps_values():
+    assert _record.commit.parse('12;') == 12
+
+
+def test_cut_has_no_values():
+    assert (string('a') & cut).parse('a') == 'a'
+    assert (string('a') & cut & string('b')).parse('ab') == ['a', 'b']
+
+
+def test_attempt_backtracks_without_commit():
+    grammar = (string('a') & string('b')).attempt | string('ac')
+    assert grammar.parse('ac') == 'ac'
+
+
+def test_attempt_cant_backtrack_past_commit():
+    grammar = (string('a').commit & string('b')).attempt | string('ac')
+    with pytest.raises(ParseError) as error:
+        grammar.parse('ac')
+    assert 'Expecting b' in str(error.value)
+
+
+def test_match_cant_backtrack_past_commit():
+    grammar = (string('a').commit & string('b')).attempt | string('ac')
+    assert grammar.matches('ab')
+    assert not grammar.matches('ac')
+
+
+def test_commit_bounds_stream_buffer():
+    count = 1000
+    grammar = (_record.commit.zero_or_more & eof).attempt
+    buffered = []
+
+    def source():
+        for i in range(count):
+            for c in '{};'.format(i):
+                buffered.append(len(iterator._store))
+                yield c
+
+    iterator = StreamRewindIterator(source())
+    res = grammar.do_parse(iterator)
+    assert res.is_success
+    assert res.values == [list(range(count))]
+    assert max(buffered) < 10
+    assert iterator.offset == sum(len(str(i)) + 1 for i in range(count))
+
+
+def test_stream_buffer_grows_without_commit():
+    count = 1000
+    grammar = (_record.zero_or_more & eof).attempt
+    iterator = StreamRewindIterator(
+        c for i in range(count) for c in '{};'.format(i)
+    )
+    assert grammar.do_parse(iterator).is_success
+    assert len(iterator._store) > count
+
+
+def test_rewinding_to_released_point_raises():
+    iterator = StreamRewindIterator('abc')
+    with iterator.rewind_point() as point:
+        next(iterator)
+        iterator.commit()
+        with pytest.raises(ValueError):
+            iterator.rewind_to(point)
+    assert next(iterator) == 'b'
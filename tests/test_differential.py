@@ -0,0 +1,33 @@
+from persimmon import differential
+from persimmon.differential import Engine, ENGINES, STRESS_ENGINES
+
+
+def test_engines_agree_on_random_grammars():
+    for seed in range(60):
+        assert differential.differences(seed) == []
+
+
+def test_static_and_stream_agree_on_longer_inputs():
+    for seed in range(30):
+        assert differential.differences(seed, STRESS_ENGINES, inputs=40,
+                                        max_length=30) == []
+
+
+def _broken_parse(parser, iterator):
+    res = parser.do_parse(iterator)
+    if not res.is_success:
+        return False, None
+    return True, res.values + ['extra']
+
+
+def test_disagreeing_engines_are_reported():
+    broken = Engine('broken', ENGINES[0].make_factory,
+                    ENGINES[0].make_iterator, _broken_parse)
+    found = [
+        difference
+        for seed in range(10)
+        for difference in differential.differences(seed, [ENGINES[0], broken])
+    ]
+    assert found
+    assert all(d.engine == 'broken' for d in found)
+    assert all(d.actual[1] == d.expected[1] + ['extra'] for d in found)
@@ -0,0 +1,90 @@
+import pytest
+
+from persimmon import string, digit, eof, one_of
+from persimmon.result import ParseError
+from persimmon.utils import StaticRewindIterator, StreamRewindIterator
+
+
+def parens(elem):
+    return string('(') & elem & string(')')
+
+
+def brackets(elem):
+    return string('[') & elem & string(']')
+
+
+wrapped = parens(digit) | brackets(digit)
+
+
+def sources(*data):
+    return pytest.mark.parametrize(
+        'source',
+        list(data) + [iter(d) for d in data]
+    )
+
+
+def error_message(parser, source):
+    with pytest.raises(ParseError) as info:
+        parser.parse(source)
+    return str(info.value)
+
+
+@sources('[1)')
+def test_committed_choice_only_expects_its_own_continuation(source):
+    message = error_message(wrapped, source)
+    assert message == 'Unexpected ")" at 2\nExpecting ]'
+
+
+@sources('[a(')
+def test_committed_choice_expects_inner_parser(source):
+    message = error_message(wrapped, source)
+    assert message == 'Unexpected "a" at 1\nExpecting digit'
+
+
+@sources('x')
+def test_uncommitted_choice_expects_every_alternative(source):
+    message = error_message(wrapped, source)
+    assert message == 'Unexpected "x" at 0\nExpecting (, ['
+
+
+@sources('he')
+def test_literal_failure_shows_whole_unexpected_text(source):
+    message = error_message(string('hi'), source)
+    assert message == 'Unexpected "he" at 0\nExpecting hi'
+
+
+@sources('12a')
+def test_failures_at_same_offset_are_merged(source):
+    message = error_message(digit.zero_or_more & eof, source)
+    assert message == 'Unexpected "a" at 2\nExpecting digit, end of file'
+
+
+@sources('ab')
+def test_farthest_failure_wins_after_backtracking(source):
+    parser = (string('a') & string('c')).attempt | string('ab') & string('d')
+    message = error_message(parser, source)
+    assert message == 'Unexpected "end of input" at 2\nExpecting d'
+
+
+@sources('-')
+def test_label_replaces_failures_at_its_start(source):
+    sign = one_of('+-').labeled('sign')
+    number = (digit.one_or_more).labeled('number')
+    message = error_message(sign.zero_or_more & number, source)
+    assert message == 'Unexpected "end of input" at 1\nExpecting sign, number'
+
+
+@pytest.mark.parametrize('make_iterator', [
+    StaticRewindIterator, StreamRewindIterator
+])
+def test_offset_counts_from_start_of_data(make_iterator):
+    iterator = make_iterator('abcd')
+    next(iterator)
+    with iterator.rewind_point() as point:
+        next(iterator)
+        next(iterator)
+        assert iterator.offset == 3
+        iterator.rewind_to(point)
+    assert iterator.offset == 1
+    next(iterator)
+    assert iterator.offset == 2
@@ -0,0 +1,41 @@
+import operator
+
+from persimmon import digit, string, eof
+
+
+def test_fold_combines_items_into_accumulator():
+    parser = digit.fold(0, operator.add)
+    assert parser.parse('1234') == 10
+
+
+def test_fold_returns_initial_on_no_items():
+    parser = digit.fold(0, operator.add)
+    assert parser.parse('') == 0
+
+
+def test_fold_passes_all_chain_values():
+    pair = digit & string('=').noisy & digit
+    parser = pair.fold(0, lambda acc, key, value: acc + key * value)
+    assert parser.parse('1=23=4') == 14
+
+
+def test_sep_by_fold_combines_separated_items():
+    parser = digit.sep_by_fold(string(','), 0, operator.add) & eof
+    assert parser.parse('1,2,3') == 6
+
+
+def test_sep_by_fold_stops_before_unmatched_separator():
+    parser = digit.sep_by_fold(string(','), 0, operator.add)
+    assert parser.parse('1,2;3') == 3
+
+
+def test_sep_by_fold_fails_on_dangling_separator():
+    parser = digit.sep_by_fold(string(','), 0, operator.add) & eof
+    assert not parser.matches('1,2,')
+
+
+def test_sep_by_fold_matches_without_calling_func():
+    def fail(*_):
+        raise AssertionError
+    parser = digit.sep_by_fold(string(','), 0, fail) & eof
+    assert parser.matches('1,2,3')
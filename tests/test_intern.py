@@ -0,0 +1,88 @@
+import decimal
+
+import pytest
+
+from persimmon.standard import StandardParserFactory
+
+
+@pytest.fixture
+def factory():
+    return StandardParserFactory(intern=True)
+
+
+def test_factory_does_not_intern_by_default():
+    factory = StandardParserFactory()
+    assert factory.make_elem_parser('a') is not factory.make_elem_parser('a')
+    assert factory.interned_count == 0
+
+
+def test_equal_elems_are_shared(factory):
+    assert factory.make_elem_parser('a') is factory.make_elem_parser('a')
+    assert factory.make_elem_parser('a') is not factory.make_elem_parser('b')
+
+
+def test_combinators_over_shared_children_are_shared(factory):
+    def build():
+        digit = factory.make_digit_parser()
+        return (digit.one_or_more | factory.make_literal_parser('x')).labeled(
+            'thing'
+        )
+    assert build() is build()
+
+
+def test_satisfy_steps_are_compared_by_function(factory):
+    satisfy = factory.make_satisfy_parser()
+    assert satisfy.map(int) is satisfy.map(int)
+    assert satisfy.map(int) is not satisfy.map(float)
+
+
+def test_equal_values_of_different_types_are_not_shared(factory):
+    one = factory.make_success_parser(1)
+    assert factory.make_success_parser(True) is not one
+    assert factory.make_success_parser(True).parse('') is True
+
+
+def test_values_inside_containers_keep_their_types(factory):
+    pair = factory.make_success_parser((1, 1))
+    assert factory.make_success_parser((1, True)) is not pair
+    assert factory.make_success_parser((1, True)).parse('') == (1, True)
+    assert factory.make_literal_parser((1.0, 2.0)) is not (
+        factory.make_literal_parser((1, 2))
+    )
+    assert factory.make_one_of_parser(frozenset([1])) is not (
+        factory.make_one_of_parser(frozenset([True]))
+    )
+
+
+def test_signed_zeros_are_not_shared(factory):
+    zero = factory.make_success_parser(0.0)
+    assert factory.make_success_parser(-0.0) is not zero
+    assert str(factory.make_success_parser(-0.0).parse('')) == '-0.0'
+
+
+def test_decimals_with_different_exponents_are_not_shared(factory):
+    one = factory.make_success_parser(decimal.Decimal('1.0'))
+    assert factory.make_success_parser(decimal.Decimal('1.00')) is not one
+    value = factory.make_success_parser(decimal.Decimal('1.00')).parse('')
+    assert str(value) == '1.00'
+
+
+def test_unhashable_arguments_are_not_shared(factory):
+    literal = factory.make_literal_parser([1, 2])
+    assert literal is not factory.make_literal_parser([1, 2])
+    assert literal.parse([1, 2]) == [1, 2]
+
+
+def test_unused_parsers_are_released(factory):
+    factory.make_elem_parser('a')
+    assert factory.interned_count == 0
+
+
+def test_walk_counts_shared_nodes_once(factory):
+    a = factory.make_elem_parser('a')
+    grammar = factory.make_chain_parser([a, a, a])
+    plain = StandardParserFactory()
+    unshared = plain.make_chain_parser([plain.make_elem_parser('a')
+                                        for _ in range(3)])
+    shared_count = sum(1 for _ in grammar.walk())
+    assert sum(1 for _ in unshared.walk()) == 1 + 3 * (shared_count - 1)
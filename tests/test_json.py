@@ -0,0 +1,142 @@
+import io
+import itertools
+import json as std_json
+
+import pytest
+
+from persimmon import json, string, eof
+from persimmon.result import ParseError
+from persimmon.source import open_source
+
+
+documents = [
+    '0',
+    '-12',
+    '1.5e10',
+    '-0.25E-3',
+    'true',
+    'null',
+    '""',
+    '"plain"',
+    r'"esc \" \\ \/ \b \f \n \r \t"',
+    r'"é 😀 \ud800x"',
+    '[]',
+    '{}',
+    ' [1, {"a": [true, false, null]}, "x"] ',
+    '{"a": {"b": {"c": [[[]]]}}}',
+    '{"a": 1, "a": 2}',
+]
+
+
+@pytest.mark.parametrize('document', documents)
+def test_loads_matches_stdlib(document):
+    assert json.loads(document) == std_json.loads(document)
+
+
+@pytest.mark.parametrize('document', documents)
+def test_loads_matches_stdlib_on_streams(document):
+    assert json.loads(iter(document)) == std_json.loads(document)
+
+
+@pytest.mark.parametrize('document', [
+    '', '[1,]', '{"a" 1}', '[1 2]', '01', '"abc', '{"a":1,}', 'tru',
+    '"\x01"', '[1]x', r'"\x"', '{1:2}', '-', '1.', '[', r'"\u12"',
+])
+def test_loads_rejects_invalid_documents(document):
+    with pytest.raises(ParseError):
+        json.loads(document)
+
+
+def test_deep_nesting_doesnt_recurse():
+    depth = 10000
+    value = json.loads('[' * depth + ']' * depth)
+    for _ in range(depth - 1):
+        value, = value
+    assert value == []
+
+
+def test_deep_nesting_streams_in_linear_time():
+    # Brackets used to be matched as tokens, which read ahead through the
+    # whole run of brackets for every one of them.
+    depth = 20000
+    document = '[' * depth + ']' * depth
+    events = list(json.events(iter(document)))
+    assert len(events) == 2 * depth
+    value = json.loads(iter(document))
+    for _ in range(depth - 1):
+        value, = value
+    assert value == []
+
+
+@pytest.mark.parametrize('source', [
+    lambda data: data, bytearray, io.BytesIO,
+    lambda data: open_source(io.BytesIO(data), chunk_size=3),
+])
+def test_bytes_are_decoded_as_utf8(source):
+    data = '{"caf\u00e9": [1, "\u20ac"]}'.encode('utf-8')
+    assert json.loads(source(data)) == {'caf\u00e9': [1, '\u20ac']}
+    assert list(json.items(source(data), 'caf\u00e9.item')) == [1, '\u20ac']
+
+
+def test_value_composes_with_other_parsers():
+    lines = json.value.zero_or_more_end_by(string('\n')) & eof
+    assert lines.parse('{"a": 1}\n[2]\n') == [{'a': 1}, [2]]
+
+
+def test_failure_before_value_doesnt_consume():
+    parser = json.value | string('x')
+    assert parser.parse('x') == 'x'
+
+
+def test_events_follow_document_structure():
+    assert list(json.events('{"a": [1, "x", null], "b": {}}')) == [
+        ('start_map', None),
+        ('map_key', 'a'),
+        ('start_array', None),
+        ('number', 1),
+        ('string', 'x'),
+        ('null', None),
+        ('end_array', None),
+        ('map_key', 'b'),
+        ('start_map', None),
+        ('end_map', None),
+        ('end_map', None),
+    ]
+
+
+def test_events_read_file_objects_in_chunks():
+    source = io.StringIO('[1, 2]\n')
+    assert [value for _, value in json.events(source)] == [
+        None, 1, 2, None
+    ]
+
+
+@pytest.mark.parametrize('document', ['[1,', '[1] 2', '{"a"}'])
+def test_events_raise_on_invalid_documents(document):
+    with pytest.raises(ParseError):
+        list(json.events(document))
+
+
+@pytest.mark.parametrize(['prefix', 'expected'], [
+    ('', [{'rows': [{'a': 1, 'b': [2]}, {'a': 3, 'b': []}]}]),
+    ('rows', [[{'a': 1, 'b': [2]}, {'a': 3, 'b': []}]]),
+    ('rows.item', [{'a': 1, 'b': [2]}, {'a': 3, 'b': []}]),
+    ('rows.item.a', [1, 3]),
+    ('rows.item.b.item', [2]),
+    ('missing', []),
+])
+def test_items_yields_values_at_prefix(prefix, expected):
+    document = '{"rows": [{"a": 1, "b": [2]}, {"a": 3, "b": []}]}'
+    assert list(json.items(iter(document), prefix)) == expected
+
+
+def test_items_reads_records_from_a_character_stream():
+    def chunks():
+        yield '['
+        for index in range(1000):
+            yield '{"id": %d, "tags": ["a", "b"]},' % index
+        yield '{"id": -1, "tags": []}]'
+
+    source = itertools.chain.from_iterable(chunks())
+    ids = [record['id'] for record in json.items(source, 'item')]
+    assert ids == list(range(1000)) + [-1]
@@ -0,0 +1,72 @@
+import pytest
+
+from persimmon import trivia, string, integer, eof
+from persimmon.utils import (
+    StaticRewindIterator, StreamRewindIterator, LinePosition, Trivia
+)
+
+
+ws = trivia(line_comment='#', block_comment=('/*', '*/'))
+number = integer.lexeme(ws)
+plus = string('+').lexeme(ws).noisy
+expr = ws & number & (plus & number).zero_or_more & eof
+
+
+def sources(*data):
+    return pytest.mark.parametrize(
+        'source',
+        list(data) + [iter(d) for d in data]
+    )
+
+
+@sources('1+2', ' 1 + 2 ', '1 # one\n+ 2', '/* a */ 1 /* b ** */+2 #')
+def test_lexemes_skip_trailing_trivia(source):
+    assert expr.parse(source) == [1, [2]]
+
+
+@sources('1 /* unterminated + 2')
+def test_unterminated_block_comment_is_not_skipped(source):
+    assert not expr.matches(source)
+
+
+@sources('1 / 2')
+def test_partial_comment_opener_is_not_skipped(source):
+    assert not expr.matches(source)
+
+
+def test_trivia_parser_is_noisy():
+    assert (ws & string('a') & ws).parse('  a  ') == 'a'
+
+
+def test_trivia_parser_succeeds_on_nothing():
+    assert ws.parse('') == []
+
+
+@pytest.mark.parametrize('cls', [StaticRewindIterator, StreamRewindIterator])
+def test_skipping_trivia_tracks_lines(cls):
+    iterator = cls(' # c\n  b', LinePosition())
+    assert iterator.skip_trivia(Trivia(line_comment='#'))
+    assert iterator.position.value == (2, 2)
+    assert next(iterator) == 'b'
+
+
+@pytest.mark.parametrize('source', [
+    b' 1 # one\n+ /* two */ 2 ', iter(b' 1 # one\n+ /* two */ 2 '),
+])
+def test_lexemes_skip_trivia_in_bytes(source):
+    byte_plus = string(b'+').lexeme(ws).noisy
+    grammar = ws & number & (byte_plus & number).zero_or_more & eof
+    assert grammar.parse(source) == [1, [2]]
+
+
+@sources('<!-- x --->a', '<!-- -- --->a', '<!-- --- -->a')
+def test_block_comment_closer_after_false_start(source):
+    html = trivia(whitespace='', block_comment=('<!--', '-->'))
+    assert (html & string('a') & eof).parse(source) == 'a'
+
+
+@pytest.mark.parametrize('source', [b' 1 \xa7 c\n', iter(b' 1 \xa7 c\n')])
+def test_trivia_outside_latin1_is_ignored_in_bytes(source):
+    wide = trivia(whitespace=' 　', line_comment='\xa7',
+                  block_comment=('「', '」'))
+    assert (wide & integer & wide & eof).parse(source) == 1
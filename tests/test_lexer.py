@@ -0,0 +1,68 @@
+import pytest
+
+from persimmon import kind, eof
+from persimmon.lexer import Lexer, Token, literal, char_class
+from persimmon.result import ParseError
+
+
+lexer = Lexer([
+    ('let', literal('let')),
+    ('name', '[a-z]+'),
+    ('number', '[0-9]+'),
+    ('eq', literal('=')),
+    ('ws', char_class(' \n')),
+    ('comment', '#(.*)'),
+], skip=['ws', 'comment'])
+
+
+def test_tokenize_emits_kinds_and_slices():
+    assert lexer.tokenize('let x = 12') == [
+        Token('let', 'let', 0, 3),
+        Token('name', 'x', 4, 5),
+        Token('eq', '=', 6, 7),
+        Token('number', '12', 8, 10),
+    ]
+
+
+def test_earlier_rules_take_priority():
+    assert [t.kind for t in lexer.tokenize('let lettuce')] == ['let', 'name']
+
+
+def test_longest_match_wins():
+    arrows = Lexer([('minus', literal('-')), ('arrow', literal('->'))])
+    assert [t.kind for t in arrows.tokenize('-->')] == ['minus', 'arrow']
+
+
+def test_skipped_kinds_are_dropped():
+    assert lexer.tokenize('  # just a comment\n') == []
+
+
+def test_rules_can_contain_groups():
+    assert [t.kind for t in lexer.tokenize('#(x)\nx')] == ['name']
+
+
+def test_unmatched_input_raises():
+    with pytest.raises(ParseError):
+        lexer.tokenize('let x = ?')
+
+
+def test_empty_patterns_are_rejected():
+    with pytest.raises(ValueError):
+        Lexer([('empty', 'a*')])
+
+
+def test_parsers_run_over_tokens():
+    value = kind('number').map(lambda token: int(token.text))
+    binding = (
+        kind('let').noisy
+        & kind('name').map(lambda token: token.text)
+        & kind('eq').noisy
+        & value
+    )
+    parser = binding.zero_or_more & eof
+    tokens = lexer.tokenize('let x = 1\nlet y = 2')
+    assert parser.parse(tokens) == ['x', 1, 'y', 2]
+
+
+def test_kind_parser_rejects_other_kinds():
+    assert not kind('number').matches(lexer.tokenize('x'))
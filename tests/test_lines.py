@@ -0,0 +1,79 @@
+import io
+
+import pytest
+
+from persimmon import eof, integer, none_of, string
+from persimmon.result import ParseError
+from persimmon.source import FileSource
+
+
+_cell = none_of(',').zero_or_more.map(''.join)
+_row = _cell.zero_or_more_sep_by(string(',')) & eof
+_number = integer & eof
+
+
+def test_lines_are_parsed_separately():
+    assert list(_row.parse_lines('a,b\n\nc\n')) == [['a', 'b'], [''], ['c']]
+
+
+def test_last_line_without_newline():
+    assert list(_number.parse_lines('1\n2')) == [1, 2]
+
+
+def test_error_reports_global_line_number():
+    with pytest.raises(ParseError) as error:
+        list(_number.parse_lines('1\n2\n3x\n4\n'))
+    assert str(error.value) == (
+        'Unexpected "x" at line 3, column 1\nExpecting end of file'
+    )
+
+
+def test_errors_can_be_skipped():
+    assert list(_number.parse_lines('1\nx\n3\n', errors='skip')) == [1, 3]
+
+
+def test_errors_can_be_collected():
+    results = list(_number.parse_lines('1\nx\n3\n', errors='collect'))
+    assert results[0] == 1 and results[2] == 3
+    assert str(results[1]).startswith('Unexpected "x" at line 2, column 0')
+
+
+def test_unknown_error_mode_is_rejected():
+    with pytest.raises(ValueError):
+        _number.parse_lines('1', errors='ignore')
+
+
+def test_lines_are_parsed_lazily():
+    results = _number.parse_lines('1\nx\n', errors='raise')
+    assert next(results) == 1
+
+
+def test_file_lines_span_chunks():
+    data = ''.join('{}\n'.format(i) for i in range(1000))
+    source = FileSource(io.StringIO(data), chunk_size=7)
+    assert list(_number.parse_lines(source)) == list(range(1000))
+    assert list(_number.parse_lines(io.StringIO(data))) == list(range(1000))
+
+
+def test_byte_lines():
+    grammar = none_of(b',').zero_or_more.map(bytes)
+    assert list(grammar.parse_lines(b'ab\ncd\n')) == [b'ab', b'cd']
+    assert list(grammar.parse_lines(io.BytesIO(b'ab\ncd'))) == [b'ab', b'cd']
+
+
+def test_iterable_of_lines():
+    assert list(_number.parse_lines(iter(['1\n', '2\n', '3']))) == [1, 2, 3]
+
+
+@pytest.mark.parametrize('data', [
+    '1\r\n2\r\n', b'1\r\n2\r\n', io.BytesIO(b'1\r\n2'),
+    iter(['1\r\n', '2\r\n']),
+])
+def test_windows_line_endings(data):
+    assert list(_number.parse_lines(data)) == [1, 2]
+
+
+def test_windows_line_endings_span_chunks():
+    data = ''.join('{}\r\n'.format(i) for i in range(100))
+    source = FileSource(io.StringIO(data, newline=''), chunk_size=3)
+    assert list(_number.parse_lines(source)) == list(range(100))
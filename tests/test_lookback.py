@@ -0,0 +1,66 @@
+import itertools
+
+import pytest
+
+from persimmon import eof, integer, string
+from persimmon.result import LookbackExceeded
+from persimmon.single import AttemptParser
+from persimmon.utils import StreamRewindIterator
+
+
+_record = integer & string(';').noisy
+_records = _record.zero_or_more & eof
+
+
+def _stream(count):
+    return (c for i in range(count) for c in '{};'.format(i))
+
+
+def test_lookback_within_limit_parses():
+    grammar = (string('ab') & string('c')).attempt | string('abd')
+    assert grammar.parse(iter('abd'), max_lookback=4) == 'abd'
+
+
+def test_lookback_not_needed_without_rewind_points():
+    assert _records.parse(_stream(1000), max_lookback=10) == list(range(1000))
+
+
+def test_lookback_exceeded_names_parser():
+    grammar = _records.attempt.labeled('records') | string('x')
+    with pytest.raises(LookbackExceeded) as error:
+        grammar.parse(_stream(1000), max_lookback=100)
+    assert isinstance(error.value.parser, AttemptParser)
+    assert error.value.position.value == 0
+    assert str(error.value) == (
+        'Kept more than 100 elements for rewinding to offset 0 (0), '
+        'held by AttemptParser in records'
+    )
+
+
+def test_lookback_exceeded_gives_offset_of_point():
+    grammar = string('x').noisy & _records.attempt
+    with pytest.raises(LookbackExceeded) as error:
+        grammar.parse(itertools.chain('x', _stream(1000)), max_lookback=100)
+    assert 'rewinding to offset 1 (1)' in str(error.value)
+
+
+def test_lookback_exceeded_with_iterator_option():
+    iterator = StreamRewindIterator(_stream(1000), max_lookback=50)
+    with pytest.raises(LookbackExceeded):
+        _records.attempt.do_parse(iterator)
+
+
+def test_lookback_bounded_by_commit():
+    # The outer attempt holds on to the whole stream unless records commit.
+    grammar = (_record.attempt.zero_or_more & eof).attempt
+    iterator = StreamRewindIterator(_stream(100), max_lookback=10)
+    with pytest.raises(LookbackExceeded):
+        grammar.do_parse(iterator)
+    grammar = (_record.commit.zero_or_more & eof).attempt
+    iterator = StreamRewindIterator(_stream(1000), max_lookback=10)
+    assert grammar.do_parse(iterator).is_success
+
+
+def test_lookback_ignored_for_static_data():
+    grammar = _records.attempt
+    assert grammar.parse('1;2;3;', max_lookback=1) == [1, 2, 3]
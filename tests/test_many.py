@@ -0,0 +1,61 @@
+import array
+
+from persimmon import eof, integer, one_of, string
+from persimmon.result import ParseError
+
+
+_pair = (integer & string(',').noisy & integer & eof).map(lambda a, b: a + b)
+
+
+def test_parse_many_returns_values_in_order():
+    assert _pair.parse_many(['1,2', '3,4', '10,20']) == [3, 7, 30]
+
+
+def test_parse_many_returns_errors_in_place():
+    results = _pair.parse_many(['1,2', '1,x', '3,4'])
+    assert results[0] == 3 and results[2] == 7
+    assert isinstance(results[1], ParseError)
+    assert str(results[1]) == 'Unexpected "x" at 2\nExpecting integer'
+
+
+def test_errors_dont_leak_into_later_inputs():
+    results = _pair.parse_many(['1,2345x', '1,x'])
+    assert str(results[1]) == 'Unexpected "x" at 2\nExpecting integer'
+
+
+def _inputs():
+    return ['ab', 'ba', ['a', 'b'], iter('ba'), iter('c'), 'c', 'aa',
+            memoryview(b'ab'), b'ab', bytearray(b'bc'), b'']
+
+
+def _grammar():
+    # Matches both characters and byte values.
+    return one_of(['a', 'b', ord('a'), ord('b')]).one_or_more
+
+
+def test_parse_many_matches_parse_for_every_kind_of_input():
+    expected = []
+    for data in _inputs():
+        try:
+            expected.append(_grammar().parse(data))
+        except ParseError as error:
+            expected.append(str(error))
+    actual = [str(r) if isinstance(r, ParseError) else r
+              for r in _grammar().parse_many(_inputs())]
+    assert actual == expected
+
+
+def test_parse_many_iter_is_lazy():
+    def inputs():
+        yield '1,2'
+        raise AssertionError('read too far')
+
+    assert next(_pair.parse_many_iter(inputs())) == 3
+
+
+def test_parse_many_with_arrays():
+    grammar = string([1, 2]) & eof
+    inputs = [array.array('b', [1, 2]), array.array('b', [2, 1])]
+    results = grammar.parse_many(inputs)
+    assert results[0] == [1, 2]
+    assert isinstance(results[1], ParseError)
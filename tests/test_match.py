@@ -0,0 +1,69 @@
+import pytest
+
+from persimmon import digit, string, eof, success, delayed
+from persimmon.primitive import RawSequenceParser
+from persimmon.result import ParseError
+from persimmon.standard import StandardParserFactory
+
+
+def _raise(*_):
+    raise AssertionError('map function called while matching')
+
+
+@pytest.mark.parametrize(['parser', 'data'], [
+    (digit, '1'),
+    (string('abc'), 'abc'),
+    (digit.one_or_more & eof, '123'),
+    (string('ab') | string('cd'), 'cd'),
+    (success(1), ''),
+])
+def test_matches_accepts_what_parse_accepts(parser, data):
+    parser.parse(data)
+    assert parser.matches(data)
+
+
+@pytest.mark.parametrize(['parser', 'data'], [
+    (digit, 'a'),
+    (digit, ''),
+    (string('abc'), 'abd'),
+    (digit.one_or_more & eof, '12a'),
+    (string('ab') | string('cd'), 'ce'),
+])
+def test_matches_rejects_what_parse_rejects(parser, data):
+    assert not parser.matches(data)
+
+
+def test_validate_returns_none_on_success():
+    assert (digit.zero_or_more & eof).validate('123') is None
+
+
+def test_validate_returns_failure_position():
+    position = (digit.zero_or_more & eof).validate('12a')
+    assert position.value == 2
+
+
+def test_matching_doesnt_call_map_functions():
+    parser = digit.one_or_more.map(_raise) & eof
+    assert parser.matches('123')
+
+
+def test_matching_respects_repeat_bounds():
+    parser = digit.repeat_between(2, 3) & eof
+    assert not parser.matches('1')
+    assert parser.matches('12')
+    assert not parser.matches('1234')
+
+
+def test_matching_works_through_delayed_parsers():
+    parens = delayed(
+        lambda self: (string('(') & self & string(')')) | success(None)
+    )
+    assert (parens & eof).matches('((()))')
+    assert not (parens & eof).matches('(()')
+
+
+def test_raw_sequence_fails_cleanly_at_end_of_input():
+    raw = RawSequenceParser(StandardParserFactory(), 'ab')
+    assert not raw.matches('a')
+    with pytest.raises(ParseError):
+        raw.parse('a')
@@ -0,0 +1,99 @@
+import decimal as std_decimal
+import io
+import re
+
+import pytest
+
+from persimmon import (
+    integer, decimal, float_literal, hex_integer, string, eof
+)
+from persimmon.standard import StandardParserFactory
+
+
+@pytest.mark.parametrize(['data', 'expected'], [
+    ('0', 0),
+    ('123', 123),
+    ('-42', -42),
+    ('+7', 7),
+    ('1_000_000', 1000000),
+])
+def test_integer_parses_whole_token(data, expected):
+    assert (integer & eof).parse(data) == expected
+
+
+@pytest.mark.parametrize(['data', 'expected'], [
+    ('1', std_decimal.Decimal('1')),
+    ('-1.25', std_decimal.Decimal('-1.25')),
+    ('1_000.5', std_decimal.Decimal('1000.5')),
+])
+def test_decimal_parses_exact_values(data, expected):
+    assert (decimal & eof).parse(data) == expected
+
+
+@pytest.mark.parametrize(['data', 'expected'], [
+    ('1', 1.0),
+    ('1.5', 1.5),
+    ('.5', 0.5),
+    ('-2.5e3', -2500.0),
+    ('1E-2', 0.01),
+    ('1_0.0_1', 10.01),
+])
+def test_float_literal_parses_exponents(data, expected):
+    assert (float_literal & eof).parse(data) == expected
+
+
+@pytest.mark.parametrize(['data', 'expected'], [
+    ('0x1f', 31),
+    ('-0XFF', -255),
+    ('0xdead_beef', 0xdeadbeef),
+])
+def test_hex_integer_parses_hex_digits(data, expected):
+    assert (hex_integer & eof).parse(data) == expected
+
+
+@pytest.mark.parametrize('data', ['', '-', 'a1', '_1'])
+def test_integer_rejects_non_numbers(data):
+    assert not integer.matches(data)
+
+
+def test_integer_failure_doesnt_consume():
+    parser = integer | string('x1')
+    assert parser.parse('x1') == 'x1'
+
+
+def test_number_stops_at_end_of_token():
+    parser = float_literal & string('e').noisy & eof
+    assert parser.parse('1.5e') == 1.5
+
+
+@pytest.mark.parametrize('source', ['12,-3.5e1', iter('12,-3.5e1')])
+def test_numbers_parse_from_static_and_stream_input(source):
+    parser = integer & string(',').noisy & float_literal & eof
+    assert parser.parse(source) == [12, -35.0]
+
+
+@pytest.mark.parametrize(['parser', 'data', 'expected'], [
+    (integer, '-123', -123),
+    (decimal, '1_000.5', std_decimal.Decimal('1000.5')),
+    (float_literal, '-2.5e3', -2500.0),
+    (hex_integer, '0xdead_beef', 0xdeadbeef),
+])
+@pytest.mark.parametrize('source', [
+    bytes, bytearray, lambda data: iter(bytes(data)),
+    lambda data: io.BytesIO(bytes(data)),
+])
+def test_numbers_parse_from_bytes(parser, data, expected, source):
+    assert (parser & eof).parse(source(data.encode())) == expected
+
+
+def test_number_lines_parse_from_bytes():
+    assert list((integer & eof).parse_lines(b'1\n2\n')) == [1, 2]
+
+
+def test_tokens_outside_latin1_match_bytes_by_element():
+    factory = StandardParserFactory()
+    yen = factory.make_token_parser(
+        re.compile('[0-9]+[\xa5円]'), '0123456789\xa5円', str, 'yen'
+    )
+    assert yen.parse(b'12\xa5') == '12\xa5'
+    assert not yen.matches(b'12')
@@ -83,3 +83,21 @@ def test_basic_pos_repr_is_index(index):
 def test_line_pos_repr_is_line_and_column(line, col, expected):
     pos = LinePosition(line, col)
     assert repr(pos) == expected
+
+
+@parametrize_basic_position()
+def test_basic_pos_shift_all_increases_by_length(index):
+    pos = BasicPosition(index)
+    assert pos.shift_all('abc').value == index + 3
+
+
+@pytest.mark.parametrize(['values', 'expected'], [
+    ('', (1, 0)),
+    ('abc', (1, 3)),
+    ('a\nbc', (2, 2)),
+    ('a\n\n', (3, 0)),
+    (['a', '\n', 'b'], (2, 1)),
+])
+def test_line_pos_shift_all_matches_repeated_shift(values, expected):
+    pos = LinePosition()
+    assert pos.shift_all(values).value == expected
@@ -1,11 +1,17 @@
+import array
+
 import pytest
 
 from persimmon.utils import (
     RewindIterator,
     StaticRewindIterator,
     StreamRewindIterator,
+    StringRewindIterator,
+    BytesRewindIterator,
+    ArrayRewindIterator,
     BasicPosition,
-    LinePosition
+    LinePosition,
+    END
 )
 
 
@@ -152,4 +158,87 @@ def test_make_rewind_iterator_makes_static_from_string():
 
 def test_make_rewind_iterator_raises_on_anything_else():
     with pytest.raises(Exception):
-        RewindIterator.make_rewind_iterator(None)
\ No newline at end of file
+        RewindIterator.make_rewind_iterator(None)
+
+
+@pytest.mark.parametrize(['data', 'cls'], [
+    ('test data', StringRewindIterator),
+    (b'test data', BytesRewindIterator),
+    (bytearray(b'test data'), BytesRewindIterator),
+    (memoryview(b'test data'), BytesRewindIterator),
+    (array.array('i', [1, 2, 3]), ArrayRewindIterator),
+    ([1, 2, 3], StaticRewindIterator),
+])
+def test_make_rewind_iterator_specializes_static_data(data, cls):
+    rewinder = RewindIterator.make_rewind_iterator(data)
+    assert type(rewinder) is cls
+
+
+@pytest.mark.parametrize(['data', 'seq'], [
+    ('abcd', 'abc'),
+    (iter('abcd'), 'abc'),
+    (b'abcd', b'abc'),
+    (memoryview(b'abcd'), b'abc'),
+    (array.array('b', [1, 2, 3, 4]), [1, 2, 3]),
+    ([1, 2, 3, 4], [1, 2, 3]),
+])
+def test_match_sequence_advances_past_match(data, seq):
+    rewinder = RewindIterator.make_rewind_iterator(data)
+    assert rewinder.match_sequence(seq)
+    assert rewinder.position.value == 3
+    assert len(list(rewinder)) == 1
+
+
+@pytest.mark.parametrize(['data', 'seq'], [
+    ('abd', 'abc'),
+    ('ab', 'abc'),
+    (iter('abd'), 'abc'),
+    (b'abd', b'abc'),
+    (array.array('b', [1, 2]), [1, 2, 3]),
+    ([1, 2, 4], [1, 2, 3]),
+])
+def test_match_sequence_doesnt_advance_on_mismatch(data, seq):
+    rewinder = RewindIterator.make_rewind_iterator(data)
+    assert not rewinder.match_sequence(seq)
+    assert rewinder.position.value == 0
+    assert next(rewinder) == next(iter(seq))
+
+
+def test_string_rewinder_tracks_lines_over_literals():
+    rewinder = StringRewindIterator('a\nbc', LinePosition())
+    assert rewinder.match_sequence('a\nb')
+    assert rewinder.position.value == (2, 1)
+
+
+def test_peek_doesnt_advance(rewinder):
+    assert rewinder.peek() == 1
+    assert rewinder.peek() == 1
+    assert rewinder.position.value == 0
+    assert list(rewinder) == _expected
+
+
+def test_advance_moves_past_peeked_element(rewinder):
+    rewinder.peek()
+    rewinder.advance()
+    assert rewinder.position.value == 1
+    assert list(rewinder) == _expected[1:]
+
+
+def test_peek_returns_end_at_end_of_input(rewinder):
+    list(rewinder)
+    assert rewinder.peek() is END
+
+
+@pytest.mark.parametrize('data', ['', b'', [], iter([])])
+def test_peek_returns_end_on_empty_input(data):
+    rewinder = RewindIterator.make_rewind_iterator(data)
+    assert rewinder.peek() is END
+
+
+def test_peeked_stream_element_survives_rewind():
+    rewinder = StreamRewindIterator(iter('ab'))
+    assert rewinder.peek() == 'a'
+    with rewinder.rewind_point() as point:
+        assert next(rewinder) == 'a'
+        rewinder.rewind_to(point)
+    assert list(rewinder) == ['a', 'b']
@@ -0,0 +1,14 @@
+import pytest
+
+from benchmarks.grammars import GRAMMARS
+from benchmarks.suite import check_scaling
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('grammar', GRAMMARS, ids=lambda g: g.name)
+def test_streamed_parse_time_grows_linearly(grammar):
+    linear, ratio = check_scaling(
+        grammar.parser, grammar.generate, 'stream', 2048, 32768
+    )
+    message = 'parsing 16x the input took {:.1f}x as long per char'
+    assert linear, message.format(ratio)
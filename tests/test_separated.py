@@ -0,0 +1,70 @@
+import pytest
+
+from persimmon import digit, string, none_of, eof
+
+
+comma = string(',')
+
+
+@pytest.mark.parametrize(['data', 'expected'], [
+    ('', []),
+    ('1', [1]),
+    ('1,2,3', [1, 2, 3]),
+])
+def test_zero_or_more_sep_by_collects_items(data, expected):
+    parser = digit.zero_or_more_sep_by(comma) & eof
+    assert parser.parse(data) == expected
+
+
+def test_one_or_more_sep_by_requires_an_item():
+    parser = digit.one_or_more_sep_by(comma)
+    assert not parser.matches('')
+    assert parser.parse('4') == [4]
+
+
+def test_sep_by_rejects_trailing_separator_by_default():
+    parser = digit.zero_or_more_sep_by(comma) & eof
+    assert not parser.matches('1,2,')
+
+
+def test_sep_by_allows_trailing_separator_when_asked():
+    parser = digit.zero_or_more_sep_by(comma, trailing=True) & eof
+    assert parser.parse('1,2,') == [1, 2]
+
+
+def test_end_by_requires_separator_after_each_item():
+    parser = digit.zero_or_more_end_by(string(';')) & eof
+    assert parser.parse('1;2;') == [1, 2]
+    assert not parser.matches('1;2')
+
+
+def test_one_or_more_end_by_requires_an_item():
+    parser = digit.one_or_more_end_by(string(';'))
+    assert not parser.matches('')
+
+
+@pytest.mark.parametrize(['data', 'expected'], [
+    ('[]', []),
+    ('[1]', [1]),
+    ('[1,2,3]', [1, 2, 3]),
+    ('[1,2,]', [1, 2]),
+])
+def test_delimited_parses_bracketed_lists(data, expected):
+    parser = digit.delimited(string('['), comma, string(']'), trailing=True)
+    assert parser.parse(data) == expected
+
+
+def test_delimited_fails_without_closing_delimiter():
+    parser = digit.delimited(string('['), comma, string(']'))
+    assert not parser.matches('[1,2')
+
+
+def test_csv_sample_from_readme():
+    elem = none_of(',\n').zero_or_more.map(''.join)
+    line = elem.zero_or_more_sep_by(comma)
+    csv = (line & string('\n').noisy).zero_or_more & eof
+    assert csv.parse('a,b,c\n\n,hello world,\n') == [
+        ['a', 'b', 'c'],
+        [''],
+        ['', 'hello world', ''],
+    ]
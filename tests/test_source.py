@@ -0,0 +1,90 @@
+import bz2
+import gzip
+import io
+import lzma
+
+import pytest
+
+from persimmon import eof, none_of, string
+from persimmon.source import FileSource, open_source
+
+
+_line = none_of('\n').zero_or_more.map(''.join)
+_lines = (_line & string('\n').noisy).zero_or_more & eof
+_text = 'héllo\nwörld\n' * 100
+_expected = ['héllo', 'wörld'] * 100
+
+
+def test_text_file_parses_characters():
+    assert _lines.parse(io.StringIO(_text)) == _expected
+
+
+def test_binary_file_parses_byte_values():
+    grammar = string(b'ab') & eof
+    assert grammar.parse(io.BytesIO(b'ab')) == b'ab'
+
+
+def test_decoding_keeps_characters_split_across_chunks():
+    source = FileSource(io.BytesIO(_text.encode('utf-8')), 'utf-8',
+                        chunk_size=3)
+    assert _lines.parse(source) == _expected
+
+
+def test_decoding_errors_are_reported():
+    source = FileSource(io.BytesIO(b'\xff\n'), 'utf-8')
+    with pytest.raises(UnicodeDecodeError):
+        _lines.parse(source)
+    source = FileSource(io.BytesIO(b'\xff\n'), 'utf-8', errors='replace')
+    assert _lines.parse(source) == ['�']
+
+
+@pytest.mark.parametrize('module', [gzip, bz2, lzma])
+def test_compressed_path_is_detected(tmp_path, module):
+    path = tmp_path / 'data'
+    path.write_bytes(module.compress(_text.encode('utf-8')))
+    with open_source(path, 'utf-8') as source:
+        assert _lines.parse(source) == _expected
+
+
+@pytest.mark.parametrize('module', [gzip, bz2, lzma])
+def test_compressed_file_object_is_detected(module):
+    file = io.BytesIO(module.compress(_text.encode('utf-8')))
+    with open_source(file, 'utf-8', chunk_size=5) as source:
+        assert _lines.parse(source) == _expected
+    assert not file.closed
+
+
+def test_uncompressed_path(tmp_path):
+    path = tmp_path / 'data'
+    path.write_bytes(_text.encode('utf-8'))
+    with open_source(str(path), 'utf-8') as source:
+        assert _lines.parse(source) == _expected
+
+
+def test_explicit_compression():
+    data = gzip.compress(b'ab')
+    with open_source(io.BytesIO(data), compression='gzip') as source:
+        assert (string(b'ab') & eof).parse(source) == b'ab'
+    with open_source(io.BytesIO(data), compression=None) as source:
+        assert next(source.chunks()) == data
+
+
+def test_unknown_compression_is_rejected():
+    with pytest.raises(ValueError):
+        open_source(io.BytesIO(b''), compression='zip')
+
+
+def test_tracked_offsets_can_be_resumed_from():
+    file = io.BytesIO(b'abcdefgh')
+    source = FileSource(file, chunk_size=3)
+    source.track_offsets()
+    assert b''.join(source.chunks()) == b'abcdefgh'
+    resume = source.resume_at(4)
+    resumed = FileSource(file, chunk_size=3)
+    resumed.track_offsets(4, resume)
+    assert b''.join(resumed.chunks()) == b'efgh'
+
+
+def test_decoded_files_cant_be_tracked():
+    with pytest.raises(ValueError):
+        FileSource(io.BytesIO(b''), 'utf-8').track_offsets()
@@ -0,0 +1,82 @@
+import threading
+import time
+
+import pytest
+
+from persimmon import delayed, integer, string
+from persimmon.result import LookbackExceeded, ParseError
+from persimmon.standard import StandardParserFactory
+
+
+_list = delayed(lambda self: (
+    string('[').noisy & self.zero_or_more_sep_by(string(',')) &
+    string(']').noisy
+) | integer)
+
+
+def test_parse_concurrent_keeps_input_order():
+    inputs = ['[{}]'.format(','.join(['[1,[2]]'] * i)) for i in range(50)]
+    expected = [_list.parse(data) for data in inputs]
+    assert _list.parse_concurrent(inputs, threads=8) == expected
+
+
+def test_parse_concurrent_raises_parse_errors():
+    with pytest.raises(ParseError):
+        _list.parse_concurrent(['[1]', '[x]', '[2]'], threads=2)
+
+
+def test_parse_concurrent_passes_max_lookback():
+    grammar = (_list & string(';').noisy).zero_or_more.attempt
+    inputs = [iter('[1];' * 100), iter('[2];')]
+    with pytest.raises(LookbackExceeded):
+        grammar.parse_concurrent(inputs, threads=2, max_lookback=10)
+
+
+def test_delayed_parser_is_built_once():
+    calls = []
+
+    def build(self):
+        calls.append(self)
+        # Give other threads time to race for the first parse.
+        time.sleep(0.01)
+        return string('a').noisy & self.zero_or_more | integer
+
+    grammar = delayed(build)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def run():
+        barrier.wait()
+        results.append(grammar.parse('aa1'))
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == [[[1]]] * 8
+
+
+def test_interning_shares_parsers_across_threads():
+    factory = StandardParserFactory(intern=True)
+    built = []
+    barrier = threading.Barrier(8)
+
+    def run():
+        barrier.wait()
+        built.append(factory.make_literal_parser('abc').zero_or_more)
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(parser is built[0] for parser in built)
+
+
+def test_changing_list_after_building_choice_has_no_effect():
+    alternatives = [string('a'), string('b')]
+    grammar = StandardParserFactory().make_choice_parser(alternatives)
+    alternatives.append(string('c'))
+    assert not grammar.matches('c')